@@ -1,4 +1,6 @@
 # main.py
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -7,11 +9,16 @@ from routers.tp1 import inciso_1 as tp1_inciso_1
 from routers.tp1 import inciso_2 as tp1_inciso_2
 from routers.tp1 import inciso_3 as tp1_inciso_3
 from routers.tp1 import inciso_4 as tp1_inciso_4
+from routers.tp1 import filtros as tp1_filtros
+from routers.tp1 import espectrograma as tp1_espectrograma
+from routers.tp1 import subidas as tp1_subidas
+from routers.tp1 import monitoreo as tp1_monitoreo
 
 # Routers TP2
 from routers.tp2 import inciso_1 as tp2_inciso_1
 from routers.tp2 import inciso_2 as tp2_inciso_2
 from routers.tp2 import inciso_3 as tp2_inciso_3
+from routers.tp2 import estego as tp2_estego
 
 # Router TP3
 from routers.tp3 import gases, raices
@@ -20,6 +27,7 @@ from routers.tp3 import gases, raices
 from routers.tp4 import inciso_1 as tp4_inciso_1
 from routers.tp4 import inciso_2 as tp4_inciso_2 
 from routers.tp4 import inciso_3 as tp4_inciso_3 
+from routers.tp4 import ingesta as tp4_ingesta
 
 # Routers TP5
 from routers.tp5 import inciso_1 as tp5_inciso_1
@@ -28,6 +36,12 @@ from routers.tp5 import inciso_2 as tp5_inciso_2
 # Routers TP6
 from routers.tp6 import incisos as tp6_inciso_1
 
+# Estado / readiness
+from routers.common import estado, errores
+
+from services.common import ejecutor, precalculo
+from services.tp4 import core as tp4_core
+
 # CORS
 origins = [
     "http://localhost:3000",
@@ -37,7 +51,21 @@ origins = [
     "https://www.sd-4140038-h00002.ferozo.net",
 ]
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Precalcula en segundo plano los datos pesados (TP1, TP4, TP5, TP6)
+    tareas = [precalculo.iniciar()]
+    # Incorpora imágenes nuevas del TP4 sin reiniciar
+    if tp4_core.TP4_POLL_SEGUNDOS > 0:
+        tareas.append(asyncio.create_task(tp4_core.processor.vigilar(tp4_core.TP4_POLL_SEGUNDOS)))
+    yield
+    tareas = [t for t in tareas if t is not None and not t.done()]
+    for tarea in tareas:
+        tarea.cancel()
+    await asyncio.gather(*tareas, return_exceptions=True)
+    ejecutor.apagar()
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -47,17 +75,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Errores del ejecutor de trabajos (timeout, pool interrumpido) como 504 / 500
+errores.registrar(app)
+
 # Incluir routers
 # TP1
 app.include_router(tp1_inciso_1.router, prefix="/api/tp1")
 app.include_router(tp1_inciso_2.router, prefix="/api/tp1")
 app.include_router(tp1_inciso_3.router, prefix="/api/tp1")
 app.include_router(tp1_inciso_4.router, prefix="/api/tp1")
+app.include_router(tp1_filtros.router, prefix="/api/tp1")
+app.include_router(tp1_espectrograma.router, prefix="/api/tp1")
+app.include_router(tp1_subidas.router, prefix="/api/tp1")
+app.include_router(tp1_monitoreo.router, prefix="/api/tp1")
 
 # TP2
 app.include_router(tp2_inciso_1.router, prefix="/api/tp2")
 app.include_router(tp2_inciso_2.router, prefix="/api/tp2")
 app.include_router(tp2_inciso_3.router, prefix="/api/tp2")
+app.include_router(tp2_estego.router, prefix="/api/tp2")
 
 # TP3
 app.include_router(raices.router, prefix="/api/tp3")
@@ -67,6 +103,7 @@ app.include_router(gases.router, prefix="/api/tp3")
 app.include_router(tp4_inciso_1.router, prefix="/api/tp4")
 app.include_router(tp4_inciso_2.router, prefix="/api/tp4")
 app.include_router(tp4_inciso_3.router, prefix="/api/tp4")
+app.include_router(tp4_ingesta.router, prefix="/api/tp4")
 
 # TP5
 app.include_router(tp5_inciso_1.router, prefix="/api/tp5")
@@ -74,3 +111,6 @@ app.include_router(tp5_inciso_2.router, prefix="/api/tp5")
 
 # TP6
 app.include_router(tp6_inciso_1.router, prefix="/api/tp6")
+
+# Estado
+app.include_router(estado.router, prefix="/api")
@@ -0,0 +1,17 @@
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from services.common import ejecutor
+
+
+# Errores del ejecutor de trabajos -> respuestas HTTP (los servicios no conocen HTTP)
+async def _trabajo_demorado(request: Request, exc: ejecutor.TrabajoDemorado):
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
+async def _pool_interrumpido(request: Request, exc: ejecutor.PoolInterrumpido):
+    return JSONResponse(status_code=500, content={"detail": str(exc)})
+
+
+def registrar(app):
+    app.add_exception_handler(ejecutor.TrabajoDemorado, _trabajo_demorado)
+    app.add_exception_handler(ejecutor.PoolInterrumpido, _pool_interrumpido)
@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from services.common import precalculo
+
+router = APIRouter(prefix="/estado", tags=["Estado del servidor"])
+
+@router.get("/listo", summary="Readiness: estado del precálculo de cada subsistema")
+def get_listo():
+    # 200 cuando todo está calculado; 503 mientras algo se calienta (para el balanceador)
+    codigo = 200 if precalculo.todo_listo() else 503
+    return JSONResponse(
+        status_code=codigo,
+        content={"listo": codigo == 200, "subsistemas": precalculo.estado()},
+    )
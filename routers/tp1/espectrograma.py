@@ -0,0 +1,42 @@
+# routers/tp1/espectrograma.py
+
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from services.tp1 import espectrograma, monitoreo, subidas
+from services.tp1.pipeline import CUTOFF, NUM_TAPS, SENALES, kernel_pasa_bajos, pipeline
+
+router = APIRouter(
+    prefix="/espectrograma",
+    tags=["TP1 - Espectrograma y potencia por ventanas"]
+)
+
+
+@router.get(
+    "/bandas",
+    summary="Potencia por banda en ventanas deslizantes (NDJSON, una línea por ventana)",
+    response_class=StreamingResponse,
+)
+def obtener_bandas_por_ventana(
+    senal: int = Query(1, ge=1, le=len(SENALES), description="Número de señal (1 sano, 2 interictal, 3 convulsivo)"),
+    id_subida: Optional[str] = Query(None, alias="id", description="ID de una subida (reemplaza a `senal`)"),
+    ventana: float = Query(2.0, gt=0, description="Duración de cada ventana [s]"),
+    solapamiento: float = Query(0.5, ge=0, lt=1, description="Fracción de solapamiento entre ventanas"),
+    segmento: Optional[float] = Query(None, gt=0, description="Segmento de Welch dentro de la ventana [s]"),
+    filtrada: bool = Query(False, description="Usar la señal filtrada (pasa bajos del TP)"),
+):
+    nombre = subidas.nombre_senal(senal, id_subida)
+    fs = pipeline.fs(nombre)
+    try:
+        espectrograma.validar_ventana(fs, ventana, solapamiento)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    fuente = pipeline.senal(nombre)
+    if filtrada:
+        # Filtrado por bloques (overlap-save): la señal filtrada nunca está entera en memoria
+        fuente = monitoreo.filtrar_por_bloques(espectrograma.bloques(fuente), kernel_pasa_bajos(CUTOFF, fs, NUM_TAPS))
+    return StreamingResponse(
+        espectrograma.ndjson_potencias(fuente, fs, ventana=ventana, solapamiento=solapamiento, segmento=segmento),
+        media_type="application/x-ndjson",
+    )
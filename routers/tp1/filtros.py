@@ -0,0 +1,92 @@
+# routers/tp1/filtros.py
+
+from typing import Literal, Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from services.common.datos import respuesta_datos
+from services.common.render_cache import respuesta_png
+from services.tp1 import filtros, subidas
+from services.tp1.pipeline import CUTOFF, NUM_TAPS, SENALES, pipeline
+
+router = APIRouter(
+    prefix="/filtros",
+    tags=["TP1 - Filtros EEG parametrizables"]
+)
+
+TipoFiltro = Literal[filtros.TIPOS]
+Ventana = Literal[filtros.VENTANAS]
+
+
+def _parametros(senal, id_subida, tipo, corte, bajo, alto, taps, ventana):
+    """(nombre, cortes) validados contra el fs de la señal; 400 si no cierran."""
+    nombre = subidas.nombre_senal(senal, id_subida)
+    if tipo in ("pasa_banda", "rechaza_banda"):
+        if bajo is None or alto is None:
+            raise HTTPException(status_code=400, detail=f"El filtro {tipo} necesita 'bajo' y 'alto'.")
+        cortes = (bajo, alto)
+    else:
+        cortes = (corte,)
+    try:
+        cortes = filtros.validar_parametros(tipo, cortes, taps, ventana, pipeline.fs(nombre))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return nombre, cortes
+
+
+@router.get("/datos", summary="Señal EEG filtrada con los parámetros pedidos (JSON)")
+def obtener_senal_filtrada(
+    senal: int = Query(1, ge=1, le=len(SENALES), description="Número de señal (1 sano, 2 interictal, 3 convulsivo)"),
+    id_subida: Optional[str] = Query(None, alias="id", description="ID de una subida (reemplaza a `senal`)"),
+    tipo: TipoFiltro = Query("pasa_bajos"),
+    corte: float = Query(CUTOFF, gt=0, description="Frecuencia de corte [Hz] (pasa bajos / pasa altos)"),
+    bajo: Optional[float] = Query(None, gt=0, description="Corte inferior [Hz] (filtros de banda)"),
+    alto: Optional[float] = Query(None, gt=0, description="Corte superior [Hz] (filtros de banda)"),
+    taps: int = Query(NUM_TAPS, description="Cantidad de coeficientes del FIR"),
+    ventana: Ventana = Query("hamming"),
+):
+    nombre, cortes = _parametros(senal, id_subida, tipo, corte, bajo, alto, taps, ventana)
+    fs = pipeline.fs(nombre)
+    filtrada = filtros.filtrar(pipeline.senal(nombre), tipo, cortes, taps, ventana, fs)
+    return {
+        "senal": nombre,
+        "etapa": pipeline.etapa(nombre),
+        "fs": fs,
+        "tipo": tipo,
+        "cortes": list(cortes),
+        "taps": taps,
+        "ventana": ventana,
+        "metodo": "fft" if taps >= filtros.TP1_FFT_TAPS else "directo",
+        "filtrada": filtrada.tolist(),
+    }
+
+
+@router.get("/grafico", summary="Señal original vs filtrada y respuesta en frecuencia del filtro")
+def obtener_grafico_filtro(
+    request: Request,
+    senal: int = Query(1, ge=1, le=len(SENALES)),
+    id_subida: Optional[str] = Query(None, alias="id"),
+    tipo: TipoFiltro = Query("pasa_bajos"),
+    corte: float = Query(CUTOFF, gt=0),
+    bajo: Optional[float] = Query(None, gt=0),
+    alto: Optional[float] = Query(None, gt=0),
+    taps: int = Query(NUM_TAPS),
+    ventana: Ventana = Query("hamming"),
+):
+    nombre, cortes = _parametros(senal, id_subida, tipo, corte, bajo, alto, taps, ventana)
+    imagen = filtros.generar_grafico_filtro(nombre, tipo, cortes, taps, ventana)
+    return respuesta_png(request, imagen)
+
+
+@router.get("/grafico/datos", summary="Series del gráfico del filtro (JSON o float32 según Accept)")
+def obtener_datos_grafico_filtro(
+    request: Request,
+    senal: int = Query(1, ge=1, le=len(SENALES)),
+    id_subida: Optional[str] = Query(None, alias="id"),
+    tipo: TipoFiltro = Query("pasa_bajos"),
+    corte: float = Query(CUTOFF, gt=0),
+    bajo: Optional[float] = Query(None, gt=0),
+    alto: Optional[float] = Query(None, gt=0),
+    taps: int = Query(NUM_TAPS),
+    ventana: Ventana = Query("hamming"),
+):
+    nombre, cortes = _parametros(senal, id_subida, tipo, corte, bajo, alto, taps, ventana)
+    return respuesta_datos(request, *filtros.datos_grafico_filtro(nombre, tipo, cortes, taps, ventana))
@@ -1,9 +1,11 @@
 # /roers.tp1/inciso_1.py
 
-from fastapi import APIRouter
-from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+from services.common.datos import respuesta_datos
+from services.common.render_cache import respuesta_png
 from services.tp1.inciso_1 import CONSIGNA, EXPLICACION_FRECUENCIAS, PROBLEMAS_INCISO_1, generar_grafico_comparativo
-from services.tp1.inciso_1 import generar_grafico_fft_lineas, generar_grafico_fft_tallo
+from services.tp1.inciso_1 import generar_grafico_fft_lineas, generar_grafico_fft_tallo, datos_grafico_comparativo, datos_grafico_fft
 
 router = APIRouter(
     prefix="/inciso-1",
@@ -20,19 +22,28 @@ def obtener_consigna():
 
 
 @router.get("/grafico", summary="Comparación de señales EEG crudas y filtradas")
-def obtener_grafico():
+def obtener_grafico(request: Request):
     imagen = generar_grafico_comparativo()
-    return StreamingResponse(imagen, media_type="image/png")
+    return respuesta_png(request, imagen)
+
+@router.get("/grafico/datos", summary="Series del gráfico comparativo (JSON o float32 según Accept)")
+def obtener_datos_grafico(request: Request):
+    return respuesta_datos(request, *datos_grafico_comparativo())
 
 @router.get("/grafico2", summary="Espectro FFT de señales EEG (línea continua)")
-def obtener_grafico_fft():
+def obtener_grafico_fft(request: Request):
     imagen = generar_grafico_fft_lineas()
-    return StreamingResponse(imagen, media_type="image/png")
+    return respuesta_png(request, imagen)
 
 @router.get("/grafico3", summary="Espectro FFT de señales EEG (diagrama de tallo)")
-def obtener_grafico_fft_tallo():
+def obtener_grafico_fft_tallo(request: Request):
     imagen = generar_grafico_fft_tallo()
-    return StreamingResponse(imagen, media_type="image/png")
+    return respuesta_png(request, imagen)
+
+@router.get("/grafico2/datos", summary="Espectros FFT de las señales (JSON o float32 según Accept)")
+@router.get("/grafico3/datos", summary="Espectros FFT de las señales (JSON o float32 según Accept)")
+def obtener_datos_grafico_fft(request: Request):
+    return respuesta_datos(request, *datos_grafico_fft())
 
 @router.get(
     "/explicacion",
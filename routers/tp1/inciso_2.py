@@ -1,14 +1,17 @@
 
 # routers/tp1/inciso_2.py
 # routers/tp1/inciso_2.py
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import PlainTextResponse, Response
 from services.tp1.inciso_2 import (
     CONSIGNA2, 
     EXPLICACION_INCISO_2, 
     PROBLEMAS_INCISO_2,
-    generar_grafico_zoom_img
+    generar_grafico_zoom_img,
+    datos_grafico_zoom
 )
+from services.common.datos import respuesta_datos
+from services.common.render_cache import respuesta_png
 
 router = APIRouter(
     prefix="/inciso-2",
@@ -51,9 +54,13 @@ def obtener_consigna():
     },
     response_class=Response
 )
-def obtener_grafico_zoom():
+def obtener_grafico_zoom(request: Request):
     img_buf = generar_grafico_zoom_img()
     if img_buf is None:
         raise HTTPException(status_code=500, detail="No se pudieron cargar los archivos de señales (Signal_x.txt). Verifique la ruta DATA_PATH en el servicio.")
     
-    return Response(content=img_buf.getvalue(), media_type="image/png")
\ No newline at end of file
+    return respuesta_png(request, img_buf)
+
+@router.get("/grafico-zoom/datos", summary="Series del gráfico de zoom (JSON o float32 según Accept)")
+def obtener_datos_grafico_zoom(request: Request):
+    return respuesta_datos(request, *datos_grafico_zoom())
@@ -1,12 +1,16 @@
-from fastapi import APIRouter
-from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
 from services.tp1.inciso_3 import (
     CONSIGNA3,
     generar_grafico_potencia_barras,
     generar_grafico_potencia_lineas,
+    datos_grafico_potencia,
     EXPLICACION_INCISO_3,
     PROBLEMAS_INCISO_3
 )
+from services.common.datos import respuesta_datos
+from services.common.render_cache import respuesta_png
+from services.common.precalculo import requiere_listo
 
 router = APIRouter(
     prefix="/inciso-3",
@@ -30,10 +34,15 @@ def obtener_explicacion():
 def obtener_problemas():
     return PROBLEMAS_INCISO_3
 
-@router.get("/grafico1", summary="Potencia espectral por banda (barras)")
-def grafico_barras():
-    return StreamingResponse(generar_grafico_potencia_barras(), media_type="image/png")
+@router.get("/grafico1", summary="Potencia espectral por banda (barras)", dependencies=[Depends(requiere_listo("tp1.inciso_3"))])
+def grafico_barras(request: Request):
+    return respuesta_png(request, generar_grafico_potencia_barras())
 
-@router.get("/grafico2", summary="Potencia espectral por banda (líneas)")
-def grafico_lineas():
-    return StreamingResponse(generar_grafico_potencia_lineas(), media_type="image/png")
+@router.get("/grafico2", summary="Potencia espectral por banda (líneas)", dependencies=[Depends(requiere_listo("tp1.inciso_3"))])
+def grafico_lineas(request: Request):
+    return respuesta_png(request, generar_grafico_potencia_lineas())
+
+@router.get("/grafico1/datos", summary="Potencia por banda y etapa (JSON o float32 según Accept)", dependencies=[Depends(requiere_listo("tp1.inciso_3"))])
+@router.get("/grafico2/datos", summary="Potencia por banda y etapa (JSON o float32 según Accept)", dependencies=[Depends(requiere_listo("tp1.inciso_3"))])
+def datos_potencia(request: Request):
+    return respuesta_datos(request, *datos_grafico_potencia())
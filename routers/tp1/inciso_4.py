@@ -1,18 +1,23 @@
-from fastapi import APIRouter
-from fastapi.responses import StreamingResponse, PlainTextResponse
-from matplotlib.pylab import fftfreq
-import numpy as np
+from typing import Optional
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import PlainTextResponse
 from services.tp1.inciso_4 import (
     CONSIGNA4,
     generar_grafico_autocorrelacion,
-    generar_grafico_potencias_por_banda,
+    generar_grafico_potencias_senales,
     generar_resumen_analisis_bandas,
-    cargar_senales_filtradas,
-    obtener_fs,
+    calcular_potencias_senales,
+    datos_grafico_autocorrelacion,
+    datos_grafico_potencias_senales,
     obtener_etapas,
     EXPLICACION_INCISO_4,
     PROBLEMAS_INCISO_4,
 )
+from services.common.datos import respuesta_datos
+from services.common.render_cache import respuesta_png
+from services.tp1.autocorrelacion import autocorrelacion_senales
+from services.tp1 import subidas
+from services.tp1.pipeline import SENALES, pipeline
 
 router = APIRouter(
     prefix="/inciso-4",
@@ -37,32 +42,50 @@ def obtener_problemas_inciso_4():
 
 
 @router.get("/grafico1", summary="Gráfico de autocorrelación para las tres señales EEG")
-def obtener_grafico_autocorrelacion():
+def obtener_grafico_autocorrelacion(request: Request):
     imagen = generar_grafico_autocorrelacion()
-    return StreamingResponse(imagen, media_type="image/png")
+    return respuesta_png(request, imagen)
 
 
 @router.get("/grafico2", summary="Distribución de potencia relativa por banda de frecuencia")
-def obtener_grafico_potencia_por_bandas():
-    senales = cargar_senales_filtradas()
-    fs = obtener_fs()
-    ETAPAS = obtener_etapas()  # este lo necesitás para los labels del gráfico
+def obtener_grafico_potencia_por_bandas(request: Request):
+    imagen = generar_grafico_potencias_senales()
+    return respuesta_png(request, imagen)
 
-    # Calcular potencias: lista de tuplas (frecuencia, espectro)
-    potencias = [(fftfreq(len(s), 1/fs), np.abs(np.fft.fft(s))**2) for s in senales]
 
-    imagen = generar_grafico_potencias_por_banda(potencias, ETAPAS)
-    return StreamingResponse(imagen, media_type="image/png")
+@router.get("/grafico1/datos", summary="Autocorrelación de las tres señales (JSON o float32 según Accept)")
+def obtener_datos_grafico_autocorrelacion(request: Request):
+    return respuesta_datos(request, *datos_grafico_autocorrelacion())
+
+
+@router.get("/grafico2/datos", summary="Potencia relativa por banda (JSON o float32 según Accept)")
+def obtener_datos_grafico_potencia_por_bandas(request: Request):
+    return respuesta_datos(request, *datos_grafico_potencias_senales())
 
 
 @router.get("/analisis-bandas", summary="Salida tipo consola con resumen por bandas y señales")
 def obtener_analisis_bandas():
-    senales = cargar_senales_filtradas()
-    fs = obtener_fs()
-    ETAPAS = obtener_etapas()
+    potencias = calcular_potencias_senales()
+    texto = generar_resumen_analisis_bandas(potencias, obtener_etapas())
+    return PlainTextResponse(texto)
 
-    potencias = [(fftfreq(len(s), 1/fs), np.abs(np.fft.fft(s))**2) for s in senales]
 
-    texto = generar_resumen_analisis_bandas(potencias, ETAPAS)
-    return PlainTextResponse(texto)
 
+@router.get("/autocorrelacion", summary="Autocorrelación normalizada de las señales EEG (JSON)")
+def obtener_autocorrelacion(
+    max_lag: float = Query(2.0, gt=0, description="Retardo máximo [s] (se recorta a la duración de la señal)"),
+    filtrada: bool = Query(True, description="Usar las señales filtradas (pasa bajos del TP)"),
+    id_subida: Optional[str] = Query(None, alias="id", description="ID de una subida (en lugar de las tres señales del TP)"),
+):
+    nombres = [subidas.resolver(id_subida)] if id_subida else list(SENALES)
+    fs = pipeline.fs(nombres[0])
+    senales = [pipeline.filtrada(n) if filtrada else pipeline.senal(n) for n in nombres]
+    retardos, coeficientes = autocorrelacion_senales(senales, fs, max_lag_s=max_lag)
+    return {
+        "fs": fs,
+        "retardos": retardos.tolist(),
+        "senales": [
+            {"senal": nombre, "etapa": pipeline.etapa(nombre), "coeficientes": r.tolist()}
+            for nombre, r in zip(nombres, coeficientes)
+        ],
+    }
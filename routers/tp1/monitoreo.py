@@ -0,0 +1,73 @@
+# routers/tp1/monitoreo.py
+
+import json
+import time
+import numpy as np
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
+from starlette.concurrency import run_in_threadpool
+from services.tp1.monitoreo import UMBRAL_POTENCIA_CONVULSIVO, MonitorEEG
+from services.tp1.pipeline import CUTOFF, NUM_TAPS
+from services.tp1.senales import FS
+
+router = APIRouter(
+    prefix="/monitoreo",
+    tags=["TP1 - Monitoreo EEG en tiempo real"]
+)
+
+
+def _muestras(mensaje):
+    """Bloque de muestras de un mensaje: binario float32 little-endian o JSON {"muestras": [...]}."""
+    if mensaje.get("bytes") is not None:
+        crudo = mensaje["bytes"]
+        if len(crudo) % 4:
+            raise ValueError("Un bloque binario debe ser float32 (múltiplo de 4 bytes).")
+        return np.frombuffer(crudo, dtype="<f4")
+    try:
+        datos = json.loads(mensaje.get("text") or "")
+        return np.asarray(datos["muestras"] if isinstance(datos, dict) else datos, dtype=float)
+    except (ValueError, TypeError, KeyError):
+        raise ValueError('Se esperaba float32 binario o JSON {"muestras": [...]}.')
+
+
+@router.websocket("/ws")
+async def monitoreo_ws(
+    websocket: WebSocket,
+    fs: float = Query(FS, gt=0, allow_inf_nan=False, description="Frecuencia de muestreo [Hz]"),
+    ventana: float = Query(2.0, gt=0, allow_inf_nan=False, description="Duración de la ventana [s]"),
+    solapamiento: float = 0.5,
+    cutoff: float = Query(CUTOFF, gt=0, allow_inf_nan=False),
+    taps: int = NUM_TAPS,
+    umbral_convulsivo: float = UMBRAL_POTENCIA_CONVULSIVO,
+):
+    """
+    El cliente manda bloques de muestras (float32 binario o JSON) y recibe un
+    JSON por ventana completada con las potencias por banda, la etapa
+    estimada y `latencia_ms` (llegada del bloque -> envío).
+    """
+    await websocket.accept()
+    try:
+        monitor = MonitorEEG(fs, ventana, solapamiento, cutoff, taps, umbral_convulsivo)
+    except ValueError as e:
+        await websocket.send_json({"error": str(e)})
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.send_json({"configuracion": monitor.configuracion()})
+
+    try:
+        while True:
+            mensaje = await websocket.receive()
+            if mensaje["type"] == "websocket.disconnect":
+                break
+            llegada = time.perf_counter()
+            try:
+                # Hasta TP1_MONITOREO_MAX_BLOQUE muestras y muchas FFT: fuera del event loop
+                resultados = await run_in_threadpool(monitor.procesar, _muestras(mensaje), llegada)
+            except ValueError as e:
+                await websocket.send_json({"error": str(e)})
+                continue
+            for resultado in resultados:
+                # La latencia informada incluye la serialización hasta el envío
+                resultado["latencia_ms"] = 1000 * (time.perf_counter() - llegada)
+                await websocket.send_json(resultado)
+    except WebSocketDisconnect:
+        pass
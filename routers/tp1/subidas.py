@@ -0,0 +1,54 @@
+# routers/tp1/subidas.py
+
+from typing import Literal
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from services.tp1 import subidas
+from services.tp1.espectrograma import BANDAS_EEG
+from services.tp1.pipeline import CUTOFF, NUM_TAPS, pipeline
+from services.tp1.senales import FORMATOS, FS
+
+router = APIRouter(
+    prefix="/subidas",
+    tags=["TP1 - Subida de registros EEG"]
+)
+
+
+@router.post("", summary="Sube un registro EEG (texto, CSV o float32 crudo) y devuelve su ID")
+async def post_subida(
+    archivo: UploadFile = File(..., description="Registro EEG"),
+    formato: Literal[FORMATOS] = Query("texto", description="texto: una muestra por línea; csv: una columna; float32: binario little-endian"),
+    fs: float = Query(FS, gt=0, description="Frecuencia de muestreo [Hz]"),
+    columna: int = Query(0, ge=0, description="Columna a leer (solo CSV)"),
+):
+    """
+    El archivo va como multipart (p. ej. `curl -F archivo=@registro.csv`).
+    El ID devuelto se puede pasar como `id` a los endpoints de filtros,
+    espectrograma y autocorrelación.
+    """
+    return await subidas.guardar_subida(archivo, formato, fs, columna)
+
+
+@router.get("/{id_subida}", summary="Metadatos de una subida")
+def obtener_subida(id_subida: str):
+    return subidas.metadatos(id_subida)
+
+
+def _validar_cutoff(nombre, cutoff):
+    if not 0 < cutoff < pipeline.fs(nombre) / 2:
+        raise HTTPException(status_code=400, detail=f"El corte debe estar entre 0 y fs/2 = {pipeline.fs(nombre) / 2:.2f} Hz.")
+
+
+@router.get("/{id_subida}/espectro", summary="Espectro de amplitud (FFT) de la subida filtrada")
+def obtener_espectro(id_subida: str, cutoff: float = Query(CUTOFF, gt=0), taps: int = Query(NUM_TAPS, ge=3, le=8191)):
+    nombre = subidas.resolver(id_subida)
+    _validar_cutoff(nombre, cutoff)
+    frecuencias, magnitud = pipeline.magnitud(nombre, cutoff, taps)
+    return {"id": id_subida, "fs": pipeline.fs(nombre), "frecuencias": frecuencias.tolist(), "magnitud": magnitud.tolist()}
+
+
+@router.get("/{id_subida}/bandas", summary="Potencia por banda (suma de |FFT|²) de la subida filtrada")
+def obtener_bandas(id_subida: str, cutoff: float = Query(CUTOFF, gt=0), taps: int = Query(NUM_TAPS, ge=3, le=8191)):
+    nombre = subidas.resolver(id_subida)
+    _validar_cutoff(nombre, cutoff)
+    potencias = pipeline.potencias_banda(nombre, BANDAS_EEG, cutoff, taps)
+    return {"id": id_subida, "potencias": {banda: float(p) for banda, p in potencias.items()}}
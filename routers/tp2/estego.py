@@ -0,0 +1,92 @@
+# routers/tp2/estego.py
+import json
+from typing import Optional
+from fastapi import APIRouter, File, Form, Query, UploadFile
+from fastapi.responses import Response
+from services.tp2 import estego
+
+router = APIRouter(prefix="/estego", tags=["TP2 - Esteganografía sin estado (imágenes en memoria)"])
+
+
+def _respuesta_imagen(datos, clave, media_type, nombre):
+    return Response(
+        content=datos,
+        media_type=media_type,
+        headers={
+            estego.CABECERA_CLAVE: json.dumps(clave),
+            "Content-Disposition": f'inline; filename="{nombre}"',
+            "Cache-Control": "no-store",
+        },
+    )
+
+
+@router.post("/lsb/ocultar", summary="Oculta un mensaje con LSB y devuelve la imagen estego (PNG)")
+async def ocultar_lsb(
+    mensaje: str = Form(..., description="Texto a ocultar (UTF-8)"),
+    portadora: Optional[UploadFile] = File(None, description="Imagen portadora (por defecto, la del inciso 1)"),
+    k: int = Query(1, ge=1, le=8, description="Bits menos significativos por muestra"),
+    rgb: bool = Query(False, description="Usar los canales R, G y B"),
+):
+    """La clave queda en el PNG y en el header `X-Estego-Clave`."""
+    datos, clave = await estego.procesar(
+        estego.ocultar_lsb, await estego.leer_archivo(portadora), mensaje.encode("utf-8"), k, rgb
+    )
+    return _respuesta_imagen(datos, clave, "image/png", "estego_lsb.png")
+
+
+@router.post("/lsb/extraer", summary="Extrae el mensaje de una imagen estego LSB")
+async def extraer_lsb(
+    estego_png: UploadFile = File(..., alias="estego", description="PNG devuelto por /lsb/ocultar"),
+    clave: Optional[str] = Form(None, description="Clave (si la imagen perdió los metadatos)"),
+):
+    mensaje, clave = await estego.procesar(estego.extraer_lsb, await estego.leer_archivo(estego_png), clave)
+    return {"mensaje": mensaje.decode("utf-8", errors="replace"), "clave": clave}
+
+
+@router.post("/fft/ocultar", summary="Oculta una imagen en el signo de los coeficientes de la FFT (PNG)")
+async def ocultar_fft(
+    portadora: Optional[UploadFile] = File(None, description="Imagen portadora (por defecto, la del inciso 2)"),
+    oculta: Optional[UploadFile] = File(None, description="Imagen a ocultar (por defecto, la del inciso 2)"),
+    repeticiones: int = Query(7, ge=1, le=31, description="Repeticiones de cada bit (votación al extraer)"),
+    semilla: Optional[int] = Query(None, ge=0, description="Semilla de las posiciones (por defecto, al azar)"),
+    radio: float = Query(40, ge=0, description="Radio alrededor del centro que no se toca"),
+):
+    semilla = estego.nueva_semilla() if semilla is None else semilla
+    datos, clave = await estego.procesar(
+        estego.ocultar_fft, await estego.leer_archivo(portadora), await estego.leer_archivo(oculta),
+        repeticiones, semilla, radio,
+    )
+    return _respuesta_imagen(datos, clave, "image/png", "estego_fft.png")
+
+
+@router.post("/fft/extraer", summary="Recupera la imagen oculta con /fft/ocultar (PNG)")
+async def extraer_fft(
+    estego_png: UploadFile = File(..., alias="estego", description="PNG devuelto por /fft/ocultar"),
+    clave: Optional[str] = Form(None, description="Clave (si la imagen perdió los metadatos)"),
+):
+    datos, clave = await estego.procesar(estego.extraer_fft, await estego.leer_archivo(estego_png), clave)
+    return _respuesta_imagen(datos, clave, "image/png", "recuperada_fft.png")
+
+
+@router.post("/qim/ocultar", summary="Oculta una imagen por paridad de la TF2D cuantizada (TIFF float32)")
+async def ocultar_qim(
+    portadora: Optional[UploadFile] = File(None, description="Imagen portadora (por defecto, la del inciso 3)"),
+    oculta: Optional[UploadFile] = File(None, description="Imagen a ocultar (por defecto, la del inciso 3)"),
+    delta: float = Query(..., gt=0, description="Paso de cuantización"),
+    repeticiones: int = Query(3, ge=1, le=31),
+):
+    """El estego se devuelve como TIFF float32: en 8 bits se pierde la paridad."""
+    datos, clave = await estego.procesar(
+        estego.ocultar_qim, await estego.leer_archivo(portadora), await estego.leer_archivo(oculta),
+        delta, repeticiones,
+    )
+    return _respuesta_imagen(datos, clave, "image/tiff", "estego_qim.tiff")
+
+
+@router.post("/qim/extraer", summary="Recupera la imagen oculta con /qim/ocultar (PNG)")
+async def extraer_qim(
+    estego_tiff: UploadFile = File(..., alias="estego", description="TIFF devuelto por /qim/ocultar"),
+    clave: Optional[str] = Form(None, description="Clave (si la imagen perdió los metadatos)"),
+):
+    datos, clave = await estego.procesar(estego.extraer_qim, await estego.leer_archivo(estego_tiff), clave)
+    return _respuesta_imagen(datos, clave, "image/png", "recuperada_qim.png")
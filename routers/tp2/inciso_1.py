@@ -6,21 +6,27 @@ from services.tp2 import inciso_1
 router = APIRouter(prefix="/inciso_1", tags=["TP2 - Esteganografía LSB - Inciso 1"])
 
 @router.post("/ocultar", response_class=PlainTextResponse, summary="Ocultar mensaje en imagen")
-def ocultar_mensaje(mensaje: str = Query(..., description="Mensaje de texto a ocultar")):
+def ocultar_mensaje(
+    mensaje: str = Query(..., description="Mensaje de texto a ocultar"),
+    k: int = Query(1, ge=1, le=8, description="Bits menos significativos usados por muestra"),
+    rgb: bool = Query(False, description="Usar los tres canales RGB (si no, escala de grises)"),
+):
     """
     Oculta un mensaje de texto en una imagen utilizando el método LSB.
     Guarda la imagen esteganográfica en disco.
 
     - **mensaje**: Texto plano a ocultar (se agrega '&' al final automáticamente)
+    - **k**: bits por muestra; la capacidad es k × muestras / 8 bytes
+    - **rgb**: ocultar en R, G y B (triplica la capacidad)
     """
-    return inciso_1.ocultar_mensaje_en_imagen(mensaje)
+    return inciso_1.ocultar_mensaje_en_imagen(mensaje, k, rgb)
 
 @router.get("/extraer", response_class=PlainTextResponse, summary="Extraer mensaje oculto")
-def extraer_mensaje():
+def extraer_mensaje(k: int = Query(1, ge=1, le=8, description="Bits por muestra usados al ocultar")):
     """
     Extrae el mensaje oculto desde la imagen generada con el método LSB.
     """
-    return inciso_1.extraer_mensaje_de_imagen()
+    return inciso_1.extraer_mensaje_de_imagen(k)
 
 @router.get("/consigna", response_class=PlainTextResponse, summary="Consigna original")
 def get_consigna():
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Request, Response
 from fastapi.responses import PlainTextResponse, StreamingResponse
 from models.tp3.gases import ParametrosIniciales
 from fastapi import Body
 
 from services.tp3.gases import EXPLICACION_INCISO_A, PROBLEMAS_INCISO_A, PROBLEMAS_INCISO_B, calcular_volumenes_con_params, comparar_metodos_vdw, ejecutar_metodos_con_comparacion, encontrar_intervalo, generar_grafico_gases, generar_grafico_general, generar_grafico_volumenes_comparados, generar_grafico_zoom, generar_imagen_error_volumen, obtener_funciones_numericas, resolver_resultado_gas, seleccionar_raiz_valida
 from services.tp3.presentacion_gases import generar_grafico_comparativo_gral, generar_grafico_comparativo_z, generar_grafico_f_vdw
+from services.common.render_cache import respuesta_png
 
 router = APIRouter(
     prefix="/gases",
@@ -49,10 +50,10 @@ a partir de los resultados.
     return consigna.strip()
 
 @router.post("/grafico-a")
-def grafico_gases(params: ParametrosIniciales = Body(...)):
+def grafico_gases(request: Request, params: ParametrosIniciales = Body(...)):
     resultados = calcular_volumenes_con_params(params)
     buf = generar_grafico_gases(resultados)
-    return StreamingResponse(buf, media_type="image/png")
+    return respuesta_png(request, buf)
 
 @router.post("/grafico-b")
 def grafico_gas_b(params: ParametrosIniciales = Body(...)):
@@ -154,12 +155,12 @@ def obtener_explicacion_inciso_a():
     return EXPLICACION_INCISO_A
 
 @router.get("/grafico_comparativo_gral")
-def grafico_comparativo_gral():
-    return StreamingResponse(generar_grafico_comparativo_gral(), media_type="image/png")
+def grafico_comparativo_gral(request: Request):
+    return respuesta_png(request, generar_grafico_comparativo_gral())
 
 @router.get("/grafico_comparativo_z")
-def grafico_comparativo_z():
-    return StreamingResponse(generar_grafico_comparativo_z(), media_type="image/png")
+def grafico_comparativo_z(request: Request):
+    return respuesta_png(request, generar_grafico_comparativo_z())
  
 @router.get("/dificultad-a", response_class=PlainTextResponse)
 def obtener_dificultada():
@@ -170,9 +171,9 @@ def obtener_dificultadb():
     return PROBLEMAS_INCISO_B
  
 @router.get("/grafico_comparacion_volumenes", response_class=Response)
-def grafico_comparacion_volumenes():
+def grafico_comparacion_volumenes(request: Request):
     imagen = generar_grafico_volumenes_comparados()
-    return Response(content=imagen.getvalue(), media_type="image/png")
+    return respuesta_png(request, imagen)
  
 
 # Cambio en la resolución del item b y valores coherentes para el CO2
@@ -235,6 +236,6 @@ def resultado_taylor_05mpa(params: ParametrosIniciales):
     return resolver_resultado_gas(params, P=0.5e6, T=200.0)
 
 @router.get("/grafico-f-vdw")
-def grafico_f_vdw():
+def grafico_f_vdw(request: Request):
     buf = generar_grafico_f_vdw()
-    return StreamingResponse(buf, media_type="image/png")
\ No newline at end of file
+    return respuesta_png(request, buf)
\ No newline at end of file
@@ -1,10 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi import HTTPException
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse
 from fastapi.responses import PlainTextResponse
-from starlette.responses import StreamingResponse
+from services.common.render_cache import respuesta_png
 
-from services.tp3.raices import PROBLEMAS_INCISO_A, PROBLEMAS_INCISO_B, ejecutar_metodos_con_comparacion, generar_grafico_funcion_enferma, graficar_comparacion_convergencia, graficar_convergencia_loglog, graficar_iteraciones, graficar_taylor_local, metodo_taylor_segundo_orden, obtener_funciones_numericas
+from services.tp3.raices import PROBLEMAS_INCISO_A, PROBLEMAS_INCISO_B, ejecutar_metodos_con_comparacion, generar_grafico_funcion_enferma, generar_grafico_iteraciones, graficar_comparacion_convergencia, graficar_convergencia_loglog, graficar_taylor_local, metodo_taylor_segundo_orden, obtener_funciones_numericas
 
 router = APIRouter(
     prefix="/raices",
@@ -43,35 +43,33 @@ def metodo_taylor_segundo_orden_json():
     return JSONResponse(content={"historial": historial, "salida": salida})
 
 @router.get("/grafico1", summary="Gráfico de la función y puntos iterativos")
-def grafico_funcion_y_iteraciones():
-    f, f1, f2 = obtener_funciones_numericas()
-    historial, _ = metodo_taylor_segundo_orden(f, f1, f2, max_iter=3)
+def grafico_funcion_y_iteraciones(request: Request):
+    buffer = generar_grafico_iteraciones()
 
-    if not historial:
+    if buffer is None:
         raise HTTPException(status_code=500, detail="No se generaron iteraciones para graficar.")
     
-    buffer = graficar_iteraciones(historial, f, r"e^{-x} \cos(5x) - \frac{1}{100}x")
-    return StreamingResponse(buffer, media_type="image/png")
+    return respuesta_png(request, buffer)
 
 @router.get("/grafico2")
-def grafico_convergencia():
+def grafico_convergencia(request: Request):
     try:
         buffer = graficar_convergencia_loglog()
-        return StreamingResponse(buffer, media_type="image/png")
+        return respuesta_png(request, buffer)
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/grafico3/{iteration}")
-def grafico_taylor_local_endpoint(iteration: int):
+def grafico_taylor_local_endpoint(request: Request, iteration: int):
     try:
         buffer = graficar_taylor_local(iteration)
-        return StreamingResponse(buffer, media_type="image/png")
+        return respuesta_png(request, buffer)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/grafico-f-enferma", summary="Gráfico de $f(x) = e^{-x} \\cos(5x) - \\frac{1}{100}x$ con raíz destacada")
-def obtener_grafico_fun_enferma():
-    return generar_grafico_funcion_enferma()
+def obtener_grafico_fun_enferma(request: Request):
+    return respuesta_png(request, generar_grafico_funcion_enferma())
  
 @router.get("/inciso1b", response_class=PlainTextResponse)
 def inciso1b():
@@ -83,10 +81,10 @@ def inciso1b():
     return resultado_texto
 
 @router.get("/grafico4")
-def grafico4():
+def grafico4(request: Request):
     try:
         buffer = graficar_comparacion_convergencia()
-        return StreamingResponse(buffer, media_type="image/png")
+        return respuesta_png(request, buffer)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
  
@@ -1,6 +1,11 @@
-from fastapi import APIRouter
-from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
 from services.tp4 import service_inciso_1
+from services.common.datos import respuesta_datos
+from services.common.render_cache import respuesta_png
+from services.common.precalculo import requiere_listo
+from services.common.ejecutor import renderizar
+from services.tp4.core import processor
 
 router = APIRouter(
     prefix="/inciso-1",
@@ -15,25 +20,33 @@ def get_consigna():
 def get_explicacion():
     return service_inciso_1.EXPLICACION
 
-@router.get("/console-output", summary="Logs del procesamiento", response_class=PlainTextResponse)
-def get_console_output():
+@router.get("/console-output", summary="Logs del procesamiento", response_class=PlainTextResponse, dependencies=[Depends(requiere_listo("tp4"))])
+async def get_console_output():
+    await processor.get_data_async()
     return service_inciso_1.obtener_logs()
 
-@router.get("/grafico-procesamiento", summary="Imagen de ejemplo del procesamiento (1a)")
-def get_grafico_procesamiento():
-    imagen = service_inciso_1.generar_grafico_procesamiento()
-    return StreamingResponse(imagen, media_type="image/png")
-
-@router.get("/grafico-trayectoria", summary="Gráfico vertical CM vs tiempo (1b)")
-def get_grafico_trayectoria():
-    imagen = service_inciso_1.generar_grafico_trayectoria_vertical()
-    return StreamingResponse(imagen, media_type="image/png")
-
-@router.get("/grafico-horizontal", summary="Gráfico horizontal CM vs tiempo (1b)")
-def get_grafico_horizontal():
-    imagen = service_inciso_1.generar_grafico_posicion_horizontal()
-    return StreamingResponse(imagen, media_type="image/png")
-
-@router.get("/console-output2", summary="Salida formateada consola", response_class=PlainTextResponse)
-def get_console_output2():
+@router.get("/grafico-procesamiento", summary="Imagen de ejemplo del procesamiento (1a)", dependencies=[Depends(requiere_listo("tp4"))])
+async def get_grafico_procesamiento(request: Request):
+    imagen = await renderizar(service_inciso_1.generar_grafico_procesamiento, processor.get_data_async)
+    return respuesta_png(request, imagen)
+
+@router.get("/grafico-trayectoria", summary="Gráfico vertical CM vs tiempo (1b)", dependencies=[Depends(requiere_listo("tp4"))])
+async def get_grafico_trayectoria(request: Request):
+    imagen = await renderizar(service_inciso_1.generar_grafico_trayectoria_vertical, processor.get_data_async)
+    return respuesta_png(request, imagen)
+
+@router.get("/grafico-horizontal", summary="Gráfico horizontal CM vs tiempo (1b)", dependencies=[Depends(requiere_listo("tp4"))])
+async def get_grafico_horizontal(request: Request):
+    imagen = await renderizar(service_inciso_1.generar_grafico_posicion_horizontal, processor.get_data_async)
+    return respuesta_png(request, imagen)
+
+@router.get("/grafico-trayectoria/datos", summary="Posición del CM vs tiempo (JSON o float32 según Accept)", dependencies=[Depends(requiere_listo("tp4"))])
+@router.get("/grafico-horizontal/datos", summary="Posición del CM vs tiempo (JSON o float32 según Accept)", dependencies=[Depends(requiere_listo("tp4"))])
+async def get_datos_trayectoria(request: Request):
+    await processor.get_data_async()
+    return respuesta_datos(request, *service_inciso_1.datos_trayectoria())
+
+@router.get("/console-output2", summary="Salida formateada consola", response_class=PlainTextResponse, dependencies=[Depends(requiere_listo("tp4"))])
+async def get_console_output2():
+    await processor.get_data_async()
     return service_inciso_1.obtener_salida_consola()
\ No newline at end of file
@@ -1,6 +1,11 @@
-from fastapi import APIRouter
-from fastapi.responses import PlainTextResponse, StreamingResponse, JSONResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse, JSONResponse
 from services.tp4 import service_inciso_2
+from services.common.datos import respuesta_datos
+from services.common.render_cache import respuesta_png
+from services.common.precalculo import requiere_listo
+from services.common.ejecutor import renderizar
+from services.tp4.core import processor
 
 router = APIRouter(
     prefix="/inciso-2",
@@ -15,25 +20,32 @@ def get_consigna():
 def get_explicacion():
     return service_inciso_2.EXPLICACION
 
-@router.get("/datos-json", summary="Datos crudos de ángulos (para inspección)")
-def get_datos():
+@router.get("/datos-json", summary="Datos crudos de ángulos (para inspección)", dependencies=[Depends(requiere_listo("tp4"))])
+async def get_datos():
+    await processor.get_data_async()
     return JSONResponse(content=service_inciso_2.obtener_datos_angulos())
 
-@router.get("/grafico-angulos", summary="Gráfico Ángulos vs Tiempo (2b)")
-def get_grafico():
-    imagen = service_inciso_2.generar_grafico_angulos()
+@router.get("/grafico-angulos", summary="Gráfico Ángulos vs Tiempo (2b)", dependencies=[Depends(requiere_listo("tp4"))])
+async def get_grafico(request: Request):
+    imagen = await renderizar(service_inciso_2.generar_grafico_angulos, processor.get_data_async)
     if imagen:
-        return StreamingResponse(imagen, media_type="image/png")
+        return respuesta_png(request, imagen)
     return PlainTextResponse("No hay datos de contacto para graficar.")
  
-@router.get("/console-output", summary="Salida formateada consola (Promedios)", response_class=PlainTextResponse)
-def get_console_output():
+@router.get("/grafico-angulos/datos", summary="Ángulos vs tiempo (JSON o float32 según Accept)", dependencies=[Depends(requiere_listo("tp4"))])
+async def get_datos_grafico(request: Request):
+    await processor.get_data_async()
+    return respuesta_datos(request, *service_inciso_2.datos_grafico_angulos())
+
+@router.get("/console-output", summary="Salida formateada consola (Promedios)", response_class=PlainTextResponse, dependencies=[Depends(requiere_listo("tp4"))])
+async def get_console_output():
+    await processor.get_data_async()
     return service_inciso_2.obtener_salida_consola()
 
 @router.get("/grafico-ajuste-detalle", summary="Detalle Ajuste Frame 28 (2a)",
             description="Muestra los puntos del contorno y las curvas ajustadas (Spline vs Poly) para el Frame 28.")
-def get_grafico_detalle():
-    imagen = service_inciso_2.generar_grafico_ajuste_frame28()
+async def get_grafico_detalle(request: Request):
+    imagen = await renderizar(service_inciso_2.generar_grafico_ajuste_frame28)
     if imagen:
-        return StreamingResponse(imagen, media_type="image/png")
+        return respuesta_png(request, imagen)
     return PlainTextResponse("No se pudo generar el detalle del ajuste (Frame 28).")
\ No newline at end of file
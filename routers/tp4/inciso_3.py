@@ -1,6 +1,11 @@
-from fastapi import APIRouter
-from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
 from services.tp4 import service_inciso_3
+from services.common.datos import respuesta_datos
+from services.common.render_cache import respuesta_png
+from services.common.precalculo import requiere_listo
+from services.common.ejecutor import renderizar
+from services.tp4.core import processor
 
 router = APIRouter(
     prefix="/inciso-3",
@@ -15,18 +20,26 @@ def get_consigna():
 def get_explicacion():
     return service_inciso_3.EXPLICACION
 
-@router.get("/grafico-sf", summary="Factor de Esparcimiento")
-def get_grafico_sf():
-    return StreamingResponse(service_inciso_3.generar_grafico_sf(), media_type="image/png")
+@router.get("/grafico-sf", summary="Factor de Esparcimiento", dependencies=[Depends(requiere_listo("tp4"))])
+async def get_grafico_sf(request: Request):
+    return respuesta_png(request, await renderizar(service_inciso_3.generar_grafico_sf, processor.get_data_async))
 
-@router.get("/grafico-simetria", summary="Simetría Izq/Der")
-def get_grafico_simetria():
-    return StreamingResponse(service_inciso_3.generar_grafico_simetria(), media_type="image/png")
+@router.get("/grafico-simetria", summary="Simetría Izq/Der", dependencies=[Depends(requiere_listo("tp4"))])
+async def get_grafico_simetria(request: Request):
+    return respuesta_png(request, await renderizar(service_inciso_3.generar_grafico_simetria, processor.get_data_async))
 
-@router.get("/grafico-energia", summary="Energía Cinética")
-def get_grafico_energia():
-    return StreamingResponse(service_inciso_3.generar_grafico_energia(), media_type="image/png")
+@router.get("/grafico-energia", summary="Energía Cinética", dependencies=[Depends(requiere_listo("tp4"))])
+async def get_grafico_energia(request: Request):
+    return respuesta_png(request, await renderizar(service_inciso_3.generar_grafico_energia, processor.get_data_async))
  
-@router.get("/console-output", summary="Salida formateada consola (Estadísticas)", response_class=PlainTextResponse)
-def get_console_output():
+@router.get("/grafico-sf/datos", summary="Series de Sf, perímetros y energía (JSON o float32 según Accept)", dependencies=[Depends(requiere_listo("tp4"))])
+@router.get("/grafico-simetria/datos", summary="Series de Sf, perímetros y energía (JSON o float32 según Accept)", dependencies=[Depends(requiere_listo("tp4"))])
+@router.get("/grafico-energia/datos", summary="Series de Sf, perímetros y energía (JSON o float32 según Accept)", dependencies=[Depends(requiere_listo("tp4"))])
+async def get_datos_variables(request: Request):
+    await processor.get_data_async()
+    return respuesta_datos(request, *service_inciso_3.datos_variables_auxiliares())
+
+@router.get("/console-output", summary="Salida formateada consola (Estadísticas)", response_class=PlainTextResponse, dependencies=[Depends(requiere_listo("tp4"))])
+async def get_console_output():
+    await processor.get_data_async()
     return service_inciso_3.obtener_salida_consola()
\ No newline at end of file
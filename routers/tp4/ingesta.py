@@ -0,0 +1,72 @@
+import os
+import tempfile
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
+from services.tp4 import core, ingesta
+from services.tp4.core import processor
+
+# Límite del archivo subido (MB)
+TP4_INGESTA_MAX_MB = int(os.environ.get("TP4_INGESTA_MAX_MB", "2048"))
+
+router = APIRouter(
+    prefix="/ingesta",
+    tags=["TP4 - Ingesta de video / TIFF"]
+)
+
+async def _guardar_archivo(archivo: UploadFile):
+    """
+    Copia el archivo subido a un temporal propio, de a chunks (OpenCV necesita
+    una ruta, y el temporal tiene que sobrevivir a la request mientras se
+    transmite la respuesta).
+    """
+    limite = TP4_INGESTA_MAX_MB * 1024 * 1024
+    fd, ruta = tempfile.mkstemp(prefix="tp4_ingesta_")
+    total = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while chunk := await archivo.read(1 << 20):
+                total += len(chunk)
+                if total > limite:
+                    raise HTTPException(status_code=413, detail=f"El archivo supera {TP4_INGESTA_MAX_MB} MB.")
+                f.write(chunk)
+    except BaseException:
+        os.remove(ruta)
+        raise
+    if total == 0:
+        os.remove(ruta)
+        raise HTTPException(status_code=400, detail="El archivo está vacío.")
+    return ruta
+
+@router.post(
+    "/secuencia",
+    summary="Procesa un video o TIFF multipágina y devuelve un NDJSON por frame",
+    response_class=StreamingResponse,
+)
+async def post_secuencia(
+    archivo: UploadFile = File(..., description="Video (AVI, MP4, ...) o TIFF multipágina"),
+    fps: float = Query(core.FPS, gt=0, description="Cuadros por segundo de la cámara"),
+):
+    """
+    El archivo va como multipart (p. ej. `curl -F archivo=@gota.avi`).
+    Cada línea de la respuesta es el resultado de un frame, a medida que se procesa.
+    """
+    ruta = await _guardar_archivo(archivo)
+    try:
+        await run_in_threadpool(ingesta.validar_archivo, ruta)
+    except ValueError as e:
+        os.remove(ruta)
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        ingesta.ndjson_secuencia(ruta, fps=fps),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(os.remove, ruta),
+    )
+
+@router.post("/actualizar", summary="Incorpora las imágenes nuevas de data/tp4 sin reprocesar las existentes")
+async def post_actualizar():
+    await processor.get_data_async()
+    nuevos = await processor.actualizar_async()
+    return {"nuevos": nuevos, "frames": len(processor.data) if processor.data is not None else 0}
@@ -1,6 +1,11 @@
-from fastapi import APIRouter
-from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
 from services.tp5 import service_inciso_1
+from services.common.datos import respuesta_datos
+from services.common.render_cache import respuesta_png
+from services.common.precalculo import requiere_listo
+from services.common.ejecutor import renderizar
+from services.tp4.core import processor as tp4_processor
 
 router = APIRouter(prefix="/inciso-1", tags=["TP5 - Inciso 1"])
 
@@ -10,18 +15,24 @@ def c(): return service_inciso_1.CONSIGNA
 @router.get("/problemas", response_class=PlainTextResponse)
 def p(): return service_inciso_1.PROBLEMAS
 
-@router.get("/console-output", response_class=PlainTextResponse)
-def o(): return service_inciso_1.get_console_output()
+@router.get("/console-output", response_class=PlainTextResponse, dependencies=[Depends(requiere_listo("tp5"))])
+async def o(): await tp4_processor.get_data_async(); return service_inciso_1.get_console_output()
 
-@router.get("/grafico-volumen")
-def g(): return StreamingResponse(service_inciso_1.generar_grafico_volumen(), media_type="image/png")
+@router.get("/grafico-volumen", dependencies=[Depends(requiere_listo("tp5"))])
+async def g(request: Request): return respuesta_png(request, await renderizar(service_inciso_1.generar_grafico_volumen, tp4_processor.get_data_async))
 
-@router.get("/grafico-radio")
-def g_rad(): return StreamingResponse(service_inciso_1.generar_grafico_radio(), media_type="image/png")
+@router.get("/grafico-radio", dependencies=[Depends(requiere_listo("tp5"))])
+async def g_rad(request: Request): return respuesta_png(request, await renderizar(service_inciso_1.generar_grafico_radio, tp4_processor.get_data_async))
+
+@router.get("/grafico-volumen/datos", dependencies=[Depends(requiere_listo("tp5"))])
+@router.get("/grafico-radio/datos", dependencies=[Depends(requiere_listo("tp5"))])
+async def g_datos(request: Request):
+    await tp4_processor.get_data_async()
+    return respuesta_datos(request, *service_inciso_1.datos_integracion())
 
 @router.get("/grafico-perfil-80", summary="Perfil Ajustado Frame 80")
-def get_grafico_perfil():
-    imagen = service_inciso_1.generar_grafico_perfil_80()
+async def get_grafico_perfil(request: Request):
+    imagen = await renderizar(service_inciso_1.generar_grafico_perfil_80)
     if imagen:
-        return StreamingResponse(imagen, media_type="image/png")
+        return respuesta_png(request, imagen)
     return PlainTextResponse("No se pudo procesar el Frame 80.")
\ No newline at end of file
@@ -1,7 +1,11 @@
 # routers/tp5/inciso_2.py
-from fastapi import APIRouter
-from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
 from services.tp5 import service_inciso_2
+from services.common.datos import respuesta_datos
+from services.common.render_cache import respuesta_png
+from services.common.precalculo import requiere_listo
+from services.common.ejecutor import renderizar
 
 router = APIRouter(prefix="/inciso-2", tags=["TP5 - Inciso 2"])
 
@@ -13,30 +17,27 @@ def get_consigna():
 def get_problemas():
     return service_inciso_2.PROBLEMAS
 
-@router.get("/console-output", response_class=PlainTextResponse)
+@router.get("/console-output", response_class=PlainTextResponse, dependencies=[Depends(requiere_listo("tp5"))])
 def get_console_output_data():
     """
     Devuelve los resultados numéricos formateados como tabla Markdown.
     """
     return service_inciso_2.get_console_output()
 
-@router.get("/grafico-comparativa")
-def get_grafico_comparativa():
-    return StreamingResponse(
-        service_inciso_2.generar_grafico_final(), 
-        media_type="image/png"
-    )
-
-@router.get("/grafico-fase")
-def get_grafico_fase():
-    return StreamingResponse(
-        service_inciso_2.generar_grafico_fase(), 
-        media_type="image/png"
-    )
-
-@router.get("/grafico-error")
-def get_grafico_error():
-    return StreamingResponse(
-        service_inciso_2.generar_grafico_error(), 
-        media_type="image/png"
-    )
\ No newline at end of file
+@router.get("/grafico-comparativa", dependencies=[Depends(requiere_listo("tp5"))])
+async def get_grafico_comparativa(request: Request):
+    return respuesta_png(request, await renderizar(service_inciso_2.generar_grafico_final))
+
+@router.get("/grafico-fase", dependencies=[Depends(requiere_listo("tp5"))])
+async def get_grafico_fase(request: Request):
+    return respuesta_png(request, await renderizar(service_inciso_2.generar_grafico_fase))
+
+@router.get("/grafico-error", dependencies=[Depends(requiere_listo("tp5"))])
+async def get_grafico_error(request: Request):
+    return respuesta_png(request, await renderizar(service_inciso_2.generar_grafico_error))
+
+@router.get("/grafico-comparativa/datos", dependencies=[Depends(requiere_listo("tp5"))])
+@router.get("/grafico-fase/datos", dependencies=[Depends(requiere_listo("tp5"))])
+@router.get("/grafico-error/datos", dependencies=[Depends(requiere_listo("tp5"))])
+def get_datos_dinamica(request: Request):
+    return respuesta_datos(request, *service_inciso_2.datos_dinamica())
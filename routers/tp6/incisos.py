@@ -1,6 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import PlainTextResponse, StreamingResponse
 from services.tp6 import service_inciso_a, service_inciso_b, service_inciso_c, service_inciso_d, service_inciso_e, service_inciso_f
+from services.common.datos import respuesta_datos
+from services.common.render_cache import respuesta_png
+from services.common.precalculo import requiere_listo
+from services.common.ejecutor import renderizar
 
 # CORRECCIÓN: Quitamos el prefix="/api/tp6" aquí. Main.py ya lo pone.
 router = APIRouter(tags=["TP6"])
@@ -12,11 +16,14 @@ def a_consigna(): return service_inciso_a.get_consigna()
 @router.get("/inciso-a/explicacion", response_class=PlainTextResponse)
 def a_explicacion(): return service_inciso_a.get_explicacion()
 
-@router.get("/inciso-a/console-output", response_class=PlainTextResponse)
-def a_console(): return service_inciso_a.get_console()
+@router.get("/inciso-a/console-output", response_class=PlainTextResponse, dependencies=[Depends(requiere_listo("tp6.a"))])
+async def a_console(): await service_inciso_a.obtener_datos(); return service_inciso_a.get_console()
 
-@router.get("/inciso-a/grafico", response_class=StreamingResponse)
-def a_graph(): return StreamingResponse(service_inciso_a.get_grafico(), media_type="image/png")
+@router.get("/inciso-a/grafico", response_class=StreamingResponse, dependencies=[Depends(requiere_listo("tp6.a"))])
+async def a_graph(request: Request): return respuesta_png(request, await renderizar(service_inciso_a.get_grafico, service_inciso_a.obtener_datos))
+
+@router.get("/inciso-a/grafico/datos", dependencies=[Depends(requiere_listo("tp6.a"))])
+async def a_datos(request: Request): await service_inciso_a.obtener_datos(); return respuesta_datos(request, *service_inciso_a.get_datos())
 
 # --- INCISO B ---
 @router.get("/inciso-b/consigna", response_class=PlainTextResponse)
@@ -25,17 +32,22 @@ def b_consigna(): return service_inciso_b.get_consigna()
 @router.get("/inciso-b/explicacion", response_class=PlainTextResponse)
 def b_explicacion(): return service_inciso_b.get_explicacion()
 
-@router.get("/inciso-b/console-output", response_class=PlainTextResponse)
-def b_console(): return service_inciso_b.get_console()
+@router.get("/inciso-b/console-output", response_class=PlainTextResponse, dependencies=[Depends(requiere_listo("tp6.b"))])
+async def b_console(): await service_inciso_b.obtener_datos(); return service_inciso_b.get_console()
+
+@router.get("/inciso-b/grafico-perfiles", response_class=StreamingResponse, dependencies=[Depends(requiere_listo("tp6.b"))])
+async def b_graph1(request: Request): return respuesta_png(request, await renderizar(service_inciso_b.get_grafico_perfiles, service_inciso_b.obtener_datos))
 
-@router.get("/inciso-b/grafico-perfiles", response_class=StreamingResponse)
-def b_graph1(): return StreamingResponse(service_inciso_b.get_grafico_perfiles(), media_type="image/png")
+@router.get("/inciso-b/grafico-boltzmann", response_class=StreamingResponse, dependencies=[Depends(requiere_listo("tp6.b"))])
+async def b_graph2(request: Request): return respuesta_png(request, await renderizar(service_inciso_b.get_grafico_frente, service_inciso_b.obtener_datos))
 
-@router.get("/inciso-b/grafico-boltzmann", response_class=StreamingResponse)
-def b_graph2(): return StreamingResponse(service_inciso_b.get_grafico_frente(), media_type="image/png")
+@router.get("/inciso-b/grafico-boltzmann-zoom", response_class=StreamingResponse, dependencies=[Depends(requiere_listo("tp6.b"))])
+async def b_graph3(request: Request): return respuesta_png(request, await renderizar(service_inciso_b.get_grafico_zoom, service_inciso_b.obtener_datos))
 
-@router.get("/inciso-b/grafico-boltzmann-zoom", response_class=StreamingResponse)
-def b_graph3(): return StreamingResponse(service_inciso_b.get_grafico_zoom(), media_type="image/png")
+@router.get("/inciso-b/grafico-perfiles/datos", dependencies=[Depends(requiere_listo("tp6.b"))])
+@router.get("/inciso-b/grafico-boltzmann/datos", dependencies=[Depends(requiere_listo("tp6.b"))])
+@router.get("/inciso-b/grafico-boltzmann-zoom/datos", dependencies=[Depends(requiere_listo("tp6.b"))])
+async def b_datos(request: Request): await service_inciso_b.obtener_datos(); return respuesta_datos(request, *service_inciso_b.get_datos())
 
 # --- INCISO C ---
 @router.get("/inciso-c/consigna", response_class=PlainTextResponse)
@@ -44,11 +56,14 @@ def c_consigna(): return service_inciso_c.get_consigna()
 @router.get("/inciso-c/explicacion", response_class=PlainTextResponse)
 def c_explicacion(): return service_inciso_c.get_explicacion()
 
-@router.get("/inciso-c/console-output", response_class=PlainTextResponse)
-def c_console(): return service_inciso_c.get_console()
+@router.get("/inciso-c/console-output", response_class=PlainTextResponse, dependencies=[Depends(requiere_listo("tp6.c"))])
+async def c_console(): await service_inciso_c.obtener_datos(); return service_inciso_c.get_console()
+
+@router.get("/inciso-c/grafico-error", response_class=StreamingResponse, dependencies=[Depends(requiere_listo("tp6.c"))])
+async def c_graph(request: Request): return respuesta_png(request, await renderizar(service_inciso_c.get_grafico_error, service_inciso_c.obtener_datos))
 
-@router.get("/inciso-c/grafico-error", response_class=StreamingResponse)
-def c_graph(): return StreamingResponse(service_inciso_c.get_grafico_error(), media_type="image/png")
+@router.get("/inciso-c/grafico-error/datos", dependencies=[Depends(requiere_listo("tp6.c"))])
+async def c_datos(request: Request): await service_inciso_c.obtener_datos(); return respuesta_datos(request, *service_inciso_c.get_datos())
 
 # --- INCISO D ---
 @router.get("/inciso-d/consigna", response_class=PlainTextResponse)
@@ -57,14 +72,18 @@ def d_consigna(): return service_inciso_d.get_consigna()
 @router.get("/inciso-d/explicacion", response_class=PlainTextResponse)
 def d_explicacion(): return service_inciso_d.get_explicacion()
 
-@router.get("/inciso-d/console-output", response_class=PlainTextResponse)
-def d_console(): return service_inciso_d.get_console()
+@router.get("/inciso-d/console-output", response_class=PlainTextResponse, dependencies=[Depends(requiere_listo("tp6.d"))])
+async def d_console(): await service_inciso_d.obtener_datos(); return service_inciso_d.get_console()
 
-@router.get("/inciso-d/grafico-1d", response_class=StreamingResponse)
-def d_graph1(): return StreamingResponse(service_inciso_d.get_grafico_1d(), media_type="image/png")
+@router.get("/inciso-d/grafico-1d", response_class=StreamingResponse, dependencies=[Depends(requiere_listo("tp6.d"))])
+async def d_graph1(request: Request): return respuesta_png(request, await renderizar(service_inciso_d.get_grafico_1d, service_inciso_d.obtener_datos))
 
-@router.get("/inciso-d/grafico-2d", response_class=StreamingResponse)
-def d_graph2(): return StreamingResponse(service_inciso_d.get_grafico_2d(), media_type="image/png")
+@router.get("/inciso-d/grafico-2d", response_class=StreamingResponse, dependencies=[Depends(requiere_listo("tp6.d"))])
+async def d_graph2(request: Request): return respuesta_png(request, await renderizar(service_inciso_d.get_grafico_2d, service_inciso_d.obtener_datos))
+
+@router.get("/inciso-d/grafico-1d/datos", dependencies=[Depends(requiere_listo("tp6.d"))])
+@router.get("/inciso-d/grafico-2d/datos", dependencies=[Depends(requiere_listo("tp6.d"))])
+async def d_datos(request: Request): await service_inciso_d.obtener_datos(); return respuesta_datos(request, *service_inciso_d.get_datos())
 
 # --- INCISO E ---
 @router.get("/inciso-e/consigna", response_class=PlainTextResponse)
@@ -73,11 +92,14 @@ def e_consigna(): return service_inciso_e.get_consigna()
 @router.get("/inciso-e/explicacion", response_class=PlainTextResponse)
 def e_explicacion(): return service_inciso_e.get_explicacion()
 
-@router.get("/inciso-e/console-output", response_class=PlainTextResponse)
-def e_console(): return service_inciso_e.get_console()
+@router.get("/inciso-e/console-output", response_class=PlainTextResponse, dependencies=[Depends(requiere_listo("tp6.e"))])
+async def e_console(): await service_inciso_e.obtener_datos(); return service_inciso_e.get_console()
+
+@router.get("/inciso-e/grafico", response_class=StreamingResponse, dependencies=[Depends(requiere_listo("tp6.e"))])
+async def e_graph(request: Request): return respuesta_png(request, await renderizar(service_inciso_e.get_grafico, service_inciso_e.obtener_datos))
 
-@router.get("/inciso-e/grafico", response_class=StreamingResponse)
-def e_graph(): return StreamingResponse(service_inciso_e.get_grafico(), media_type="image/png")
+@router.get("/inciso-e/grafico/datos", dependencies=[Depends(requiere_listo("tp6.e"))])
+async def e_datos(request: Request): await service_inciso_e.obtener_datos(); return respuesta_datos(request, *service_inciso_e.get_datos())
 
 # --- INCISO F ---
 @router.get("/inciso-f/consigna", response_class=PlainTextResponse)
@@ -0,0 +1,98 @@
+# services/common/datos.py
+"""
+Datos de los gráficos para que el cliente los dibuje.
+
+Cada `/grafico...` tiene al lado un `/grafico.../datos` que devuelve las
+series numéricas del gráfico en lugar del PNG, así el frontend dibuja y el
+backend no renderiza nada. El formato se negocia con el header `Accept`:
+
+- `application/octet-stream`: binario compacto. Los primeros 4 bytes son el
+  largo (uint32 little endian) de un header JSON en UTF-8, completado con
+  espacios hasta múltiplo de 4. Después van los arrays float32 little endian
+  uno detrás de otro, en orden C. El header tiene los metadatos del gráfico y,
+  en "series", la forma y el offset en bytes (desde el fin del header) de cada
+  array. En JS: `new Float32Array(buffer, 4 + largo + offset, n)`.
+- cualquier otra cosa (o sin `Accept`): JSON con los mismos metadatos y
+  las series como listas; los NaN/inf van como null.
+"""
+import json
+import struct
+
+import numpy as np
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+TIPO_BINARIO = "application/octet-stream"
+TIPO_JSON = "application/json"
+
+
+def _calidades(accept):
+    """{tipo: q} a partir del header Accept."""
+    calidades = {}
+    for parte in (accept or "").split(","):
+        tipo, *parametros = [p.strip() for p in parte.split(";")]
+        if not tipo:
+            continue
+        q = 1.0
+        for parametro in parametros:
+            clave, _, valor = parametro.partition("=")
+            if clave.strip() == "q":
+                try:
+                    q = float(valor)
+                except ValueError:
+                    q = 0.0
+        calidades[tipo.lower()] = q
+    return calidades
+
+
+def prefiere_binario(request: Request) -> bool:
+    """True si el cliente pide octet-stream con más prioridad que JSON."""
+    calidades = _calidades(request.headers.get("accept"))
+    binario = calidades.get(TIPO_BINARIO, 0.0)
+    json_q = calidades.get(TIPO_JSON, calidades.get("application/*", calidades.get("*/*", 0.0)))
+    return binario > 0 and binario > json_q
+
+
+def empaquetar(series, meta=None):
+    """Bytes del formato binario: header JSON + arrays float32."""
+    arrays = {nombre: np.ascontiguousarray(valores, dtype="<f4") for nombre, valores in series.items()}
+    descripcion = {}
+    offset = 0
+    for nombre, a in arrays.items():
+        descripcion[nombre] = {"forma": list(a.shape), "offset": offset}
+        offset += a.nbytes
+    header = json.dumps({**(meta or {}), "dtype": "float32", "series": descripcion}).encode("utf-8")
+    header += b" " * (-len(header) % 4)
+    return b"".join([struct.pack("<I", len(header)), header, *(a.tobytes() for a in arrays.values())])
+
+
+def desempaquetar(datos):
+    """Inversa de `empaquetar`: (meta, {nombre: array float32})."""
+    largo, = struct.unpack_from("<I", datos)
+    meta = json.loads(datos[4:4 + largo])
+    inicio = 4 + largo
+    series = {}
+    for nombre, d in meta.pop("series").items():
+        n = int(np.prod(d["forma"]))
+        series[nombre] = np.frombuffer(datos, dtype="<f4", count=n, offset=inicio + d["offset"]).reshape(d["forma"])
+    meta.pop("dtype", None)
+    return meta, series
+
+
+def _a_lista(valores):
+    a = np.asarray(valores, dtype=float)
+    if np.all(np.isfinite(a)):
+        return a.tolist()
+    return np.where(np.isfinite(a), a, None).tolist()
+
+
+def respuesta_datos(request: Request, series, meta=None):
+    """
+    Respuesta con las `series` ({nombre: array}) y los metadatos `meta`
+    (valores JSON: títulos, unidades, etiquetas) en el formato que pida el cliente.
+    """
+    meta = meta or {}
+    cabeceras = {"Vary": "Accept"}
+    if prefiere_binario(request):
+        return Response(empaquetar(series, meta), media_type=TIPO_BINARIO, headers=cabeceras)
+    return JSONResponse({**meta, "series": {nombre: _a_lista(v) for nombre, v in series.items()}}, headers=cabeceras)
@@ -0,0 +1,54 @@
+# services/common/decimacion.py
+"""
+Reducción de los datos a graficar según el ancho en píxeles.
+
+Un gráfico de líneas no puede mostrar más de una columna de píxeles por
+muestra: con más muestras que píxeles, matplotlib dibuja (y Agg rasteriza)
+segmentos que caen todos en la misma columna. Acá cada serie se parte en
+tantos tramos como columnas tiene el eje y de cada tramo se conservan el
+mínimo y el máximo, en su orden temporal (envolvente min/max). La imagen queda
+igual (los picos se conservan, a diferencia de tomar una muestra cada k) y el
+costo de renderizar pasa a depender del ancho de la figura, no de la duración
+de la señal.
+"""
+import numpy as np
+
+
+def indices_minmax(y, tramos):
+    """
+    Índices (ordenados) del mínimo y del máximo de cada uno de `tramos` tramos
+    consecutivos de `y`, más la primera y la última muestra. Si `y` tiene a lo
+    sumo 2*tramos muestras devuelve todos los índices.
+    """
+    y = np.asarray(y)
+    n = len(y)
+    if tramos < 1 or n <= 2 * tramos:
+        return np.arange(n)
+    k = -(-n // tramos)
+    # Se completa el último tramo repitiendo la última muestra (no cambia su min/max)
+    bloques = np.pad(y, (0, tramos * k - n), mode="edge").reshape(tramos, k)
+    base = np.arange(tramos) * k
+    indices = np.concatenate([[0, n - 1], base + bloques.argmin(axis=1), base + bloques.argmax(axis=1)])
+    return np.unique(np.minimum(indices, n - 1))
+
+
+def reducir(x, y, pixeles):
+    """(x, y) reducidos a la envolvente min/max de `pixeles` columnas."""
+    indices = indices_minmax(y, pixeles)
+    if len(indices) == len(y):
+        return x, y
+    return np.asarray(x)[indices], np.asarray(y)[indices]
+
+
+def pixeles_ancho(ax):
+    """
+    Columnas de píxeles que puede ocupar el eje. Se toma el ancho de toda la
+    figura: `tight_layout` agranda los ejes después de graficar.
+    """
+    fig = ax.get_figure()
+    return int(np.ceil(fig.get_figwidth() * fig.dpi))
+
+
+def graficar(ax, x, y, *args, **kwargs):
+    """`ax.plot(x, y, ...)` con la serie reducida al ancho del eje."""
+    return ax.plot(*reducir(x, y, pixeles_ancho(ax)), *args, **kwargs)
@@ -0,0 +1,182 @@
+# services/common/ejecutor.py
+"""
+Ejecutor de trabajos pesados en un pool de procesos.
+
+Las simulaciones (FDM del TP6, procesamiento de imágenes del TP4) son CPU puro
+y bajo el GIL bloquean un hilo del threadpool por varios segundos. Acá se
+mandan a un ProcessPoolExecutor y los endpoints `async def` esperan el
+resultado sin frenar al resto de las requests.
+
+- Coalescencia: si N requests piden el mismo trabajo (misma clave) mientras
+  está corriendo, comparten una única ejecución.
+- Timeout: si el resultado no llega a tiempo se lanza `TrabajoDemorado` (los
+  routers lo responden como 504). El trabajo sigue en curso y un reintento se
+  engancha al mismo cálculo en lugar de lanzar otro.
+- Cancelación: si ya nadie espera un trabajo que todavía no arrancó, se cancela.
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from starlette.concurrency import run_in_threadpool
+
+JOBS_MAX_WORKERS = int(os.environ.get("JOBS_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))
+JOBS_TIMEOUT = float(os.environ.get("JOBS_TIMEOUT", "300"))
+# "spawn" evita heredar locks de hilos del proceso padre (fork + threads)
+JOBS_MP_CONTEXT = os.environ.get("JOBS_MP_CONTEXT", "spawn")
+
+
+class TrabajoDemorado(Exception):
+    """El resultado no llegó a tiempo; el trabajo sigue en curso."""
+
+
+class PoolInterrumpido(Exception):
+    """Un proceso del pool murió y el trabajo se perdió."""
+
+
+class _Trabajo:
+    def __init__(self, future, pool=None):
+        self.future = future
+        self.pool = pool
+        self.esperando = 0
+
+
+_pool = None
+_hilos = None
+_lock = threading.RLock()
+_en_curso = {}
+# Dentro de un proceso del pool: cuántos procesos tiene el pool (0 = proceso principal)
+_procesos_pool = 0
+
+
+def _iniciar_worker(procesos):
+    global _procesos_pool
+    _procesos_pool = procesos
+
+
+def hilos_por_proceso():
+    """
+    CPUs que puede usar un trabajo con hilos propios: todos en el proceso
+    principal; dentro del pool, repartidos entre sus procesos para no correr
+    procesos × CPUs hilos a la vez.
+    """
+    cpus = os.cpu_count() or 1
+    return max(1, cpus // _procesos_pool) if _procesos_pool else cpus
+
+
+def _obtener_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=JOBS_MAX_WORKERS,
+                mp_context=multiprocessing.get_context(JOBS_MP_CONTEXT),
+                initializer=_iniciar_worker,
+                initargs=(JOBS_MAX_WORKERS,),
+            )
+        return _pool
+
+
+def _executor_hilos():
+    global _hilos
+    with _lock:
+        if _hilos is None:
+            _hilos = ThreadPoolExecutor(max_workers=1)
+        return _hilos
+
+
+def _terminar(clave, trabajo):
+    with _lock:
+        if _en_curso.get(clave) is trabajo:
+            del _en_curso[clave]
+
+
+def _lanzar(clave, funcion, args):
+    with _lock:
+        trabajo = _en_curso.get(clave)
+        if trabajo is None:
+            if JOBS_MAX_WORKERS <= 0:
+                # Modo sin procesos (debug / entornos sin multiprocessing)
+                pool = None
+                future = _executor_hilos().submit(funcion, *args)
+            else:
+                pool = _obtener_pool()
+                future = pool.submit(funcion, *args)
+            trabajo = _Trabajo(future, pool)
+            _en_curso[clave] = trabajo
+            future.add_done_callback(lambda _f: _terminar(clave, trabajo))
+        trabajo.esperando += 1
+        return trabajo
+
+
+async def ejecutar(funcion, *args, clave=None, timeout=None):
+    """
+    Ejecuta `funcion(*args)` en el pool de procesos y devuelve su resultado.
+
+    La función y sus argumentos deben ser picklables (funciones de módulo).
+    `clave` identifica el trabajo para la coalescencia; por defecto se arma con
+    el nombre de la función y los argumentos.
+
+    Lanza `TrabajoDemorado` si vence el timeout y `PoolInterrumpido` si el
+    proceso que lo corría murió.
+    """
+    if clave is None:
+        clave = f"{funcion.__module__}.{funcion.__qualname__}{args!r}"
+    trabajo = _lanzar(clave, funcion, args)
+    try:
+        return await asyncio.wait_for(
+            asyncio.shield(asyncio.wrap_future(trabajo.future)),
+            timeout if timeout is not None else JOBS_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        raise TrabajoDemorado(f"El cálculo '{clave}' sigue en curso. Reintente en unos segundos.") from None
+    except BrokenProcessPool:
+        _reiniciar_pool(trabajo.pool)
+        raise PoolInterrumpido("El pool de procesos se interrumpió. Reintente.") from None
+    finally:
+        with _lock:
+            trabajo.esperando -= 1
+            if trabajo.esperando == 0 and not trabajo.future.done():
+                # Nadie más lo espera: si todavía está en cola no vale la pena correrlo
+                trabajo.future.cancel()
+
+
+async def renderizar(generar, *preparar):
+    """
+    Devuelve el PNG de `generar` (decorada con cache_png).
+    Si ya está en la caché de renders no se calcula nada; si no, se esperan
+    los datos (`preparar` son corrutinas sin argumentos, p. ej. la carga en el
+    pool) y se renderiza en un hilo para no bloquear el event loop.
+    """
+    en_cache = getattr(generar, "en_cache", None)
+    imagen = en_cache() if en_cache else None
+    if imagen is None:
+        for paso in preparar:
+            await paso()
+        imagen = await run_in_threadpool(generar)
+    return imagen
+
+
+def _reiniciar_pool(roto):
+    global _pool
+    with _lock:
+        # Cada request que esperaba en el pool roto llega acá: solo la primera lo reinicia
+        if roto is None or _pool is not roto:
+            return
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        for clave, trabajo in list(_en_curso.items()):
+            if trabajo.pool is roto:
+                del _en_curso[clave]
+
+
+def apagar():
+    """Cierra el pool (al apagar la aplicación)."""
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
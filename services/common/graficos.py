@@ -0,0 +1,33 @@
+# services/common/graficos.py
+"""
+Capa de graficación sin estado global de pyplot.
+
+Cada gráfico se arma sobre su propio `matplotlib.figure.Figure` con un canvas
+Agg, así varios hilos del threadpool de FastAPI pueden renderizar al mismo
+tiempo sin pisarse la "figura actual" de pyplot. No hace falta cerrar las
+figuras: no quedan registradas en ningún gestor y las libera el GC.
+"""
+import io
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+def nueva_figura(nrows=1, ncols=1, figsize=None, dpi=None, **kwargs):
+    """
+    Equivalente a `plt.subplots` pero sin pyplot.
+    Devuelve (fig, axs) con la misma forma que plt.subplots (squeeze incluido).
+    """
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    axs = fig.subplots(nrows, ncols, **kwargs)
+    return fig, axs
+
+
+def figura_a_png(fig, **kwargs):
+    """Renderiza la figura a un buffer PNG listo para StreamingResponse."""
+    buffer = io.BytesIO()
+    kwargs.setdefault("format", "png")
+    fig.savefig(buffer, **kwargs)
+    buffer.seek(0)
+    return buffer
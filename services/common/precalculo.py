@@ -0,0 +1,119 @@
+# services/common/precalculo.py
+"""
+Precálculo (warm-up) de los datos pesados al arrancar la aplicación.
+
+Los singletons de TP4/TP5 y las cachés `_cache_a.._cache_e` del TP6 se
+calculan con la primera request: después de cada deploy el primer usuario se
+come varios segundos de espera. Con el lifespan de FastAPI se lanzan todos en
+paralelo (en el pool de procesos de `ejecutor`) apenas arranca el servidor.
+
+Mientras un subsistema se está calentando sus endpoints responden 503 con
+Retry-After. Si el precálculo nunca se lanzó (p. ej. TestClient sin `with`) o
+falló, los endpoints siguen con el cálculo perezoso de siempre.
+"""
+import asyncio
+import os
+import time
+from importlib import import_module
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+PRECALCULO_ACTIVO = os.environ.get("PRECALCULO", "1") != "0"
+PRECALCULO_RETRY_AFTER = int(os.environ.get("PRECALCULO_RETRY_AFTER", "5"))
+
+PENDIENTE = "pendiente"
+CALENTANDO = "calentando"
+LISTO = "listo"
+ERROR = "error"
+
+
+async def _tp1():
+    from services.tp1 import inciso_3
+    await run_in_threadpool(inciso_3.obtener_potencias_banda)
+
+
+async def _tp4():
+    from services.tp4.core import processor
+    if await processor.get_data_async() is None:
+        raise RuntimeError(processor.get_logs())
+
+
+async def _tp5():
+    from services.tp4.core import processor as tp4_processor
+    from services.tp5.core import tp5_processor
+    await tp4_processor.get_data_async()
+    await run_in_threadpool(tp5_processor.get_integration_data)
+    await run_in_threadpool(tp5_processor.get_ode_data)
+
+
+def _tp6(inciso):
+    async def calentar():
+        await import_module(f"services.tp6.service_inciso_{inciso}").obtener_datos()
+    return calentar
+
+
+SUBSISTEMAS = {
+    "tp1.inciso_3": _tp1,
+    "tp4": _tp4,
+    "tp5": _tp5,
+    "tp6.a": _tp6("a"),
+    "tp6.b": _tp6("b"),
+    "tp6.c": _tp6("c"),
+    "tp6.d": _tp6("d"),
+    "tp6.e": _tp6("e"),
+}
+
+_estado = {nombre: {"estado": PENDIENTE} for nombre in SUBSISTEMAS}
+
+
+async def _calentar_uno(nombre):
+    _estado[nombre] = {"estado": CALENTANDO}
+    inicio = time.time()
+    try:
+        await SUBSISTEMAS[nombre]()
+    except Exception as e:
+        # Queda el cálculo perezoso: la próxima request lo vuelve a intentar
+        print(f"Precálculo {nombre} falló: {e}")
+        _estado[nombre] = {"estado": ERROR, "detalle": str(getattr(e, "detail", e))}
+        return
+    _estado[nombre] = {"estado": LISTO, "segundos": round(time.time() - inicio, 3)}
+
+
+async def calentar():
+    """Calcula todos los subsistemas en paralelo."""
+    await asyncio.gather(*(_calentar_uno(nombre) for nombre in SUBSISTEMAS))
+
+
+def iniciar():
+    """Lanza el precálculo en segundo plano. Devuelve la tarea (o None si está desactivado)."""
+    if not PRECALCULO_ACTIVO:
+        return None
+    for nombre in SUBSISTEMAS:
+        _estado[nombre] = {"estado": CALENTANDO}
+    return asyncio.create_task(calentar())
+
+
+def estado():
+    return {nombre: dict(info) for nombre, info in _estado.items()}
+
+
+def todo_listo():
+    """True si nada se está calentando (lo que no se precalculó queda perezoso)."""
+    return all(info["estado"] != CALENTANDO for info in _estado.values())
+
+
+def requiere_listo(*nombres):
+    """
+    Dependencia de FastAPI: 503 + Retry-After mientras alguno de los
+    subsistemas se esté calentando.
+    """
+    async def verificar():
+        calentando = [n for n in nombres if _estado[n]["estado"] == CALENTANDO]
+        if calentando:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Precalculando {', '.join(calentando)}. Reintente en unos segundos.",
+                headers={"Retry-After": str(PRECALCULO_RETRY_AFTER)},
+            )
+    return verificar
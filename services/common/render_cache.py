@@ -0,0 +1,322 @@
+# services/common/render_cache.py
+"""
+Caché de renders PNG direccionada por contenido.
+
+Cada gráfico se identifica por una clave que combina:
+  - la función que lo genera (módulo + nombre),
+  - los parámetros con los que se la llamó,
+  - la firma de los archivos de entrada (ruta, mtime, tamaño): los del disco
+    o, si el gráfico sale de datos ya cargados en memoria, los archivos con
+    los que se calcularon esos datos,
+  - la versión del código (hash del fuente de los módulos involucrados y de
+    los módulos del paquete que importan).
+
+Si cualquiera de esos elementos cambia, la clave cambia y el gráfico se
+vuelve a generar. Hay dos niveles: un LRU en memoria y un directorio en disco
+que sobrevive a los reinicios del proceso. El disco también tiene un tope
+(RENDER_CACHE_DISCO_MAX_MB): al pasarlo se borran los PNG usados hace más
+tiempo (la fecha de modificación se actualiza en cada lectura).
+"""
+import ast
+import glob
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+RENDER_CACHE_DIR = os.environ.get("RENDER_CACHE_DIR", os.path.join("data", "cache", "render"))
+RENDER_CACHE_MAX_ITEMS = int(os.environ.get("RENDER_CACHE_MAX_ITEMS", "128"))
+RENDER_CACHE_DISCO_MAX_MB = float(os.environ.get("RENDER_CACHE_DISCO_MAX_MB", "256"))
+RENDER_CACHE_ACTIVA = os.environ.get("RENDER_CACHE", "1") != "0"
+
+
+class ImagenPNG(io.BytesIO):
+    """BytesIO con el ETag del render, para poder responder 304 sin releer bytes."""
+
+    def __init__(self, contenido: bytes, etag: str):
+        super().__init__(contenido)
+        self.etag = etag
+
+
+_memoria: "OrderedDict[str, bytes]" = OrderedDict()
+_lock = threading.Lock()
+_versiones_codigo = {}
+_modulos_analizados = {}
+# Bytes escritos en el directorio de disco (estimado; None = todavía no se midió)
+_bytes_disco = None
+
+
+def _es_paquete(nombre):
+    try:
+        spec = importlib.util.find_spec(nombre)
+    except (ImportError, ValueError):
+        return False
+    return spec is not None and spec.submodule_search_locations is not None
+
+
+def _analizar_modulo(nombre):
+    """(hash del fuente, módulos importados) de un módulo, sin importarlo."""
+    try:
+        spec = importlib.util.find_spec(nombre)
+    except (ImportError, ValueError):
+        spec = None
+    origen = getattr(spec, "origin", None)
+    try:
+        with open(origen, encoding="utf-8") as f:
+            fuente = f.read()
+    except (OSError, TypeError):
+        return hashlib.sha256(nombre.encode("utf-8")).hexdigest(), ()
+    paquete = nombre if spec.submodule_search_locations is not None else nombre.rpartition(".")[0]
+    importados = []
+    # ast.walk también ve los imports dentro de funciones (imports diferidos)
+    for nodo in ast.walk(ast.parse(fuente)):
+        if isinstance(nodo, ast.Import):
+            importados.extend(alias.name for alias in nodo.names)
+        elif isinstance(nodo, ast.ImportFrom):
+            base = importlib.util.resolve_name("." * nodo.level + (nodo.module or ""), paquete) if nodo.level else nodo.module
+            importados.append(base)
+            # `from paquete import modulo`: el nombre importado puede ser un submódulo
+            if _es_paquete(base):
+                importados.extend(f"{base}.{alias.name}" for alias in nodo.names)
+    return hashlib.sha256(fuente.encode("utf-8")).hexdigest(), tuple(importados)
+
+
+def version_codigo(modulos):
+    """
+    Hash del código fuente de los módulos y de todo lo que importan dentro del
+    mismo paquete (transitivamente): un cambio en, p. ej., el filtro que usa el
+    pipeline cambia la clave de los gráficos que dependen de él. Se calcula una
+    sola vez por conjunto de módulos. También arma la clave del almacén del TP4.
+    """
+    clave = tuple(modulos)
+    if clave not in _versiones_codigo:
+        paquetes = {nombre.split(".")[0] for nombre in modulos}
+        pendientes = list(modulos)
+        hashes = {}
+        while pendientes:
+            nombre = pendientes.pop()
+            if nombre in hashes:
+                continue
+            if nombre not in _modulos_analizados:
+                _modulos_analizados[nombre] = _analizar_modulo(nombre)
+            hashes[nombre], importados = _modulos_analizados[nombre]
+            pendientes.extend(m for m in importados if m.split(".")[0] in paquetes and m not in hashes)
+        h = hashlib.sha256()
+        for nombre in sorted(hashes):
+            h.update(f"{nombre}:{hashes[nombre]}".encode())
+        _versiones_codigo[clave] = h.hexdigest()
+    return _versiones_codigo[clave]
+
+
+def firma_archivos(rutas):
+    """(ruta, mtime_ns, tamaño) de cada archivo (los que ya no existen se omiten)."""
+    firma = []
+    for ruta in rutas:
+        try:
+            st = os.stat(ruta)
+        except OSError:
+            continue
+        firma.append((ruta, st.st_mtime_ns, st.st_size))
+    return firma
+
+
+def firma_entradas(patrones):
+    """(ruta, mtime_ns, tamaño) de cada archivo que matchea los patrones glob."""
+    return [f for patron in patrones for f in firma_archivos(sorted(glob.glob(patron)))]
+
+
+def _clave(funcion, args, kwargs, entradas, modulos):
+    contenido = json.dumps({
+        "funcion": f"{funcion.__module__}.{funcion.__qualname__}",
+        "args": repr(args),
+        "kwargs": repr(sorted(kwargs.items())),
+        "entradas": entradas() if callable(entradas) else firma_entradas(entradas),
+        "codigo": version_codigo((funcion.__module__, *modulos)),
+    }, sort_keys=True)
+    return hashlib.sha256(contenido.encode("utf-8")).hexdigest()
+
+
+def _etag(clave):
+    return f'"{clave[:32]}"'
+
+
+def _leer_memoria(clave):
+    with _lock:
+        datos = _memoria.get(clave)
+        if datos is not None:
+            _memoria.move_to_end(clave)
+        return datos
+
+
+def _guardar_memoria(clave, datos):
+    with _lock:
+        _memoria[clave] = datos
+        _memoria.move_to_end(clave)
+        while len(_memoria) > RENDER_CACHE_MAX_ITEMS:
+            _memoria.popitem(last=False)
+
+
+def _ruta_disco(clave):
+    return os.path.join(RENDER_CACHE_DIR, clave[:2], f"{clave}.png")
+
+
+def _leer_disco(clave):
+    ruta = _ruta_disco(clave)
+    try:
+        with open(ruta, "rb") as f:
+            datos = f.read()
+    except OSError:
+        return None
+    try:
+        # La mtime marca el último uso: es lo que ordena el borrado por LRU
+        # (con ns explícitos: utime sin tiempos usa un reloj de grano grueso)
+        ahora = time.time_ns()
+        os.utime(ruta, ns=(ahora, ahora))
+    except OSError:
+        pass
+    return datos
+
+
+def _archivos_disco():
+    """(mtime, tamaño, ruta) de cada PNG del directorio de disco."""
+    archivos = []
+    for ruta in glob.glob(os.path.join(RENDER_CACHE_DIR, "*", "*.png")):
+        try:
+            st = os.stat(ruta)
+        except OSError:
+            continue
+        archivos.append((st.st_mtime_ns, st.st_size, ruta))
+    return archivos
+
+
+def _podar_disco(agregados):
+    """
+    Suma `agregados` bytes al total y, si pasa el tope, borra los PNG menos
+    usados hasta quedar en el 90 %. El total se vuelve a medir del disco al
+    podar, así que otros procesos que comparten el directorio no lo desfasan.
+    """
+    global _bytes_disco
+    tope = RENDER_CACHE_DISCO_MAX_MB * 1024 * 1024
+    with _lock:
+        if _bytes_disco is None:
+            _bytes_disco = sum(tam for _, tam, _ in _archivos_disco())
+        else:
+            _bytes_disco += agregados
+        if _bytes_disco <= tope:
+            return
+        archivos = sorted(_archivos_disco())
+        total = sum(tam for _, tam, _ in archivos)
+        for _, tam, ruta in archivos:
+            if total <= 0.9 * tope:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                continue
+            total -= tam
+        _bytes_disco = total
+
+
+def _guardar_disco(clave, datos):
+    ruta = _ruta_disco(clave)
+    try:
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        # Escritura atómica: otro proceso nunca ve un PNG a medio escribir
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(datos)
+        os.replace(tmp, ruta)
+    except OSError:
+        # El disco es un nivel opcional: si falla seguimos con la memoria
+        return
+    _podar_disco(len(datos))
+
+
+def _buscar(clave):
+    datos = _leer_memoria(clave)
+    if datos is None:
+        datos = _leer_disco(clave)
+        if datos is not None:
+            _guardar_memoria(clave, datos)
+    return ImagenPNG(datos, _etag(clave)) if datos is not None else None
+
+
+def cache_png(entradas=(), modulos=()):
+    """
+    Decorador para funciones que devuelven un buffer PNG (BytesIO).
+
+    entradas: patrones glob de los archivos de datos que usa el gráfico, o una
+              función sin argumentos que devuelve la firma (ver firma_archivos)
+              cuando el gráfico sale de datos en memoria que se actualizan
+              aparte del disco.
+    modulos: módulos extra cuyo código afecta el resultado (p. ej. el core que
+             procesa los datos), además del módulo de la propia función.
+
+    Si la función devuelve None (error, sin datos) no se cachea nada.
+    """
+    def decorador(funcion):
+        def en_cache(*args, **kwargs):
+            """Devuelve el render cacheado o None, sin ejecutar la función."""
+            if not RENDER_CACHE_ACTIVA:
+                return None
+            return _buscar(_clave(funcion, args, kwargs, entradas, modulos))
+
+        @wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not RENDER_CACHE_ACTIVA:
+                return funcion(*args, **kwargs)
+
+            clave = _clave(funcion, args, kwargs, entradas, modulos)
+            imagen = _buscar(clave)
+            if imagen is not None:
+                return imagen
+
+            buf = funcion(*args, **kwargs)
+            if buf is None:
+                return None
+            datos = buf.getvalue()
+            _guardar_memoria(clave, datos)
+            _guardar_disco(clave, datos)
+            return ImagenPNG(datos, _etag(clave))
+
+        envoltura.en_cache = en_cache
+        return envoltura
+    return decorador
+
+
+def invalidar():
+    """Vacía el nivel en memoria. El disco se invalida solo al cambiar la clave."""
+    with _lock:
+        _memoria.clear()
+
+
+def _etag_coincide(request: Request, etag: str) -> bool:
+    cabecera = request.headers.get("if-none-match")
+    if not cabecera:
+        return False
+    candidatos = [c.strip() for c in cabecera.split(",")]
+    return "*" in candidatos or etag in candidatos or f"W/{etag}" in candidatos
+
+
+def respuesta_png(request: Request, imagen):
+    """
+    Respuesta HTTP para un buffer PNG. Si el buffer viene de la caché y el
+    cliente ya tiene esa versión (If-None-Match), devuelve 304 sin cuerpo.
+    """
+    etag = getattr(imagen, "etag", None)
+    if etag is None:
+        return StreamingResponse(imagen, media_type="image/png")
+
+    cabeceras = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_coincide(request, etag):
+        return Response(status_code=304, headers=cabeceras)
+    return Response(content=imagen.getvalue(), media_type="image/png", headers=cabeceras)
@@ -0,0 +1,39 @@
+# services/tp1/autocorrelacion.py
+"""
+Autocorrelación por FFT (Wiener-Khinchin) truncada a un retardo máximo.
+
+`np.correlate(x, x, 'full')` es O(N²) y calcula los 2N-1 retardos aunque el
+inciso 4 solo grafica los primeros 2 s. Acá se hace con rfft/irfft sobre la
+señal rellenada con ceros (sin el relleno la correlación sería circular) y se
+devuelven solo los retardos 0..max_lag: O(N log N). Acepta varias señales a
+la vez (una por fila) y las transforma en una sola llamada.
+"""
+import numpy as np
+from scipy.fft import irfft, next_fast_len, rfft
+
+
+def autocorrelacion(x, max_lag=None, normalizar=True):
+    """
+    Autocorrelación de `x` (1-D, o 2-D con una señal por fila) para los
+    retardos 0..max_lag. Con `normalizar` cada fila se divide por su valor en
+    el retardo 0, igual que `np.correlate` dividido por su máximo.
+    """
+    x = np.asarray(x, dtype=float)
+    n = x.shape[-1]
+    max_lag = n - 1 if max_lag is None else int(min(max(max_lag, 0), n - 1))
+    # Con al menos N + max_lag puntos la parte circular no alcanza a los retardos pedidos
+    nfft = next_fast_len(n + max_lag, real=True)
+    espectro = rfft(x, nfft, axis=-1)
+    r = irfft(espectro.real ** 2 + espectro.imag ** 2, nfft, axis=-1)[..., :max_lag + 1]
+    if normalizar:
+        cero = r[..., :1]
+        r = np.divide(r, cero, out=np.zeros_like(r), where=cero != 0)
+    return r
+
+
+def autocorrelacion_senales(senales, fs, max_lag_s=None):
+    """(retardos [s], matriz con una autocorrelación normalizada por señal)."""
+    senales = np.vstack([np.asarray(s, dtype=float) for s in senales])
+    max_lag = None if max_lag_s is None else int(np.ceil(max_lag_s * fs))
+    r = autocorrelacion(senales, max_lag)
+    return np.arange(r.shape[-1]) / fs, r
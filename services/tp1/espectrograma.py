@@ -0,0 +1,123 @@
+# services/tp1/espectrograma.py
+"""
+Espectrograma por ventanas deslizantes y potencia por banda en streaming.
+
+Los incisos analizan una sola ventana de 4097 muestras con una FFT global.
+Para hacer screening de convulsiones sobre grabaciones largas la señal se
+recorre en ventanas solapadas (STFT con ventana de Hann; con `segmento` menor
+que la ventana cada una se estima por Welch) y se emite la potencia de cada
+banda por ventana, a medida que se calcula.
+
+La entrada puede ser un array (p. ej. la vista mmap del repositorio de
+señales) o cualquier iterable de bloques: en memoria nunca hay más que una
+ventana más un bloque, sin importar cuánto dure la grabación.
+"""
+import json
+
+import numpy as np
+from scipy.signal import get_window, welch
+
+from services.tp1.inciso_3 import BANDAS
+
+# Las bandas del inciso 3 más gamma (la misma que usa el inciso 4)
+BANDAS_EEG = {**BANDAS, "Gamma": (30, 50)}
+# Muestras que se leen por bloque cuando la entrada es un array
+MUESTRAS_POR_BLOQUE = 1 << 16
+
+
+def bloques(senal, tam=MUESTRAS_POR_BLOQUE):
+    """Recorre un array (mmap incluido) en bloques, sin copiarlo entero."""
+    for inicio in range(0, len(senal), tam):
+        yield senal[inicio:inicio + tam]
+
+
+def ventanas(fuente, n, paso):
+    """
+    Generador de (índice, ventana de n muestras) avanzando de a `paso`.
+    `fuente` es un array o un iterable de bloques 1-D. La cola que no llega a
+    completar una ventana se descarta.
+    """
+    if isinstance(fuente, np.ndarray):
+        fuente = bloques(fuente)
+    buffer = np.empty(0)
+    i = 0
+    for bloque in fuente:
+        buffer = np.concatenate([buffer, np.asarray(bloque, dtype=float)])
+        inicio = 0
+        while inicio + n <= len(buffer):
+            yield i, buffer[inicio:inicio + n]
+            i += 1
+            inicio += paso
+        # Se conserva solo lo que todavía puede formar parte de una ventana
+        buffer = buffer[inicio:]
+
+
+class EstimadorBandas:
+    """PSD de una ventana (Hann) integrada por banda. Máscaras y ventana se arman una vez."""
+
+    def __init__(self, fs, n, bandas=BANDAS_EEG, segmento=None):
+        self.fs = fs
+        self.n = n
+        self.segmento = segmento if segmento and segmento < n else None
+        m = self.segmento or n
+        self.frecuencias = np.fft.rfftfreq(m, 1 / fs)
+        self.df = fs / m
+        self.mascaras = {banda: (self.frecuencias >= low) & (self.frecuencias <= high)
+                         for banda, (low, high) in bandas.items()}
+        self._hann = get_window("hann", n)
+        # Densidad espectral de un lado (misma escala que scipy.signal.welch)
+        self._escala = 2.0 / (fs * np.sum(self._hann ** 2))
+
+    def psd(self, x):
+        if self.segmento:
+            return welch(x, self.fs, window="hann", nperseg=self.segmento)[1]
+        x = (x - np.mean(x)) * self._hann
+        p = np.abs(np.fft.rfft(x)) ** 2 * self._escala
+        p[0] /= 2
+        if self.n % 2 == 0:
+            p[-1] /= 2
+        return p
+
+    def potencias(self, x):
+        p = self.psd(x)
+        return {banda: float(np.sum(p[mascara]) * self.df) for banda, mascara in self.mascaras.items()}
+
+
+def validar_ventana(fs, ventana, solapamiento):
+    """(muestras por ventana, paso); ValueError si los parámetros no cierran."""
+    n = int(round(ventana * fs))
+    if n < 8:
+        raise ValueError("La ventana debe abarcar al menos 8 muestras.")
+    if not 0 <= solapamiento < 1:
+        raise ValueError("El solapamiento debe estar en [0, 1).")
+    return n, max(1, int(round(n * (1 - solapamiento))))
+
+
+def potencias_por_ventana(fuente, fs, ventana=2.0, solapamiento=0.5, segmento=None, bandas=BANDAS_EEG):
+    """
+    Generador de un dict por ventana: índice, tiempo de inicio/fin [s] y la
+    potencia de cada banda (integral de la PSD, u.a.²).
+
+    ventana: duración de cada ventana [s]; solapamiento: fracción en [0, 1);
+    segmento: duración [s] de los segmentos de Welch dentro de la ventana
+    (None = periodograma de la ventana completa).
+    """
+    n, paso = validar_ventana(fs, ventana, solapamiento)
+    estimador = EstimadorBandas(fs, n, bandas, int(round(segmento * fs)) if segmento else None)
+
+    for i, x in ventanas(fuente, n, paso):
+        inicio = i * paso / fs
+        yield {"ventana": i, "t_inicio": inicio, "t_fin": inicio + n / fs, **estimador.potencias(x)}
+
+
+def ndjson_potencias(fuente, fs, **kwargs):
+    """Líneas NDJSON con las potencias de cada ventana y un resumen final."""
+    total = 0
+    try:
+        for fila in potencias_por_ventana(fuente, fs, **kwargs):
+            total += 1
+            yield json.dumps(fila) + "\n"
+    except ValueError as e:
+        yield json.dumps({"error": str(e)}) + "\n"
+        return
+    yield json.dumps({"fin": True, "ventanas": total, "fs": fs}) + "\n"
@@ -0,0 +1,166 @@
+# services/tp1/filtros.py
+"""
+Filtros FIR parametrizables para las señales EEG del TP1.
+
+El diseño del kernel (sinc × ventana) se rehacía en cada llamada al filtro. Acá
+hay un banco de kernels que guarda cada diseño por sus parámetros (tipo,
+cortes, taps, ventana, fs) en un LRU acotado: diseñar un filtro una segunda vez
+es un lookup. Para kernels largos la convolución se hace por FFT
+(overlap-add, `oaconvolve`); para kernels cortos la directa sigue siendo más
+rápida.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from scipy.signal import firwin, freqz, oaconvolve
+
+from services.common.decimacion import graficar
+from services.common.graficos import nueva_figura, figura_a_png
+from services.common.render_cache import cache_png
+
+TP1_KERNELS_MAX = int(os.environ.get("TP1_KERNELS_MAX", "64"))
+# A partir de cuántos taps conviene convolucionar por FFT (medido: con 4k-200k
+# muestras la directa gana hasta ~300 taps y pierde por 2-10x desde ~1000)
+TP1_FFT_TAPS = int(os.environ.get("TP1_FFT_TAPS", "512"))
+TP1_FILTROS_MAX_TAPS = int(os.environ.get("TP1_FILTROS_MAX_TAPS", "8191"))
+
+TIPOS = ("pasa_bajos", "pasa_altos", "pasa_banda", "rechaza_banda")
+VENTANAS = ("hamming", "hann", "blackman", "blackmanharris", "bartlett", "boxcar")
+
+
+def validar_parametros(tipo, cortes, num_taps, ventana, fs):
+    """Normaliza los cortes a una tupla y lanza ValueError si algo no cierra."""
+    if tipo not in TIPOS:
+        raise ValueError(f"Tipo de filtro desconocido '{tipo}'. Opciones: {', '.join(TIPOS)}.")
+    if ventana not in VENTANAS:
+        raise ValueError(f"Ventana desconocida '{ventana}'. Opciones: {', '.join(VENTANAS)}.")
+    if not 3 <= num_taps <= TP1_FILTROS_MAX_TAPS:
+        raise ValueError(f"La cantidad de taps debe estar entre 3 y {TP1_FILTROS_MAX_TAPS}.")
+    cortes = tuple(float(c) for c in np.atleast_1d(cortes))
+    esperados = 2 if tipo in ("pasa_banda", "rechaza_banda") else 1
+    if len(cortes) != esperados:
+        raise ValueError(f"El filtro {tipo} necesita {esperados} frecuencia(s) de corte.")
+    if any(not 0 < c < fs / 2 for c in cortes):
+        raise ValueError(f"Las frecuencias de corte deben estar entre 0 y fs/2 = {fs / 2:.2f} Hz.")
+    if esperados == 2 and cortes[0] >= cortes[1]:
+        raise ValueError("En un filtro de banda el corte inferior debe ser menor que el superior.")
+    if tipo in ("pasa_altos", "rechaza_banda") and num_taps % 2 == 0:
+        # Un FIR tipo II (taps pares) tiene un cero en fs/2: no puede dejar pasar las altas
+        raise ValueError(f"El filtro {tipo} necesita una cantidad impar de taps.")
+    return cortes
+
+
+def disenar_kernel(tipo, cortes, num_taps, ventana, fs):
+    """Kernel FIR por el método de ventanas (ganancia unitaria en la banda de paso)."""
+    cortes = validar_parametros(tipo, cortes, num_taps, ventana, fs)
+    pasa_cero = tipo in ("pasa_bajos", "rechaza_banda")
+    return firwin(num_taps, cortes, window=ventana, pass_zero=pasa_cero, fs=fs)
+
+
+class BancoKernels:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._kernels = OrderedDict()
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def obtener(self, clave, disenar):
+        """Kernel guardado bajo `clave`; si no está lo diseña con `disenar()` y lo guarda."""
+        with self._lock:
+            h = self._kernels.get(clave)
+            if h is not None:
+                self._kernels.move_to_end(clave)
+                return h
+        h = np.asarray(disenar(), dtype=float)
+        h.flags.writeable = False
+        with self._lock:
+            self._kernels[clave] = h
+            self._kernels.move_to_end(clave)
+            while len(self._kernels) > TP1_KERNELS_MAX:
+                self._kernels.popitem(last=False)
+        return h
+
+    def kernel(self, tipo, cortes, num_taps, ventana, fs):
+        cortes = validar_parametros(tipo, cortes, num_taps, ventana, fs)
+        return self.obtener(
+            ("fir", tipo, cortes, num_taps, ventana, fs),
+            lambda: disenar_kernel(tipo, cortes, num_taps, ventana, fs),
+        )
+
+    def vaciar(self):
+        with self._lock:
+            self._kernels.clear()
+
+
+banco = BancoKernels()
+
+
+def aplicar_kernel(data, h):
+    """Convolución 'same': por FFT (overlap-add) para kernels largos, directa para cortos."""
+    # np.convolve 'same' devuelve max(len(data), len(h)) muestras: con una señal
+    # más corta que el kernel se usa oaconvolve, que respeta el largo de la señal
+    if len(h) >= TP1_FFT_TAPS or len(h) > np.shape(data)[-1]:
+        return oaconvolve(data, h, mode="same")
+    return np.convolve(data, h, mode="same")
+
+
+def filtrar(data, tipo, cortes, num_taps, ventana, fs):
+    return aplicar_kernel(np.asarray(data, dtype=float), banco.kernel(tipo, cortes, num_taps, ventana, fs))
+
+
+def datos_grafico_filtro(nombre, tipo, cortes, num_taps, ventana):
+    """Series del gráfico del filtro: señal original/filtrada y respuesta en frecuencia [dB]."""
+    from services.tp1.pipeline import pipeline
+
+    fs = pipeline.fs(nombre)
+    senal = pipeline.senal(nombre)
+    h = banco.kernel(tipo, cortes, num_taps, ventana, fs)
+    f, respuesta = freqz(h, worN=2048, fs=fs)
+    series = {
+        "t": np.arange(len(senal)) / fs,
+        "original": senal,
+        "filtrada": aplicar_kernel(np.asarray(senal, dtype=float), h),
+        "frecuencia": f,
+        "respuesta_db": 20 * np.log10(np.maximum(np.abs(respuesta), 1e-12)),
+    }
+    meta = {"senal": nombre, "fs": fs, "tipo": tipo, "cortes": list(cortes), "taps": num_taps, "ventana": ventana,
+            "unidades": {"t": "s", "frecuencia": "Hz", "respuesta_db": "dB"}}
+    return series, meta
+
+
+@cache_png(entradas=(os.path.join("data", "tp1", "Signal_*.txt"),), modulos=("services.tp1.pipeline", "services.common.decimacion"))
+def generar_grafico_filtro(nombre, tipo, cortes, num_taps, ventana):
+    """Señal original vs filtrada y respuesta en frecuencia del kernel."""
+    from services.tp1.pipeline import pipeline
+
+    fs = pipeline.fs(nombre)
+    senal = pipeline.senal(nombre)
+    h = banco.kernel(tipo, cortes, num_taps, ventana, fs)
+    filtrada = aplicar_kernel(np.asarray(senal, dtype=float), h)
+    t = np.arange(len(senal)) / fs
+    f, respuesta = freqz(h, worN=2048, fs=fs)
+
+    fig, axs = nueva_figura(2, 1, figsize=(15, 8))
+    graficar(axs[0], t, senal, label="Original", color="black", alpha=0.5, linewidth=1.0)
+    graficar(axs[0], t, filtrada, label="Filtrada", color="tab:blue", linewidth=1.5)
+    axs[0].set_title(f"{nombre} - {tipo} {', '.join(f'{c:g}' for c in cortes)} Hz ({num_taps} taps, {ventana})")
+    axs[0].set_xlabel("Tiempo [s]")
+    axs[0].set_ylabel("Amplitud")
+    axs[0].legend(loc="upper right")
+
+    axs[1].plot(f, 20 * np.log10(np.maximum(np.abs(respuesta), 1e-12)), color="tab:red")
+    for c in cortes:
+        axs[1].axvline(x=c, color="gray", linestyle="--", linewidth=1)
+    axs[1].set_ylim(-120, 10)
+    axs[1].set_title("Respuesta en frecuencia del filtro")
+    axs[1].set_xlabel("Frecuencia [Hz]")
+    axs[1].set_ylabel("Magnitud [dB]")
+    axs[1].grid(True)
+
+    fig.tight_layout()
+    return figura_a_png(fig)
@@ -1,16 +1,18 @@
 # services.tp1/inciso_1.py
 
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.signal import convolve
 import math as mt
-import io
 import os
 from scipy.fft import fft, fftfreq
+from services.common.render_cache import cache_png
+from services.common.decimacion import graficar
+from services.common.graficos import nueva_figura, figura_a_png
+from services.tp1.senales import repositorio
+from services.tp1.pipeline import SENALES, pipeline
 
 fs = 173.61
 cutoff = 40.0
-NUM_TAPS = 301
+ENTRADAS = (os.path.join("data", "tp1", "Signal_*.txt"),)
 
 ETAPAS = {
     0: 'Registro sano',
@@ -19,28 +21,21 @@ ETAPAS = {
 }
 
 def cargar_senal(nombre_archivo):
-    ruta = os.path.join("data", "tp1", nombre_archivo)
-    with open(ruta, 'r') as f:
-        return np.array([float(line.strip()) for line in f if line.strip()])
-
-def filtro_pasa_bajos(data, cutoff, fs, num_taps=NUM_TAPS):
-    fc = cutoff / (fs / 2)
-    h = np.sinc(2 * fc * (np.arange(num_taps) - (num_taps - 1) / 2))
-    h *= np.hamming(num_taps)
-    h /= np.sum(h)
-    return convolve(data, h, mode='same')
+    # Vista float32 (mmap) del .npy convertido una única vez desde el .txt
+    return repositorio.cargar(os.path.join("data", "tp1", nombre_archivo))
 
+@cache_png(entradas=ENTRADAS, modulos=("services.tp1.pipeline", "services.common.decimacion"))
 def generar_grafico_comparativo():
     # Cargar señales
-    senales = [cargar_senal(f"Signal_{i}.txt") for i in range(1, 4)]
+    senales = [pipeline.senal(nombre) for nombre in SENALES]
     t = np.arange(len(senales[0])) / fs
-    senales_filtradas = [filtro_pasa_bajos(s, cutoff, fs) for s in senales]
+    senales_filtradas = [pipeline.filtrada(nombre, cutoff) for nombre in SENALES]
 
     # Graficar comparativa
-    fig, axs = plt.subplots(3, 1, figsize=(15, 8))
+    fig, axs = nueva_figura(3, 1, figsize=(15, 8))
     for i in range(3):
-        axs[i].plot(t, senales[i], label='Original', color='black', alpha=0.5, linewidth=1.0)
-        axs[i].plot(t, senales_filtradas[i], label=f'Filtrada (Low-pass {mt.ceil(cutoff)} Hz)', color='tab:blue', linewidth=1.5)
+        graficar(axs[i], t, senales[i], label='Original', color='black', alpha=0.5, linewidth=1.0)
+        graficar(axs[i], t, senales_filtradas[i], label=f'Filtrada (Low-pass {mt.ceil(cutoff)} Hz)', color='tab:blue', linewidth=1.5)
         axs[i].set_title(f"Señal {i + 1} ({ETAPAS[i]}) - Comparativa")
         axs[i].set_xlabel("Tiempo [s]")
         axs[i].set_ylabel("Amplitud")
@@ -49,11 +44,16 @@ def generar_grafico_comparativo():
     fig.tight_layout()
 
     # Guardar en buffer
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
+
+def datos_grafico_comparativo():
+    """Series del gráfico comparativo (una fila por señal) para dibujar en el cliente."""
+    senales = np.vstack([pipeline.senal(nombre) for nombre in SENALES])
+    filtradas = np.vstack([pipeline.filtrada(nombre, cutoff) for nombre in SENALES])
+    series = {"t": np.arange(senales.shape[1]) / fs, "original": senales, "filtrada": filtradas}
+    meta = {"etapas": list(ETAPAS.values()), "fs": fs, "cutoff": cutoff,
+            "unidades": {"t": "s", "original": "u.a.", "filtrada": "u.a."}}
+    return series, meta
 
 def calcular_fft(senal, fs):
     n = len(senal)
@@ -61,13 +61,12 @@ def calcular_fft(senal, fs):
     xf = fftfreq(n, 1/fs)[:n//2]
     return xf, 2.0/n * np.abs(yf[0:n//2]) # type: ignore
 
+@cache_png(entradas=ENTRADAS, modulos=("services.tp1.pipeline",))
 def generar_grafico_fft_lineas():
-    senales = [cargar_senal(f"Signal_{i}.txt") for i in range(1, 4)]
-    senales_filtradas = [filtro_pasa_bajos(s, cutoff, fs) for s in senales]
-    ffts = [calcular_fft(s, fs) for s in senales_filtradas]
+    ffts = [pipeline.magnitud(nombre, cutoff) for nombre in SENALES]
     band_limits = [4, 8, 13, 30]
 
-    fig, axs = plt.subplots(3, 1, figsize=(15, 8))
+    fig, axs = nueva_figura(3, 1, figsize=(15, 8))
     for i, (xf, yf) in enumerate(ffts):
         mask = xf <= 40
         axs[i].plot(xf[mask], yf[mask])
@@ -80,23 +79,27 @@ def generar_grafico_fft_lineas():
             axs[i].axvline(x=limit, color='red', linestyle='--', linewidth=1)
 
     fig.tight_layout()
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
-
+    return figura_a_png(fig)
+
+def datos_grafico_fft():
+    """Espectros de los gráficos 2 y 3 (hasta el corte, una fila por señal)."""
+    ffts = [pipeline.magnitud(nombre, cutoff) for nombre in SENALES]
+    mask = ffts[0][0] <= 40
+    series = {"frecuencia": ffts[0][0][mask], "magnitud": np.vstack([yf[mask] for _, yf in ffts])}
+    meta = {"etapas": list(ETAPAS.values()), "limites_bandas": [4, 8, 13, 30],
+            "unidades": {"frecuencia": "Hz", "magnitud": "u.a."}}
+    return series, meta
+
+@cache_png(entradas=ENTRADAS, modulos=("services.tp1.pipeline",))
 def generar_grafico_fft_tallo():
-    senales = [cargar_senal(f"Signal_{i}.txt") for i in range(1, 4)]
-    senales_filtradas = [filtro_pasa_bajos(s, cutoff, fs) for s in senales]
-    ffts = [calcular_fft(s, fs) for s in senales_filtradas]
+    ffts = [pipeline.magnitud(nombre, cutoff) for nombre in SENALES]
     band_limits = [4, 8, 13, 30]
 
-    fig, axs = plt.subplots(3, 1, figsize=(15, 8))
+    fig, axs = nueva_figura(3, 1, figsize=(15, 8))
     for i, (xf, yf) in enumerate(ffts):
         mask = xf <= 40
         markerline, stemlines, baseline = axs[i].stem(xf[mask], yf[mask], linefmt='tab:blue', markerfmt=' ', basefmt=' ')
-        plt.setp(stemlines, linewidth=1.5)
+        stemlines.set_linewidth(1.5)
         axs[i].set_title(f"Señal {i + 1} ({ETAPAS[i]}) - FFT (Tallo)")
         axs[i].set_xlabel("Frecuencia [Hz]")
         axs[i].set_ylabel("Magnitud [u.a.]")
@@ -106,11 +109,7 @@ def generar_grafico_fft_tallo():
             axs[i].axvline(x=limit, color='red', linestyle='--', linewidth=1)
 
     fig.tight_layout()
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
 
 EXPLICACION_FRECUENCIAS = """
 🧠 Frecuencias características en señales EEG:
@@ -166,9 +165,7 @@ def obtener_etapas():
     return ETAPAS
 
 def cargar_senales_filtradas():
-    senales = [cargar_senal(f"Signal_{i}.txt") for i in range(1, 4)]
-    senales_filtradas = [filtro_pasa_bajos(s, cutoff, fs) for s in senales]
-    return senales_filtradas
+    return [pipeline.filtrada(nombre, cutoff) for nombre in SENALES]
 
 CONSIGNA = """
 1. Investigar y detallar cuales son las frecuencias características que varían dependiendo de la etapa observadas
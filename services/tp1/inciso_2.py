@@ -1,13 +1,12 @@
 # services/tp1/inciso_2.py
 import os
-import io
 import math as mt
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
-
-# Configurar backend no interactivo para servidor
-matplotlib.use('Agg')
+from services.common.render_cache import cache_png
+from services.common.decimacion import graficar
+from services.common.graficos import nueva_figura, figura_a_png
+from services.tp1.senales import repositorio
+from services.tp1.pipeline import SENALES, pipeline
 
 # --- Constantes y Configuración ---
 fs = 173.61  # Frecuencia de muestreo
@@ -74,8 +73,7 @@ def cargar_senal(nombre_archivo):
         # Fallback por si la ruta no es correcta, intenta en el directorio actual
         path = nombre_archivo 
         
-    with open(path, 'r') as f:
-        return np.array([float(line.strip()) for line in f if line.strip()])
+    return repositorio.cargar(path)
 
 def filtro_pasa_bajos(data, cutoff, fs, num_taps=301):
     """Filtro pasa bajos FIR usando ventana de Hamming."""
@@ -85,6 +83,24 @@ def filtro_pasa_bajos(data, cutoff, fs, num_taps=301):
     h /= np.sum(h)
     return np.convolve(data, h, mode='same')
 
+def datos_grafico_zoom():
+    """
+    Series del gráfico de zoom (primer segundo, una fila por señal): la
+    original desplazada, la filtrada y su diferencia, como se grafican.
+    """
+    senales = np.vstack([pipeline.senal(nombre) for nombre in SENALES])
+    filtradas = np.vstack([pipeline.filtrada(nombre, CUTOFF) for nombre in SENALES])
+    t = np.arange(senales.shape[1]) / fs
+    mask = t < 1
+    originales = senales[:, mask]
+    desplazamientos = 0.1 * np.std(originales, axis=1)
+    desplazadas = originales + desplazamientos[:, None]
+    series = {"t": t[mask], "original_desplazada": desplazadas, "filtrada": filtradas[:, mask],
+              "diferencia": desplazadas - filtradas[:, mask]}
+    meta = {"etapas": list(ETAPAS.values()), "desplazamientos": desplazamientos.tolist(), "unidades": {"t": "s"}}
+    return series, meta
+
+@cache_png(entradas=(os.path.join(DATA_PATH, "Signal_*.txt"),), modulos=("services.tp1.pipeline", "services.common.decimacion"))
 def generar_grafico_zoom_img():
     """
     Genera el gráfico de zoom (1 segundo) comparando señal original vs filtrada.
@@ -92,51 +108,44 @@ def generar_grafico_zoom_img():
     """
     # 1. Cargar datos
     try:
-        senales = [cargar_senal(f'Signal_{i}.txt') for i in range(1, 4)]
+        senales = [pipeline.senal(nombre) for nombre in SENALES]
+        senales_filtradas = [pipeline.filtrada(nombre, CUTOFF) for nombre in SENALES]
     except FileNotFoundError:
         # Retornar una imagen vacía o error si no hay datos (o manejar con excepción HTTP en router)
         return None
 
     t = np.arange(len(senales[0])) / fs
-    
-    # 2. Filtrar
-    senales_filtradas = [filtro_pasa_bajos(s, CUTOFF, fs) for s in senales]
 
-    # 3. Recortar ventana (t < 1 segundo)
+    # 2. Recortar ventana (t < 1 segundo)
     mask = t < 1
     t_ventana = t[mask]
     senales_ventana = [s[mask] for s in senales]
     filtradas_ventana = [s[mask] for s in senales_filtradas]
 
-    # 4. Graficar
-    fig = plt.figure(figsize=(15, 8))
+    # 3. Graficar
+    fig, axs = nueva_figura(3, 1, figsize=(15, 8))
     
     for i in range(3):
         etapa = ETAPAS[i]
-        plt.subplot(3, 1, i + 1)
+        ax = axs[i]
 
         # Desplazamiento visual para la original
         desplazamiento = 0.1 * np.std(senales_ventana[i])
         senal_original_desplazada = senales_ventana[i] + desplazamiento
 
-        plt.plot(t_ventana, senal_original_desplazada, label='Original (desplazada)', color='gray', linestyle='--', linewidth=1)
-        plt.plot(t_ventana, filtradas_ventana[i], label='Filtrada', color='blue', linewidth=2)
+        graficar(ax, t_ventana, senal_original_desplazada, label='Original (desplazada)', color='gray', linestyle='--', linewidth=1)
+        graficar(ax, t_ventana, filtradas_ventana[i], label='Filtrada', color='blue', linewidth=2)
         
         # Diferencia
         diferencia = senal_original_desplazada - filtradas_ventana[i]
-        plt.plot(t_ventana, diferencia, label='Diferencia', color='red', linestyle=':', linewidth=1)
+        graficar(ax, t_ventana, diferencia, label='Diferencia', color='red', linestyle=':', linewidth=1)
 
-        plt.title(f'Señal {i + 1} ({etapa}) - Zoom con Desplazamiento')
-        plt.xlabel('Tiempo [s]')
-        plt.ylabel('Amplitud')
-        plt.legend(loc='upper right')
+        ax.set_title(f'Señal {i + 1} ({etapa}) - Zoom con Desplazamiento')
+        ax.set_xlabel('Tiempo [s]')
+        ax.set_ylabel('Amplitud')
+        ax.legend(loc='upper right')
 
-    plt.tight_layout()
+    fig.tight_layout()
     
     # 5. Guardar en buffer
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    plt.close(fig) # Importante cerrar la figura para liberar memoria
-    buf.seek(0)
-    
-    return buf
\ No newline at end of file
+    return figura_a_png(fig)
\ No newline at end of file
@@ -1,10 +1,11 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from scipy.fft import fft, fftfreq
-from io import BytesIO
 import math as mt
 
-from services.tp1.inciso_1 import cargar_senales_filtradas, obtener_fs, obtener_etapas
+from services.tp1.inciso_1 import ENTRADAS, cutoff, obtener_etapas
+from services.tp1.pipeline import SENALES, pipeline
+from services.common.render_cache import cache_png
+from services.common.graficos import nueva_figura, figura_a_png
 
 # Definición de bandas cerebrales
 BANDAS = {
@@ -26,21 +27,23 @@ def calcular_potencia_bandas(senal, fs):
         potencias[banda] = np.sum(yf[indices])
     return potencias
 
-# Cálculo para cada señal
-senales_filtradas = cargar_senales_filtradas()
-fs = obtener_fs()
 ETAPAS = obtener_etapas()
 
-potencias_banda = [calcular_potencia_bandas(s, fs) for s in senales_filtradas]
+# Potencias por señal: las calcula (y cachea) el pipeline recién cuando se
+# piden (o en el precálculo al arrancar la app), no al importar el módulo
+def obtener_potencias_banda():
+    return [pipeline.potencias_banda(nombre, BANDAS, cutoff) for nombre in SENALES]
 
 # Gráfico de barras comparativo
+@cache_png(entradas=ENTRADAS, modulos=("services.tp1.inciso_1", "services.tp1.pipeline"))
 def generar_grafico_potencia_barras():
     etapas = list(ETAPAS.values())
     bandas = list(BANDAS.keys())
     
+    potencias_banda = obtener_potencias_banda()
     data = np.array([[potencias[b] for b in bandas] for potencias in potencias_banda])
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = nueva_figura(figsize=(12, 6))
     x = np.arange(len(bandas))
     width = 0.25
 
@@ -54,19 +57,24 @@ def generar_grafico_potencia_barras():
     ax.set_xticklabels(bandas)
     ax.legend()
 
-    buffer = BytesIO()
-    plt.tight_layout()
-    plt.savefig(buffer, format="png")
-    buffer.seek(0)
-    return buffer
+    fig.tight_layout()
+    return figura_a_png(fig)
+
+def datos_grafico_potencia():
+    """Potencia por banda (una fila por etapa) de los gráficos de barras y de líneas."""
+    bandas = list(BANDAS.keys())
+    potencias = np.array([[p[b] for b in bandas] for p in obtener_potencias_banda()])
+    return {"potencia": potencias}, {"etapas": list(ETAPAS.values()), "bandas": bandas, "unidades": {"potencia": "u.a."}}
 
 # Gráfico de líneas
+@cache_png(entradas=ENTRADAS, modulos=("services.tp1.inciso_1", "services.tp1.pipeline"))
 def generar_grafico_potencia_lineas():
     etapas = list(ETAPAS.values())
     bandas = list(BANDAS.keys())
     
+    potencias_banda = obtener_potencias_banda()
     x = np.arange(len(bandas))
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = nueva_figura(figsize=(12, 6))
     
     for i, etapa in enumerate(etapas):
         y = [potencias_banda[i][b] for b in bandas]
@@ -78,11 +86,8 @@ def generar_grafico_potencia_lineas():
     ax.grid(True)
     ax.legend()
 
-    buffer = BytesIO()
-    plt.tight_layout()
-    plt.savefig(buffer, format="png")
-    buffer.seek(0)
-    return buffer
+    fig.tight_layout()
+    return figura_a_png(fig)
 
 # Texto de explicación
 EXPLICACION_INCISO_3 = """
@@ -1,6 +1,4 @@
-from io import BytesIO
 import numpy as np
-import matplotlib.pyplot as plt
 from scipy import signal
 from scipy.fft import fft, fftfreq
 from scipy.signal import butter, filtfilt, welch
@@ -8,8 +6,25 @@ from scipy.integrate import trapezoid
 import seaborn as sns
 import math as mt
 
-from services.tp1.inciso_1 import cargar_senales_filtradas, obtener_etapas, obtener_fs
-
+from services.tp1.inciso_1 import ENTRADAS, cargar_senales_filtradas, cutoff, obtener_etapas, obtener_fs
+from services.tp1.pipeline import SENALES, pipeline
+from services.tp1.autocorrelacion import autocorrelacion_senales
+from services.tp1.multicanal import integrar_bandas
+from services.common.render_cache import cache_png
+from services.common.decimacion import graficar
+from services.common.graficos import nueva_figura, figura_a_png
+
+# Retardo máximo de la autocorrelación graficada [s]
+MAX_LAG_S = 2.0
+
+# Bandas de la distribución de potencia relativa (gráfico 2 y resumen)
+BANDAS_RELATIVAS = {
+    'Delta (0.5-4 Hz)': (0.5, 4),
+    'Theta (4-8 Hz)': (4, 8),
+    'Alpha (8-13 Hz)': (8, 13),
+    'Beta (13-30 Hz)': (13, 30),
+    'Gamma (30-50 Hz)': (30, 50)
+}
 
 EXPLICACION_INCISO_4 = """
 📈 Análisis de autocorrelación en señales EEG
@@ -27,7 +42,7 @@ PROBLEMAS_INCISO_4 = """
 🧪 Resultados y reflexiones del inciso 4
 
 🔹 Metodología:
-- Se aplicó autocorrelación normalizada (`np.correlate`) a las señales filtradas.
+- Se aplicó autocorrelación normalizada (calculada por FFT, equivalente a `np.correlate`) a las señales filtradas.
 - Se graficó la evolución de la autocorrelación en función del tiempo (retardo) para 2 segundos.
 
 🔍 Observaciones:
@@ -39,62 +54,45 @@ PROBLEMAS_INCISO_4 = """
 El análisis de autocorrelación permite cuantificar la regularidad temporal de las señales. Es una herramienta eficaz para diferenciar entre actividad cerebral normal y patológica.
 """
 
+@cache_png(entradas=ENTRADAS, modulos=("services.tp1.inciso_1", "services.tp1.pipeline", "services.tp1.autocorrelacion", "services.common.decimacion"))
 def generar_grafico_autocorrelacion():
     senales = cargar_senales_filtradas()
     fs = obtener_fs()
     ETAPAS = obtener_etapas()
 
-    def calcular_autocorrelacion(senal):
-        autocorr = np.correlate(senal, senal, mode='full')
-        autocorr = autocorr[len(autocorr)//2:] / np.max(autocorr)
-        return autocorr
-
-    autocorrelaciones = [calcular_autocorrelacion(s) for s in senales]
-    t_autocorr = np.arange(len(autocorrelaciones[0])) / fs
+    # Solo hacen falta los retardos que se grafican (2 s)
+    t_autocorr, autocorrelaciones = autocorrelacion_senales(senales, fs, max_lag_s=MAX_LAG_S)
 
-    fig, axs = plt.subplots(3, 1, figsize=(15, 8))
+    fig, axs = nueva_figura(3, 1, figsize=(15, 8))
     for i, ac in enumerate(autocorrelaciones):
-        axs[i].plot(t_autocorr, ac)
-        axs[i].set_xlim(0, 2)
+        graficar(axs[i], t_autocorr, ac)
+        axs[i].set_xlim(0, MAX_LAG_S)
         axs[i].set_title(f"Señal {i + 1} ({ETAPAS[i]}) - Autocorrelación")
         axs[i].set_xlabel("Retardo [s]")
         axs[i].set_ylabel("Correlación normalizada")
 
     fig.tight_layout()
-    buffer = BytesIO()
-    plt.savefig(buffer, format="png")
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
+
+def datos_grafico_autocorrelacion():
+    retardos, autocorrelaciones = autocorrelacion_senales(cargar_senales_filtradas(), obtener_fs(), max_lag_s=MAX_LAG_S)
+    series = {"retardo": retardos, "autocorrelacion": autocorrelaciones}
+    return series, {"etapas": list(obtener_etapas().values()), "unidades": {"retardo": "s"}}
+
+def _integrar_potencias(potencias):
+    """(potencia, total) por señal y banda, integrando todas las señales en una sola llamada."""
+    f = potencias[0][0]
+    return integrar_bandas(f, np.vstack([Pxx for _, Pxx in potencias]), BANDAS_RELATIVAS)
 
 def generar_grafico_potencias_por_banda(potencias, ETAPAS):
-    from scipy.integrate import trapezoid
-
-    bandas = {
-        'Delta (0.5-4 Hz)': (0.5, 4),
-        'Theta (4-8 Hz)': (4, 8),
-        'Alpha (8-13 Hz)': (8, 13),
-        'Beta (13-30 Hz)': (13, 30),
-        'Gamma (30-50 Hz)': (30, 50)
-    }
-    nombres_bandas = list(bandas.keys())
-
-    potencias_bandas = []
-    for f, Pxx in potencias:
-        total = trapezoid(Pxx, f)
-        potencias_por_senal = []
-        for low, high in bandas.values():
-            mask = (f >= low) & (f <= high)
-            potencia = trapezoid(Pxx[mask], f[mask])
-            porcentaje = (potencia / total) * 100
-            potencias_por_senal.append(porcentaje)
-        potencias_bandas.append(potencias_por_senal)
-
-    potencias_bandas = np.array(potencias_bandas)
+    nombres_bandas = list(BANDAS_RELATIVAS.keys())
+
+    potencia, total = _integrar_potencias(potencias)
+    potencias_bandas = potencia / total[:, None] * 100
     x = np.arange(len(nombres_bandas))
     width = 0.25
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = nueva_figura(figsize=(12, 6))
     for i in range(len(ETAPAS)):
         ax.bar(x + i * width - width, potencias_bandas[i], width, label=f"Señal {i+1}")
 
@@ -103,34 +101,34 @@ def generar_grafico_potencias_por_banda(potencias, ETAPAS):
     ax.set_ylabel("Potencia relativa [%]")
     ax.set_title("Distribución de Potencia por Bandas de Frecuencia")
     ax.legend()
-    plt.tight_layout()
+    fig.tight_layout()
 
-    buffer = BytesIO()
-    plt.savefig(buffer, format="png")
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
 
-def generar_resumen_analisis_bandas(potencias, ETAPAS):
-    from scipy.integrate import trapezoid
+def calcular_potencias_senales():
+    """Espectro de potencia (frecuencias, |FFT|^2) de cada señal filtrada."""
+    return [pipeline.potencia(nombre, cutoff) for nombre in SENALES]
+
+@cache_png(entradas=ENTRADAS, modulos=("services.tp1.inciso_1", "services.tp1.pipeline", "services.tp1.multicanal"))
+def generar_grafico_potencias_senales():
+    return generar_grafico_potencias_por_banda(calcular_potencias_senales(), obtener_etapas())
 
-    bandas = {
-        'Delta (0.5-4 Hz)': (0.5, 4),
-        'Theta (4-8 Hz)': (4, 8),
-        'Alpha (8-13 Hz)': (8, 13), 
-        'Beta (13-30 Hz)': (13, 30),
-        'Gamma (30-50 Hz)': (30, 50)
-    }
+def datos_grafico_potencias_senales():
+    """Potencia relativa [%] por señal (filas) y banda (columnas) del gráfico 2."""
+    potencia, total = _integrar_potencias(calcular_potencias_senales())
+    series = {"potencia_relativa": potencia / total[:, None] * 100}
+    return series, {"etapas": list(obtener_etapas().values()), "bandas": list(BANDAS_RELATIVAS),
+                    "unidades": {"potencia_relativa": "%"}}
+
+def generar_resumen_analisis_bandas(potencias, ETAPAS):
+    potencia, total = _integrar_potencias(potencias)
 
     resumen = ""
-    for i, (f, Pxx) in enumerate(potencias):
+    for i in range(len(potencias)):
         resumen += f"🔍 Análisis de bandas para Señal {i+1} ({ETAPAS[i]}):\n"
-        total = trapezoid(Pxx, f)
-        for nombre, (low, high) in bandas.items():
-            mask = (f >= low) & (f <= high)
-            potencia = trapezoid(Pxx[mask], f[mask])
-            porcentaje = (potencia / total) * 100
-            resumen += f"- {nombre}: {potencia:.4f} ({porcentaje:.2f}%)\n"
+        for j, nombre in enumerate(BANDAS_RELATIVAS):
+            porcentaje = (potencia[i, j] / total[i]) * 100
+            resumen += f"- {nombre}: {potencia[i, j]:.4f} ({porcentaje:.2f}%)\n"
         resumen += "\n"
     return resumen
 
@@ -0,0 +1,185 @@
+# services/tp1/monitoreo.py
+"""
+Monitoreo de EEG en tiempo real: potencia por banda de cada ventana a medida
+que llegan las muestras.
+
+Las muestras llegan en bloques de cualquier tamaño. Cada bloque pasa por:
+  1. un FIR con estado (overlap-save: se guardan las últimas taps-1 muestras
+     de entrada, así el filtrado por bloques da lo mismo que filtrar la
+     señal entera), con el mismo kernel que `filtro_pasa_bajos`;
+  2. un buffer circular de una ventana; cada `paso` muestras nuevas se
+     estima la PSD de la ventana (Hann, como en `espectrograma`) y se
+     integran las bandas;
+  3. una heurística de etapa (sano / interictal / convulsivo).
+
+El costo por bloque está acotado (bloques de a lo sumo TP1_MONITOREO_MAX_BLOQUE
+muestras, ventanas de tamaño fijo) y cada resultado lleva la latencia medida
+desde que llegó el bloque hasta que la ventana quedó calculada.
+"""
+import os
+import time
+
+import numpy as np
+from scipy.signal import oaconvolve
+
+from services.tp1.espectrograma import BANDAS_EEG, EstimadorBandas, validar_ventana
+from services.tp1.filtros import TP1_FFT_TAPS, TP1_FILTROS_MAX_TAPS
+from services.tp1.pipeline import CUTOFF, NUM_TAPS, kernel_pasa_bajos
+
+TP1_MONITOREO_MAX_BLOQUE = int(os.environ.get("TP1_MONITOREO_MAX_BLOQUE", "65536"))
+
+# Heurística calibrada con las tres señales del TP (ventanas de 2 s, filtradas):
+# la convulsiva tiene ~100x la potencia total de las otras dos (mediana
+# ~2e5 contra ~2e3 u.a.²) y la interictal una relación (delta+theta)/(alfa+beta)
+# de 4 a 24 contra 0.5 a 2.5 de la sana. Es orientativa, no un diagnóstico.
+UMBRAL_POTENCIA_CONVULSIVO = 2e4
+UMBRAL_LENTAS_RAPIDAS_INTERICTAL = 3.0
+
+
+class FiltroFIRStreaming:
+    """FIR causal por bloques (overlap-save): bloque a bloque da lo mismo que sobre toda la señal."""
+
+    def __init__(self, h):
+        self.h = np.asarray(h, dtype=float)
+        self._historia = np.zeros(len(self.h) - 1)
+
+    def procesar(self, bloque):
+        x = np.concatenate([self._historia, np.asarray(bloque, dtype=float)])
+        self._historia = x[len(x) - len(self._historia):]
+        if len(self.h) >= TP1_FFT_TAPS:
+            return oaconvolve(x, self.h, mode="valid")
+        return np.convolve(x, self.h, mode="valid")
+
+    @property
+    def retardo(self):
+        """Retardo de grupo en muestras (fase lineal)."""
+        return (len(self.h) - 1) / 2
+
+
+def filtrar_por_bloques(fuente, h):
+    """
+    Generador de bloques de la señal filtrada con `h`, alineados como
+    `aplicar_kernel` (convolución 'same'): se descartan las primeras
+    (taps-1)//2 salidas del FIR causal y al final se completa con ceros.
+    En memoria nunca hay más que un bloque más taps-1 muestras de historia.
+    """
+    filtro = FiltroFIRStreaming(h)
+    descartar = (len(filtro.h) - 1) // 2
+    restantes = 0
+    for bloque in fuente:
+        restantes += len(bloque)
+        y = filtro.procesar(bloque)
+        saltear = min(descartar, len(y))
+        descartar -= saltear
+        y = y[saltear:]
+        restantes -= len(y)
+        if len(y):
+            yield y
+    if restantes:
+        yield filtro.procesar(np.zeros(descartar + restantes))[descartar:]
+
+
+class BufferCircular:
+    def __init__(self, n):
+        self._datos = np.zeros(n)
+        self._pos = 0
+        self.total = 0
+
+    def agregar(self, x):
+        n = len(self._datos)
+        self.total += len(x)
+        x = x[-n:]
+        fin = self._pos + len(x)
+        if fin <= n:
+            self._datos[self._pos:fin] = x
+        else:
+            corte = n - self._pos
+            self._datos[self._pos:] = x[:corte]
+            self._datos[:fin - n] = x[corte:]
+        self._pos = fin % n
+
+    def ventana(self):
+        """Las últimas n muestras en orden cronológico."""
+        return np.concatenate([self._datos[self._pos:], self._datos[:self._pos]])
+
+
+def clasificar_etapa(potencias, umbral_convulsivo=UMBRAL_POTENCIA_CONVULSIVO):
+    total = sum(potencias.values())
+    rapidas = potencias["Alfa"] + potencias["Beta"]
+    lentas_rapidas = (potencias["Delta"] + potencias["Theta"]) / rapidas if rapidas > 0 else float("inf")
+    if total >= umbral_convulsivo:
+        return "convulsivo"
+    if lentas_rapidas >= UMBRAL_LENTAS_RAPIDAS_INTERICTAL:
+        return "interictal"
+    return "sano"
+
+
+class MonitorEEG:
+    def __init__(self, fs, ventana=2.0, solapamiento=0.5, cutoff=CUTOFF, num_taps=NUM_TAPS,
+                 umbral_convulsivo=UMBRAL_POTENCIA_CONVULSIVO):
+        self.fs = fs
+        self.n, self.paso = validar_ventana(fs, ventana, solapamiento)
+        if not 0 < cutoff < fs / 2:
+            raise ValueError(f"El corte debe estar entre 0 y fs/2 = {fs / 2:.2f} Hz.")
+        if not 3 <= num_taps <= TP1_FILTROS_MAX_TAPS:
+            raise ValueError(f"La cantidad de taps debe estar entre 3 y {TP1_FILTROS_MAX_TAPS}.")
+        self.filtro = FiltroFIRStreaming(kernel_pasa_bajos(cutoff, fs, num_taps))
+        self.buffer = BufferCircular(self.n)
+        self.estimador = EstimadorBandas(fs, self.n, BANDAS_EEG)
+        self.umbral_convulsivo = umbral_convulsivo
+        self._proxima = self.n
+        self._ventanas = 0
+        self.latencia_max_ms = 0.0
+
+    def configuracion(self):
+        return {
+            "fs": self.fs,
+            "muestras_ventana": self.n,
+            "paso": self.paso,
+            "retardo_filtro_ms": 1000 * self.filtro.retardo / self.fs,
+            "max_bloque": TP1_MONITOREO_MAX_BLOQUE,
+        }
+
+    def procesar(self, bloque, llegada=None):
+        """
+        Procesa un bloque de muestras y devuelve un dict por ventana completada.
+        `llegada` es el time.perf_counter() de cuando se recibió el bloque.
+        """
+        llegada = time.perf_counter() if llegada is None else llegada
+        bloque = np.asarray(bloque, dtype=float).ravel()
+        if len(bloque) > TP1_MONITOREO_MAX_BLOQUE:
+            raise ValueError(f"Bloque de {len(bloque)} muestras: el máximo es {TP1_MONITOREO_MAX_BLOQUE}.")
+        if not np.all(np.isfinite(bloque)):
+            raise ValueError("El bloque tiene valores no finitos.")
+
+        filtrado = self.filtro.procesar(bloque)
+        resultados = []
+        inicio = 0
+        # Se corta el bloque justo donde se completa cada ventana
+        while inicio < len(filtrado):
+            faltan = self._proxima - self.buffer.total
+            tramo = filtrado[inicio:inicio + faltan]
+            self.buffer.agregar(tramo)
+            inicio += len(tramo)
+            if self.buffer.total == self._proxima:
+                resultados.append(self._ventana(llegada))
+                self._proxima += self.paso
+        return resultados
+
+    def _ventana(self, llegada):
+        potencias = self.estimador.potencias(self.buffer.ventana())
+        total = sum(potencias.values())
+        fin = self.buffer.total / self.fs
+        latencia_ms = 1000 * (time.perf_counter() - llegada)
+        self.latencia_max_ms = max(self.latencia_max_ms, latencia_ms)
+        resultado = {
+            "ventana": self._ventanas,
+            "t_inicio": fin - self.n / self.fs,
+            "t_fin": fin,
+            "potencias": potencias,
+            "relativas": {b: (p / total if total > 0 else 0.0) for b, p in potencias.items()},
+            "etapa": clasificar_etapa(potencias, self.umbral_convulsivo),
+            "latencia_ms": latencia_ms,
+        }
+        self._ventanas += 1
+        return resultado
@@ -0,0 +1,22 @@
+# services/tp1/multicanal.py
+"""
+Operaciones sobre varios canales EEG a la vez: los espectros se apilan en un
+array (n_canales, n_frecuencias) y se integran a lo largo del último eje en
+una sola pasada, en lugar de un loop de Python por canal y por banda.
+"""
+import numpy as np
+from scipy.integrate import trapezoid
+
+
+def integrar_bandas(f, P, bandas):
+    """
+    Integral por trapecios de P (uno o varios canales, último eje = frecuencia)
+    en cada banda y en todo el espectro. Devuelve (potencias (..., n_bandas), total (...)).
+    """
+    P = np.asarray(P)
+    total = trapezoid(P, f, axis=-1)
+    potencias = np.stack([
+        trapezoid(P[..., (f >= low) & (f <= high)], f[(f >= low) & (f <= high)], axis=-1)
+        for low, high in bandas.values()
+    ], axis=-1)
+    return potencias, total
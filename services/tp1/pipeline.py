@@ -0,0 +1,181 @@
+# services/tp1/pipeline.py
+"""
+Pipeline compartido de preprocesamiento EEG del TP1:
+
+    señal -> filtro pasa bajos -> rfft -> potencia por banda
+
+Cada inciso volvía a filtrar y a transformar las tres señales por su cuenta
+(gráficos de los incisos 1 y 2, potencias del 3, `/grafico2` y
+`/analisis-bandas` del 4). Acá cada etapa se calcula recién cuando alguien la
+pide y queda cacheada por (señal, cutoff, taps): todos los endpoints reusan
+la misma señal filtrada, su rfft y las potencias.
+
+Si el texto de la señal cambia, el repositorio de señales devuelve otra vista
+y las etapas de esa señal se recalculan. Como los cortes y los taps (y las
+subidas) los elige el cliente, las etapas viven en un LRU acotado
+(TP1_ETAPAS_MAX entradas). El lock protege solo el diccionario: cada etapa
+se calcula afuera, y si dos requests piden la misma a la vez la segunda espera
+el cálculo de la primera en lugar de repetirlo.
+"""
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+from scipy.fft import fftfreq, rfft, rfftfreq
+
+from services.tp1.filtros import aplicar_kernel, banco
+from services.tp1.senales import FS, repositorio
+
+DATA_PATH = os.path.join("data", "tp1")
+SENALES = tuple(f"Signal_{i}.txt" for i in range(1, 4))
+CUTOFF = 40.0
+NUM_TAPS = 301
+TP1_ETAPAS_MAX = int(os.environ.get("TP1_ETAPAS_MAX", "64"))
+
+
+def _kernel_pasa_bajos(cutoff, fs, num_taps):
+    fc = cutoff / (fs / 2)
+    h = np.sinc(2 * fc * (np.arange(num_taps) - (num_taps - 1) / 2))
+    h *= np.hamming(num_taps)
+    h /= np.sum(h)
+    return h
+
+
+def kernel_pasa_bajos(cutoff, fs, num_taps=NUM_TAPS):
+    """Kernel del pasa bajos del TP (sinc con ventana de Hamming), guardado en el banco."""
+    return banco.obtener(("tp1", cutoff, fs, num_taps), lambda: _kernel_pasa_bajos(cutoff, fs, num_taps))
+
+
+def filtro_pasa_bajos(data, cutoff, fs, num_taps=NUM_TAPS):
+    """Filtro pasa bajos FIR del TP, con el kernel del banco."""
+    return aplicar_kernel(data, kernel_pasa_bajos(cutoff, fs, num_taps))
+
+
+def _solo_lectura(*arrays):
+    # Las etapas se comparten entre requests: nadie debe modificarlas en el lugar
+    for a in arrays:
+        a.flags.writeable = False
+    return arrays[0] if len(arrays) == 1 else arrays
+
+
+class PipelineEEG:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._etapas = OrderedDict()
+            cls._instance._rutas = {}
+            cls._instance._calculando = {}
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def registrar(self, nombre, ruta):
+        """Asocia un nombre de señal a un archivo fuera de data/tp1 (p. ej. una subida)."""
+        with self._lock:
+            self._rutas[nombre] = ruta
+
+    def _ruta(self, nombre):
+        return self._rutas.get(nombre) or os.path.join(DATA_PATH, nombre)
+
+    def senal(self, nombre):
+        """Señal cruda (vista mmap float32 del repositorio)."""
+        return repositorio.cargar(self._ruta(nombre))
+
+    def fs(self, nombre):
+        return repositorio.metadatos(self._ruta(nombre)).get("fs", FS)
+
+    def etapa(self, nombre):
+        return repositorio.metadatos(self._ruta(nombre)).get("etapa")
+
+    def _etapa(self, etapa, nombre, cutoff, num_taps, calcular):
+        clave = (etapa, nombre, cutoff, num_taps)
+        origen = self.senal(nombre)
+        with self._lock:
+            guardado = self._etapas.get(clave)
+            if guardado is not None and guardado[0] is origen:
+                self._etapas.move_to_end(clave)
+                return guardado[1]
+            en_curso = self._calculando.get(clave)
+            propio = en_curso is None or en_curso[0] is not origen
+            if propio:
+                en_curso = (origen, Future())
+                self._calculando[clave] = en_curso
+        if not propio:
+            # Otra request ya la está calculando: se espera su resultado
+            return en_curso[1].result()
+
+        try:
+            valor = calcular()
+        except BaseException as e:
+            with self._lock:
+                if self._calculando.get(clave) is en_curso:
+                    del self._calculando[clave]
+            en_curso[1].set_exception(e)
+            raise
+        with self._lock:
+            if self._calculando.get(clave) is en_curso:
+                del self._calculando[clave]
+            self._etapas[clave] = (origen, valor)
+            self._etapas.move_to_end(clave)
+            while len(self._etapas) > TP1_ETAPAS_MAX:
+                self._etapas.popitem(last=False)
+        en_curso[1].set_result(valor)
+        return valor
+
+    def filtrada(self, nombre, cutoff=CUTOFF, num_taps=NUM_TAPS):
+        return self._etapa("filtrada", nombre, cutoff, num_taps, lambda: _solo_lectura(
+            filtro_pasa_bajos(self.senal(nombre), cutoff, self.fs(nombre), num_taps)))
+
+    def espectro(self, nombre, cutoff=CUTOFF, num_taps=NUM_TAPS):
+        """(frecuencias, rfft) de la señal filtrada."""
+        def calcular():
+            x = self.filtrada(nombre, cutoff, num_taps)
+            return _solo_lectura(rfftfreq(len(x), 1 / self.fs(nombre)), rfft(x))
+        return self._etapa("espectro", nombre, cutoff, num_taps, calcular)
+
+    def magnitud(self, nombre, cutoff=CUTOFF, num_taps=NUM_TAPS):
+        """Espectro de amplitud de un lado (2/N |X|) para los bins 0..N/2-1."""
+        def calcular():
+            n = len(self.filtrada(nombre, cutoff, num_taps))
+            xf, yf = self.espectro(nombre, cutoff, num_taps)
+            return _solo_lectura(xf[:n // 2], 2.0 / n * np.abs(yf[:n // 2]))
+        return self._etapa("magnitud", nombre, cutoff, num_taps, calcular)
+
+    def potencia(self, nombre, cutoff=CUTOFF, num_taps=NUM_TAPS):
+        """
+        (fftfreq, |FFT|^2) de dos lados, en el orden de `np.fft.fft`. Se arma
+        desde la rfft: para una señal real |X[N-k]| = |X[k]|.
+        """
+        def calcular():
+            n = len(self.filtrada(nombre, cutoff, num_taps))
+            p = np.abs(self.espectro(nombre, cutoff, num_taps)[1]) ** 2
+            resto = n - len(p)
+            return _solo_lectura(fftfreq(n, 1 / self.fs(nombre)), np.concatenate([p, p[1:resto + 1][::-1]]))
+        return self._etapa("potencia", nombre, cutoff, num_taps, calcular)
+
+    def potencias_banda(self, nombre, bandas, cutoff=CUTOFF, num_taps=NUM_TAPS):
+        """{banda: suma de |X|^2 en [low, high]} (solo frecuencias positivas)."""
+        bandas = tuple(bandas.items())
+
+        def calcular():
+            xf, yf = self.espectro(nombre, cutoff, num_taps)
+            p = np.abs(yf) ** 2
+            return {banda: np.sum(p[(xf >= low) & (xf <= high)]) for banda, (low, high) in bandas}
+        return dict(self._etapa(("bandas", bandas), nombre, cutoff, num_taps, calcular))
+
+    def olvidar(self, nombre):
+        """Descarta las etapas y el registro de una señal (p. ej. una subida borrada)."""
+        with self._lock:
+            for clave in [c for c in self._etapas if c[1] == nombre]:
+                del self._etapas[clave]
+            self._rutas.pop(nombre, None)
+
+    def invalidar(self):
+        with self._lock:
+            self._etapas.clear()
+
+
+pipeline = PipelineEEG()
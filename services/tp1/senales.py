@@ -0,0 +1,221 @@
+# services/tp1/senales.py
+"""
+Repositorio binario de las señales EEG del TP1.
+
+Los `Signal_*.txt` tienen una muestra por línea; parsearlos en cada request
+(lista por comprensión de `float(line)`) es lo más caro de cualquier gráfico
+del TP1. Acá cada texto se convierte una sola vez a un `.npy` float32 (más un
+`.json` con fs, etapa y la firma del texto de origen) y después se sirve
+abierto con mmap: cargar una señal es abrir un archivo, sin copiar datos.
+
+Si el texto cambia (mtime o tamaño distintos a los de la firma) se vuelve a
+convertir. La conversión es por bloques, así que una grabación de varias horas
+no necesita entrar entera en memoria como lista de floats.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from itertools import islice
+
+import numpy as np
+
+TP1_SENALES_DIR = os.environ.get("TP1_SENALES_DIR", os.path.join("data", "cache", "tp1"))
+FS = 173.61
+ETAPAS = {
+    "Signal_1.txt": "Registro sano",
+    "Signal_2.txt": "Registro interictal",
+    "Signal_3.txt": "Registro convulsivo",
+}
+# Líneas de texto que se parsean por bloque durante la conversión
+LINEAS_POR_BLOQUE = 1 << 20
+# texto: una muestra por línea; csv: una columna de un CSV; float32: binario crudo little-endian
+FORMATOS = ("texto", "csv", "float32")
+
+
+def _firma_texto(ruta):
+    st = os.stat(ruta)
+    return {"mtime_ns": st.st_mtime_ns, "tamano": st.st_size}
+
+
+def _numeros(lineas, formato, columna, primer_bloque):
+    if formato == "csv":
+        filas = [l.replace(";", ",").replace("\t", ",").split(",") for l in lineas]
+        try:
+            campos = [fila[columna] for fila in filas]
+        except IndexError:
+            raise ValueError(f"El CSV no tiene la columna {columna}.")
+        if primer_bloque:
+            try:
+                float(campos[0])
+            except ValueError:
+                # Encabezado
+                campos = campos[1:]
+        lineas = campos
+    return np.asarray(lineas, dtype=np.float64).astype(np.float32)
+
+
+def _bloques(ruta, formato="texto", columna=0):
+    """Muestras del archivo de origen como bloques float32 (ValueError si no se pueden leer)."""
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconocido '{formato}'. Opciones: {', '.join(FORMATOS)}.")
+    if formato == "float32":
+        if os.path.getsize(ruta) % 4:
+            raise ValueError("Un archivo float32 crudo debe tener un tamaño múltiplo de 4 bytes.")
+        with open(ruta, "rb") as origen:
+            while True:
+                crudo = origen.read(4 * LINEAS_POR_BLOQUE)
+                if not crudo:
+                    break
+                yield np.frombuffer(crudo, dtype="<f4").astype(np.float32)
+        return
+    with open(ruta, "r") as origen:
+        primer_bloque = True
+        while True:
+            bloque = list(islice(origen, LINEAS_POR_BLOQUE))
+            if not bloque:
+                break
+            lineas = [l for l in bloque if l.strip()]
+            if not lineas:
+                continue
+            yield _numeros(lineas, formato, columna, primer_bloque)
+            primer_bloque = False
+
+
+def _convertir(ruta_txt, ruta_npy, formato="texto", columna=0):
+    """Texto (o CSV / float32 crudo) -> .npy float32, por bloques y con escritura atómica."""
+    directorio = os.path.dirname(ruta_npy)
+    fd, crudo = tempfile.mkstemp(dir=directorio, suffix=".bin")
+    tmp_npy = None
+    try:
+        n = 0
+        with os.fdopen(fd, "wb") as destino:
+            for valores in _bloques(ruta_txt, formato, columna):
+                valores.tofile(destino)
+                n += valores.size
+
+        fd, tmp_npy = tempfile.mkstemp(dir=directorio, suffix=".npy")
+        os.close(fd)
+        salida = np.lib.format.open_memmap(tmp_npy, mode="w+", dtype=np.float32, shape=(n,))
+        if n:
+            salida[:] = np.memmap(crudo, dtype=np.float32, mode="r", shape=(n,))
+        salida.flush()
+        del salida
+        os.replace(tmp_npy, ruta_npy)
+        tmp_npy = None
+        return n
+    finally:
+        for tmp in (crudo, tmp_npy):
+            if tmp and os.path.exists(tmp):
+                os.remove(tmp)
+
+
+class RepositorioSenales:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._abiertas = {}
+            cls._instance._opciones = {}
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def _rutas_cache(self, ruta_txt):
+        # El nombre incluye un hash de la ruta: dos Signal_1.txt de carpetas distintas no chocan
+        clave = hashlib.sha1(os.path.abspath(ruta_txt).encode("utf-8")).hexdigest()[:12]
+        base = os.path.join(TP1_SENALES_DIR, f"{os.path.splitext(os.path.basename(ruta_txt))[0]}_{clave}")
+        return base + ".npy", base + ".json"
+
+    def _leer_meta(self, ruta_json):
+        try:
+            with open(ruta_json, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def registrar(self, ruta, formato="texto", columna=0, fs=FS, etapa=None):
+        """
+        Declara cómo se lee un archivo que no es un `Signal_*.txt` (p. ej. una
+        subida): formato, columna del CSV, fs y etapa. Las rutas sin registrar
+        se leen como texto con el fs del TP.
+        """
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato desconocido '{formato}'. Opciones: {', '.join(FORMATOS)}.")
+        with self._lock:
+            self._opciones[os.path.abspath(ruta)] = {"formato": formato, "columna": int(columna), "fs": fs, "etapa": etapa}
+
+    def _opciones_de(self, ruta):
+        opciones = self._opciones.get(os.path.abspath(ruta))
+        if opciones is None:
+            nombre = os.path.basename(ruta)
+            opciones = {"formato": "texto", "columna": 0, "fs": FS, "etapa": ETAPAS.get(nombre)}
+        return opciones
+
+    def _preparar(self, ruta_txt, firma):
+        """Devuelve (array mmap, metadatos), convirtiendo el texto si hace falta."""
+        ruta_npy, ruta_json = self._rutas_cache(ruta_txt)
+        opciones = self._opciones_de(ruta_txt)
+        meta = self._leer_meta(ruta_json)
+        vigente = meta is not None and meta.get("firma") == firma and \
+            (meta.get("formato"), meta.get("columna"), meta.get("fs")) == (opciones["formato"], opciones["columna"], opciones["fs"])
+        if vigente:
+            try:
+                return np.load(ruta_npy, mmap_mode="r"), meta
+            except (OSError, ValueError):
+                pass
+
+        try:
+            os.makedirs(TP1_SENALES_DIR, exist_ok=True)
+            n = _convertir(ruta_txt, ruta_npy, opciones["formato"], opciones["columna"])
+            meta = self._metadatos(ruta_txt, firma, n, opciones)
+            fd, tmp = tempfile.mkstemp(dir=TP1_SENALES_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp, ruta_json)
+        except OSError:
+            # Sin disco para la caché: se parsea en memoria como antes
+            bloques = list(_bloques(ruta_txt, opciones["formato"], opciones["columna"]))
+            datos = np.concatenate(bloques) if bloques else np.zeros(0, dtype=np.float32)
+            return datos, self._metadatos(ruta_txt, firma, datos.size, opciones)
+
+        if n == 0:
+            # Un .npy vacío no se puede abrir con mmap
+            return np.zeros(0, dtype=np.float32), meta
+        return np.load(ruta_npy, mmap_mode="r"), meta
+
+    def _metadatos(self, ruta_txt, firma, muestras, opciones):
+        return {
+            "fuente": os.path.basename(ruta_txt),
+            "formato": opciones["formato"],
+            "columna": opciones["columna"],
+            "fs": opciones["fs"],
+            "etapa": opciones["etapa"],
+            "muestras": int(muestras),
+            "dtype": "float32",
+            "firma": firma,
+        }
+
+    def _abrir(self, ruta_txt):
+        # FileNotFoundError si no existe el texto, igual que el open() original
+        firma = _firma_texto(ruta_txt)
+        clave = os.path.abspath(ruta_txt)
+        with self._lock:
+            abierta = self._abiertas.get(clave)
+            if abierta is None or abierta[0] != (firma, self._opciones_de(ruta_txt)):
+                datos, meta = self._preparar(ruta_txt, firma)
+                abierta = ((firma, self._opciones_de(ruta_txt)), datos, meta)
+                self._abiertas[clave] = abierta
+            return abierta
+
+    def cargar(self, ruta_txt):
+        """Vista de solo lectura (float32, mmap) de la señal del archivo de texto."""
+        return self._abrir(ruta_txt)[1]
+
+    def metadatos(self, ruta_txt):
+        """fs, etapa, cantidad de muestras y firma del texto de origen."""
+        return dict(self._abrir(ruta_txt)[2])
+
+
+repositorio = RepositorioSenales()
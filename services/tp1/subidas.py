@@ -0,0 +1,132 @@
+# services/tp1/subidas.py
+"""
+Subida de registros EEG propios (texto, CSV o float32 crudo).
+
+El archivo subido (multipart) se copia a disco de a chunks (nunca entero en RAM) y
+se registra en el repositorio de señales, que lo convierte una vez a `.npy`
+float32 como a los `Signal_*.txt`. El ID es un hash del contenido y de los
+parámetros de lectura: subir dos veces lo mismo devuelve el mismo ID, y todos
+los resultados que el pipeline cachea por nombre de señal (filtrado, rfft,
+potencias) quedan cacheados por subida.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from services.tp1.pipeline import SENALES, pipeline
+from services.tp1.senales import FORMATOS, FS, TP1_SENALES_DIR, repositorio
+
+TP1_SUBIDAS_DIR = os.environ.get("TP1_SUBIDAS_DIR", os.path.join(TP1_SENALES_DIR, "subidas"))
+TP1_SUBIDA_MAX_MB = int(os.environ.get("TP1_SUBIDA_MAX_MB", "1024"))
+
+_EXTENSIONES = {"texto": ".txt", "csv": ".csv", "float32": ".f32"}
+_ID_VALIDO = re.compile(r"^[0-9a-f]{20}$")
+
+
+def _ruta_meta(id_subida):
+    return os.path.join(TP1_SUBIDAS_DIR, f"{id_subida}.json")
+
+
+def _registrar(id_subida, meta):
+    ruta = os.path.join(TP1_SUBIDAS_DIR, id_subida + _EXTENSIONES[meta["formato"]])
+    repositorio.registrar(ruta, meta["formato"], meta["columna"], meta["fs"], etapa=f"Subida {id_subida}")
+    pipeline.registrar(id_subida, ruta)
+    return ruta
+
+
+def resolver(id_subida):
+    """
+    Registra (si hace falta, p. ej. después de un reinicio) la subida y
+    devuelve su nombre de señal para el pipeline. 404 si no existe.
+    """
+    if not _ID_VALIDO.match(id_subida or ""):
+        raise HTTPException(status_code=404, detail=f"No existe la subida '{id_subida}'.")
+    try:
+        with open(_ruta_meta(id_subida), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        # Si la subida se borró, lo que el pipeline tenía de ella ya no sirve
+        pipeline.olvidar(id_subida)
+        raise HTTPException(status_code=404, detail=f"No existe la subida '{id_subida}'.")
+    _registrar(id_subida, meta)
+    return id_subida
+
+
+def nombre_senal(senal=1, id_subida=None):
+    """Nombre para el pipeline: la subida `id_subida` si viene, si no la señal del TP número `senal`."""
+    if id_subida:
+        return resolver(id_subida)
+    return SENALES[senal - 1]
+
+
+def _borrar(*rutas):
+    for ruta in rutas:
+        if ruta and os.path.exists(ruta):
+            os.remove(ruta)
+
+
+async def guardar_subida(archivo: UploadFile, formato="texto", fs=FS, columna=0):
+    """
+    Copia el archivo a disco de a chunks, lo registra y lo convierte.
+    Devuelve los metadatos de la subida (con su `id`).
+    """
+    if formato not in FORMATOS:
+        raise HTTPException(status_code=400, detail=f"Formato desconocido '{formato}'. Opciones: {', '.join(FORMATOS)}.")
+    os.makedirs(TP1_SUBIDAS_DIR, exist_ok=True)
+    limite = TP1_SUBIDA_MAX_MB * 1024 * 1024
+    fd, tmp = tempfile.mkstemp(dir=TP1_SUBIDAS_DIR, suffix=".tmp")
+    h = hashlib.blake2b(digest_size=16)
+    total = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while chunk := await archivo.read(1 << 20):
+                total += len(chunk)
+                if total > limite:
+                    raise HTTPException(status_code=413, detail=f"El archivo supera {TP1_SUBIDA_MAX_MB} MB.")
+                h.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        _borrar(tmp)
+        raise
+    if total == 0:
+        _borrar(tmp)
+        raise HTTPException(status_code=400, detail="El archivo está vacío.")
+
+    id_subida = hashlib.blake2b(f"{h.hexdigest()}:{formato}:{columna}:{fs!r}".encode(), digest_size=10).hexdigest()
+    ruta = os.path.join(TP1_SUBIDAS_DIR, id_subida + _EXTENSIONES[formato])
+    if os.path.exists(ruta):
+        # Misma subida: se reusa lo que ya está convertido
+        _borrar(tmp)
+    else:
+        os.replace(tmp, ruta)
+    meta = {"id": id_subida, "formato": formato, "columna": columna, "fs": fs, "bytes": total}
+    _registrar(id_subida, meta)
+
+    try:
+        senal = await run_in_threadpool(pipeline.senal, id_subida)
+    except ValueError as e:
+        _borrar(ruta)
+        pipeline.olvidar(id_subida)
+        raise HTTPException(status_code=400, detail=f"No se pudo leer el archivo como {formato}: {e}")
+    if len(senal) < 2:
+        _borrar(ruta)
+        pipeline.olvidar(id_subida)
+        raise HTTPException(status_code=400, detail="El archivo no tiene muestras suficientes.")
+
+    meta.update(muestras=len(senal), duracion_s=len(senal) / fs)
+    fd, tmp = tempfile.mkstemp(dir=TP1_SUBIDAS_DIR, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp, _ruta_meta(id_subida))
+    return meta
+
+
+def metadatos(id_subida):
+    resolver(id_subida)
+    with open(_ruta_meta(id_subida), encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,220 @@
+# services/tp2/estego.py
+"""
+Esteganografía sin estado: cada request trae sus imágenes y se lleva el
+resultado, todo en memoria.
+
+Los incisos 1 a 3 escriben en rutas fijas (`imagen_estego.png`, `.npy`, ...)
+y guardan en variables del proceso lo que necesita el decodificador, así que
+dos usuarios a la vez se pisan y otro worker no puede decodificar. Acá:
+
+- la portadora y la carga llegan como archivos de un multipart/form-data y
+  la imagen estego se devuelve en el cuerpo de la respuesta;
+- todo lo que necesita el decodificador (método, k, semilla, repeticiones,
+  delta, forma de la oculta) va en la "clave", un JSON que se guarda en los
+  metadatos de la imagen (chunk de texto del PNG / ImageDescription del TIFF)
+  y también se devuelve en el header `X-Estego-Clave`, por si el cliente
+  reprocesa la imagen y pierde los metadatos.
+
+El cálculo corre en el pool de procesos; dos requests idénticas se resuelven
+con un solo cálculo.
+"""
+import hashlib
+import io
+import json
+import os
+import secrets
+from typing import Optional
+
+import numpy as np
+from fastapi import HTTPException, UploadFile
+from PIL import Image, PngImagePlugin
+
+from services.common.ejecutor import ejecutar
+from services.tp2 import inciso_1, inciso_2, inciso_3, lsb
+
+TP2_ESTEGO_MAX_MB = int(os.environ.get("TP2_ESTEGO_MAX_MB", "32"))
+
+CABECERA_CLAVE = "X-Estego-Clave"
+CLAVE_METADATOS = "estego"
+# Etiqueta TIFF ImageDescription
+_TIFF_DESCRIPCION = 270
+
+
+# === Entrada: archivos del multipart, en memoria ===
+
+async def leer_archivo(archivo: Optional[UploadFile]):
+    """Bytes de un archivo subido (b"" si no vino), acotado a TP2_ESTEGO_MAX_MB."""
+    if archivo is None:
+        return b""
+    limite = TP2_ESTEGO_MAX_MB * 1024 * 1024
+    datos = bytearray()
+    while chunk := await archivo.read(1 << 20):
+        datos += chunk
+        if len(datos) > limite:
+            raise HTTPException(status_code=413, detail=f"'{archivo.filename}' supera {TP2_ESTEGO_MAX_MB} MB.")
+    return bytes(datos)
+
+
+def _imagen(datos, nombre):
+    try:
+        imagen = Image.open(io.BytesIO(datos))
+        imagen.load()
+        return imagen
+    except Exception:
+        raise ValueError(f"'{nombre}' no es una imagen válida.")
+
+
+def _grises(datos, nombre, ruta_por_defecto, dtype=np.uint8):
+    """Array en escala de grises de la imagen subida (o la del TP si no vino)."""
+    imagen = _imagen(datos, nombre) if datos else Image.open(ruta_por_defecto)
+    return np.array(imagen.convert("L"), dtype=dtype)
+
+
+# === Salida: imagen + clave en memoria ===
+
+def _png(pixeles, clave):
+    info = PngImagePlugin.PngInfo()
+    info.add_text(CLAVE_METADATOS, json.dumps(clave))
+    buffer = io.BytesIO()
+    Image.fromarray(pixeles).save(buffer, format="PNG", pnginfo=info)
+    return buffer.getvalue()
+
+
+def _tiff_float(pixeles, clave):
+    buffer = io.BytesIO()
+    Image.fromarray(np.asarray(pixeles, dtype=np.float32), mode="F").save(
+        buffer, format="TIFF", tiffinfo={_TIFF_DESCRIPCION: json.dumps(clave)}
+    )
+    return buffer.getvalue()
+
+
+def _leer_clave(imagen, clave, metodo):
+    """La clave pasada explícitamente o, si no, la de los metadatos de la imagen."""
+    texto = clave
+    if not texto:
+        texto = imagen.info.get(CLAVE_METADATOS)
+    if not texto and hasattr(imagen, "tag_v2"):
+        texto = imagen.tag_v2.get(_TIFF_DESCRIPCION)
+    if not texto:
+        raise ValueError("La imagen no trae la clave en sus metadatos: pásela en el campo 'clave'.")
+    try:
+        datos = json.loads(texto)
+    except ValueError:
+        raise ValueError("La clave no es un JSON válido.")
+    if not isinstance(datos, dict):
+        raise ValueError("La clave debe ser un objeto JSON.")
+    if datos.get("metodo") != metodo:
+        raise ValueError(f"La clave es del método '{datos.get('metodo')}', no de '{metodo}'.")
+    _validar_clave(datos)
+    return datos
+
+
+def _entero(datos, campo, minimo, maximo=None):
+    valor = datos.get(campo)
+    # bool es subclase de int: true/false no son valores válidos
+    if not isinstance(valor, int) or isinstance(valor, bool) or valor < minimo or (maximo is not None and valor > maximo):
+        rango = f"entre {minimo} y {maximo}" if maximo is not None else f">= {minimo}"
+        raise ValueError(f"Clave inválida: '{campo}' debe ser un entero {rango}.")
+
+
+def _real(datos, campo, positivo):
+    valor = datos.get(campo)
+    if (not isinstance(valor, (int, float)) or isinstance(valor, bool) or not np.isfinite(valor)
+            or valor < 0 or (positivo and valor == 0)):
+        raise ValueError(f"Clave inválida: '{campo}' debe ser un número {'> 0' if positivo else '>= 0'}.")
+
+
+def _validar_clave(datos):
+    """Campos y tipos que necesita el decodificador de cada método (ValueError si falta o no sirve)."""
+    metodo = datos["metodo"]
+    if metodo == "lsb":
+        _entero(datos, "k", 1, 8)
+        canales = datos.get("canales")
+        if canales is not None and (
+            not isinstance(canales, list) or not canales
+            or any(not isinstance(c, int) or isinstance(c, bool) or not 0 <= c <= 2 for c in canales)
+            or len(set(canales)) != len(canales)
+        ):
+            raise ValueError("Clave inválida: 'canales' debe ser null o una lista de canales distintos entre 0 y 2.")
+        return
+    forma = datos.get("forma_oculta")
+    if not isinstance(forma, list) or len(forma) != 2 or any(
+        not isinstance(n, int) or isinstance(n, bool) or n < 1 for n in forma
+    ):
+        raise ValueError("Clave inválida: 'forma_oculta' debe ser [alto, ancho] con enteros positivos.")
+    _entero(datos, "repeticiones", 1)
+    if metodo == "fft":
+        _entero(datos, "semilla", 0)
+        _real(datos, "radio_exclusion", positivo=False)
+    else:
+        _real(datos, "delta", positivo=True)
+
+
+# === Métodos (funciones de módulo: corren en el pool de procesos) ===
+
+def ocultar_lsb(portadora, mensaje: bytes, k=1, rgb=False):
+    imagen = _imagen(portadora, "portadora") if portadora else Image.open(inciso_1.IMAGEN_ORIGINAL_PATH)
+    pixeles = np.array(imagen.convert("RGB" if rgb else "L"))
+    clave = {"metodo": "lsb", "k": k, "canales": [0, 1, 2] if rgb else None}
+    return _png(lsb.ocultar(pixeles, mensaje, k=k, canales=clave["canales"]), clave), clave
+
+
+def extraer_lsb(estego, clave=None):
+    imagen = _imagen(estego, "estego")
+    clave = _leer_clave(imagen, clave, "lsb")
+    pixeles = np.array(imagen.convert("RGB" if clave["canales"] else "L"))
+    return lsb.extraer(pixeles, k=clave["k"], canales=clave["canales"]), clave
+
+
+def ocultar_fft(portadora, oculta, repeticiones, semilla, radio_exclusion):
+    portadora = _grises(portadora, "portadora", inciso_2.IMG_PORTADORA)
+    oculta = _grises(oculta, "oculta", inciso_2.IMG_OCULTA)
+    clave = {"metodo": "fft", "forma_oculta": list(oculta.shape), "repeticiones": repeticiones,
+             "semilla": semilla, "radio_exclusion": radio_exclusion}
+    estego = inciso_2.codificar(portadora, oculta, repeticiones, semilla, radio_exclusion)
+    return _png(estego, clave), clave
+
+
+def extraer_fft(estego, clave=None):
+    imagen = _imagen(estego, "estego")
+    clave = _leer_clave(imagen, clave, "fft")
+    pixeles = inciso_2.decodificar(np.array(imagen.convert("L")), tuple(clave["forma_oculta"]),
+                                   clave["repeticiones"], clave["semilla"], clave["radio_exclusion"])
+    return _png(pixeles, clave), clave
+
+
+def ocultar_qim(portadora, oculta, delta, repeticiones):
+    portadora = _grises(portadora, "portadora", inciso_3.PORTADORA_PATH, dtype=np.float64)
+    oculta = _grises(oculta, "oculta", inciso_3.OCULTA_PATH)
+    if oculta.size * 8 * repeticiones > inciso_3.capacidad(portadora.shape):
+        raise ValueError("La imagen oculta no entra en la portadora con esa cantidad de repeticiones.")
+    clave = {"metodo": "qim", "forma_oculta": list(oculta.shape), "delta": delta, "repeticiones": repeticiones}
+    # El estego es float32: redondearlo a 8 bits borraría la paridad de los coeficientes
+    return _tiff_float(inciso_3.ocultar(portadora, oculta, delta, repeticiones), clave), clave
+
+
+def extraer_qim(estego, clave=None):
+    imagen = _imagen(estego, "estego")
+    clave = _leer_clave(imagen, clave, "qim")
+    pixeles = inciso_3.extraer(np.array(imagen, dtype=np.float64), clave["delta"], clave["repeticiones"],
+                               tuple(clave["forma_oculta"]))
+    return _png(pixeles, clave), clave
+
+
+def nueva_semilla():
+    return secrets.randbits(32)
+
+
+async def procesar(funcion, *args):
+    """
+    Corre `funcion(*args)` en el pool de procesos (las requests con las mismas
+    entradas comparten el cálculo). Los ValueError se devuelven como 400.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for arg in args:
+        h.update(arg if isinstance(arg, bytes) else repr(arg).encode())
+        h.update(b"\0")
+    try:
+        return await ejecutar(funcion, *args, clave=f"tp2.estego.{funcion.__name__}:{h.hexdigest()}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
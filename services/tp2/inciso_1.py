@@ -4,6 +4,7 @@ import os
 import numpy as np
 from PIL import Image
 from fastapi.responses import StreamingResponse
+from services.tp2 import lsb
 
 # --- Configuración y Constantes ---
 
@@ -59,37 +60,22 @@ Para enviar más datos usando la misma imagen, se pueden utilizar los **k bits m
 
 # --- Funciones Lógicas ---
 
-def mensaje_a_binario(mensaje: str) -> str:
-    mensaje += "&"  # Marcador de fin
-    return ''.join([format(ord(c), '08b') for c in mensaje])
-
-def binario_a_mensaje(binario: str) -> str:
-    # Agrupamos de a 8 bits
-    chars = [binario[i:i+8] for i in range(0, len(binario), 8)]
-    # Convertimos a int y luego a char
-    texto_completo = "".join([chr(int(b, 2)) for b in chars if len(b) == 8])
-    return texto_completo.split("&")[0]  # Cortar al marcador
+def mensaje_a_bytes(mensaje: str) -> bytes:
+    # Un byte por caracter (Latin-1), como format(ord(c), '08b') del método original
+    try:
+        return mensaje.encode("latin-1")
+    except UnicodeEncodeError:
+        raise ValueError("El mensaje solo puede tener caracteres de 8 bits (Latin-1).")
 
-def ocultar_mensaje_en_imagen(mensaje: str) -> str:
+def ocultar_mensaje_en_imagen(mensaje: str, k: int = 1, rgb: bool = False) -> str:
     try:
         if not os.path.exists(IMAGEN_ORIGINAL_PATH):
             return "Error: No se encontró la imagen portadora en el servidor."
 
-        imagen = Image.open(IMAGEN_ORIGINAL_PATH).convert('L')
-        datos = np.array(imagen).flatten()
-        bin_mensaje = mensaje_a_binario(mensaje)
-
-        if len(bin_mensaje) > len(datos):
-            max_chars = len(datos) // 8
-            raise ValueError(f"Mensaje demasiado largo. Máximo permitido: {max_chars} caracteres.")
+        imagen = Image.open(IMAGEN_ORIGINAL_PATH).convert('RGB' if rgb else 'L')
+        datos = lsb.ocultar(np.array(imagen), mensaje_a_bytes(mensaje), k=k)
 
-        # Vectorización (más rápido que el loop for si fuera posible, pero mantenemos tu lógica por claridad o si prefieres loop)
-        # Para mantener tu lógica exacta del loop:
-        for i, bit in enumerate(bin_mensaje):
-            # Limpiar LSB y poner el bit del mensaje
-            datos[i] = (datos[i] & 0b11111110) | int(bit)
-
-        nueva_imagen = Image.fromarray(np.reshape(datos, imagen.size[::-1]).astype(np.uint8))
+        nueva_imagen = Image.fromarray(datos)
         nueva_imagen.save(IMAGEN_ESTEGANOGRAFICA_PATH)
 
         return f"Imagen guardada correctamente en {IMAGEN_ESTEGANOGRAFICA_PATH}"
@@ -97,19 +83,17 @@ def ocultar_mensaje_en_imagen(mensaje: str) -> str:
     except Exception as e:
         return f"Error al ocultar mensaje: {str(e)}"
 
-def extraer_mensaje_de_imagen() -> str:
+def extraer_mensaje_de_imagen(k: int = 1) -> str:
     try:
         if not os.path.exists(IMAGEN_ESTEGANOGRAFICA_PATH):
             return "Primero debes ocultar un mensaje para generar la imagen estego."
 
-        imagen = Image.open(IMAGEN_ESTEGANOGRAFICA_PATH).convert('L')
-        datos = np.array(imagen).flatten()
-
-        # Extraer LSBs
-        bits = [str(pixel & 1) for pixel in datos]
-        binario = ''.join(bits)
+        # Se lee en el modo en que se guardó (L o RGB)
+        imagen = Image.open(IMAGEN_ESTEGANOGRAFICA_PATH)
+        if imagen.mode not in ('L', 'RGB'):
+            imagen = imagen.convert('L')
 
-        mensaje = binario_a_mensaje(binario)
+        mensaje = lsb.extraer(np.array(imagen), k=k).decode("latin-1")
 
         return f"Mensaje extraído correctamente: '{mensaje}'"
 
@@ -139,7 +123,9 @@ def obtener_imagen_estego() -> StreamingResponse:
     if not os.path.exists(IMAGEN_ESTEGANOGRAFICA_PATH):
         raise FileNotFoundError("La imagen estego no fue generada todavía.")
 
-    imagen = Image.open(IMAGEN_ESTEGANOGRAFICA_PATH).convert("L")
+    imagen = Image.open(IMAGEN_ESTEGANOGRAFICA_PATH)
+    if imagen.mode not in ("L", "RGB"):
+        imagen = imagen.convert("L")
     buffer = io.BytesIO()
     imagen.save(buffer, format="PNG")
     buffer.seek(0)
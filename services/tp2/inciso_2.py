@@ -2,6 +2,8 @@ from PIL import Image
 import numpy as np
 import os
 
+from services.tp2 import posiciones as indice_posiciones
+
 # === Paths ===
 BASE_PATH = "data/tp2/"
 IMG_PORTADORA = os.path.join(BASE_PATH, "globo.png")
@@ -9,85 +11,78 @@ IMG_OCULTA = os.path.join(BASE_PATH, "wp.png")
 IMG_ESTEGANOGRAFICA = os.path.join(BASE_PATH, "imagen_estego2.tiff")
 IMG_RECUPERADA = os.path.join(BASE_PATH, "imagen_recuperada.png")
 
-# === Variables globales (persistentes en el backend) ===
-_ultima_posiciones = None  # Para guardar las posiciones usadas en el encoding
-_repeticiones = 7  # Nivel de redundancia
+# === Parámetros del método ===
+# Las posiciones salen de una permutación con semilla: el decodificador las
+# regenera con la misma semilla, sin estado compartido entre requests ni procesos
+REPETICIONES = 7  # Nivel de redundancia
+RADIO_EXCLUSION = 40
+SEMILLA = 0
 
 # === Funciones utilitarias ===
 def cargar_grises(path):
     return np.array(Image.open(path).convert('L'))
 
-def obtener_posiciones_validas(shape, radio_exclusion=40, n=0):
-    h, w = shape
-    centro = (h // 2, w // 2)
-    Y, X = np.meshgrid(np.arange(h), np.arange(w), indexing='ij')
-    dist = np.sqrt((Y - centro[0]) ** 2 + (X - centro[1]) ** 2)
-    mask = dist > radio_exclusion
-    indices = np.argwhere(mask)
-    posiciones = []
-    usados = set()
-    for i, j in indices:
-        ci, cj = (-i) % h, (-j) % w
-        if (ci, cj) not in usados and (i, j) not in usados and (i, j) < (ci, cj):
-            posiciones.append((i, j, ci, cj))
-            usados.add((i, j))
-            usados.add((ci, cj))
-    np.random.shuffle(posiciones)
-    return posiciones[:n]
+def obtener_posiciones_validas(shape, radio_exclusion=RADIO_EXCLUSION, n=0, semilla=SEMILLA):
+    """Array (n, 4) con i, j, ci, cj de las `n` posiciones a usar (ver services/tp2/posiciones.py)."""
+    return indice_posiciones.posiciones(shape, radio_exclusion, n, semilla)
 
 # === Codificador ===
-def ocultar_imagen_en_fft():
-    global _ultima_posiciones
-
-    portadora = cargar_grises(IMG_PORTADORA)
-    oculta = cargar_grises(IMG_OCULTA)
-    bits = np.unpackbits(oculta.flatten())
-    bits_rep = np.repeat(bits, _repeticiones)
+def codificar(portadora, oculta, repeticiones=REPETICIONES, semilla=SEMILLA, radio_exclusion=RADIO_EXCLUSION):
+    """Imagen estego (uint8) con los bits de `oculta` en el signo de la parte imaginaria de la FFT."""
+    bits = np.unpackbits(np.asarray(oculta, dtype=np.uint8).flatten())
+    bits_rep = np.repeat(bits, repeticiones)
 
-    posiciones = obtener_posiciones_validas(portadora.shape, radio_exclusion=40, n=len(bits_rep))
-    _ultima_posiciones = posiciones  # Guardamos para el decoder
+    posiciones = obtener_posiciones_validas(portadora.shape, radio_exclusion, n=len(bits_rep), semilla=semilla)
+    if len(posiciones) < len(bits_rep):
+        raise ValueError(
+            f"La imagen oculta no entra: hacen falta {len(bits_rep)} coeficientes y la portadora tiene {len(posiciones)}."
+        )
 
     portadora_f = np.fft.fft2(portadora)
 
-    for idx, bit in enumerate(bits_rep):
-        i, j, ci, cj = posiciones[idx]
-        val = portadora_f[i, j]
-        imag = abs(val.imag) if bit == 1 else -abs(val.imag)
-        portadora_f[i, j] = complex(val.real, imag)
-        portadora_f[ci, cj] = complex(val.real, -imag)
+    # Todas las posiciones y sus conjugadas de una vez (las posiciones no se repiten)
+    i, j, ci, cj = posiciones.T
+    val = portadora_f[i, j]
+    imag = np.where(bits_rep == 1, np.abs(val.imag), -np.abs(val.imag))
+    portadora_f[i, j] = val.real + 1j * imag
+    portadora_f[ci, cj] = val.real - 1j * imag
 
     estego = np.real(np.fft.ifft2(portadora_f))
-    estego = np.clip(estego, 0, 255).astype(np.uint8)
+    return np.clip(estego, 0, 255).astype(np.uint8)
+
+def ocultar_imagen_en_fft():
+    portadora = cargar_grises(IMG_PORTADORA)
+    oculta = cargar_grises(IMG_OCULTA)
+    estego = codificar(portadora, oculta)
     Image.fromarray(estego).save(IMG_ESTEGANOGRAFICA, format='TIFF')
 
-    return f"Imagen '{IMG_OCULTA}' ocultada correctamente en '{IMG_ESTEGANOGRAFICA}'. Total bits (c/ redundancia): {len(bits_rep)}"
+    total_bits = oculta.size * 8 * REPETICIONES
+    return f"Imagen '{IMG_OCULTA}' ocultada correctamente en '{IMG_ESTEGANOGRAFICA}'. Total bits (c/ redundancia): {total_bits}"
 
 # === Decodificador ===
-def extraer_imagen_de_fft():
-    global _ultima_posiciones
-
-    if _ultima_posiciones is None:
-        return "Primero debe ejecutarse el ocultamiento para obtener las posiciones"
-
-    estego = cargar_grises(IMG_ESTEGANOGRAFICA)
-    oculta_original = cargar_grises(IMG_OCULTA)
-    shape_oculta = oculta_original.shape
+def decodificar(estego, shape_oculta, repeticiones=REPETICIONES, semilla=SEMILLA, radio_exclusion=RADIO_EXCLUSION):
+    """Imagen oculta (uint8, `shape_oculta`) recuperada por votación de los signos."""
+    n = shape_oculta[0] * shape_oculta[1] * 8 * repeticiones
+    posiciones = obtener_posiciones_validas(estego.shape, radio_exclusion, n=n, semilla=semilla)
+    if len(posiciones) < n:
+        raise ValueError("La imagen estego es demasiado chica para la imagen oculta indicada.")
 
     estego_f = np.fft.fft2(estego)
-    bits_extraidos = []
+    i, j = posiciones[:, 0], posiciones[:, 1]
+    bits_extraidos = estego_f[i, j].imag >= 0
 
-    for i, j, _, _ in _ultima_posiciones:
-        val = estego_f[i, j]
-        bit = 1 if val.imag >= 0 else 0
-        bits_extraidos.append(bit)
+    # Votación: una fila por bit, una columna por repetición
+    votos = bits_extraidos.reshape(-1, repeticiones).sum(axis=1)
+    bits = (votos >= repeticiones / 2).astype(np.uint8)
+    return np.packbits(bits).reshape(shape_oculta)
 
-    bits = []
-    for i in range(0, len(bits_extraidos), _repeticiones):
-        votos = bits_extraidos[i:i+_repeticiones]
-        bits.append(int(np.sum(votos) >= (_repeticiones / 2)))
+def extraer_imagen_de_fft():
+    if not os.path.exists(IMG_ESTEGANOGRAFICA):
+        return "Primero debe ejecutarse el ocultamiento para generar la imagen estego"
 
-    bits_array = np.array(bits[:shape_oculta[0] * shape_oculta[1] * 8], dtype=np.uint8)
-    pixels = np.packbits(bits_array).reshape(shape_oculta)
+    estego = cargar_grises(IMG_ESTEGANOGRAFICA)
+    oculta_original = cargar_grises(IMG_OCULTA)
+    pixels = decodificar(estego, oculta_original.shape)
     Image.fromarray(pixels).save(IMG_RECUPERADA)
 
     # Métricas
@@ -145,7 +140,7 @@ PROBLEMAS_FFT = """
 - Mantener la simetría conjugada para no alterar la realcez de la imagen
 - Selección de posiciones válidas alejadas del centro para evitar artefactos
 - Necesidad de repetir los bits para mejorar la robustez (votación)
-- Gestión de las posiciones usadas: en esta implementación se mantienen en memoria (no se serializan)
+- Gestión de las posiciones usadas: se regeneran a partir de una semilla (no se guardan en memoria entre requests)
 """
 
 CONCLUSIONES_FFT = """
@@ -11,7 +11,6 @@ ESTEGO_PATH = "data/tp2/imagen_estego2.png"
 RECUPERADA_PATH = "data/tp2/imagen_recuperada2.png"
 
 REP_GLOBAL = 3
-SHAPE_OCULTA = None
 
 CONSIGNA_DELTA = """
 Modificar las componentes de la TF2D utilizando un parámetro arbitrario δ y una modificación basada en q.
@@ -45,84 +44,81 @@ CONCLUSIONES_DELTA = """
 def cargar_grises(path):
     return np.array(Image.open(path).convert("L"), dtype=np.float64)
 
+def _flotante(imagen):
+    """float32 se mantiene (rfft2 trabaja en simple precisión); el resto pasa a float64."""
+    imagen = np.asarray(imagen)
+    return imagen if imagen.dtype == np.float32 else imagen.astype(np.float64)
+
+def _columnas_utiles(ancho):
+    """
+    Columnas del espectro de rfft2 donde se puede escribir. La columna 0 (y la de
+    Nyquist si el ancho es par) es su propia conjugada: irfft2 la simetriza y
+    se perdería la paridad, así que se saltean.
+    """
+    return slice(1, (ancho + 1) // 2)
+
+def capacidad(shape):
+    """Bits (con repeticiones) que entran en una portadora de la forma dada."""
+    h, w = shape
+    columnas = _columnas_utiles(w)
+    return 2 * h * len(range(*columnas.indices(w // 2 + 1)))
+
+def _paridad(valores, bits, delta):
+    """a' = signo · q · δ con q = |round(a/δ)| llevado a la paridad del bit."""
+    signo = np.where(valores >= 0, 1, -1)
+    q = np.round(np.abs(valores) / delta)
+    distinto = (q % 2) != bits
+    # q par -> q + 1, q impar -> q - 1 (nunca baja de 0)
+    q = np.where(distinto, q + np.where(q % 2 == 0, 1, -1), q)
+    return (signo * q * delta).astype(valores.dtype)
+
 def ocultar(portadora, oculta, delta, rep):
-    tf = np.fft.fftshift(np.fft.fft2(portadora))
-    real = np.real(tf).flatten()
-    imag = np.imag(tf).flatten()
+    portadora = _flotante(portadora)
+    h, w = portadora.shape
+    tf = np.fft.rfft2(portadora)
+    columnas = _columnas_utiles(w)
+    bloque = tf[:, columnas]
 
     bits = np.unpackbits(oculta.astype(np.uint8).flatten())
-    bits_rep = np.repeat(bits, rep)
-    capacidad = min(len(bits_rep), len(real) + len(imag))
-    bits_rep = bits_rep[:capacidad]
-
-    real_mod = real.copy()
-    imag_mod = imag.copy()
-    idx_real = idx_imag = 0
-
-    for i, bit in enumerate(bits_rep):
-        if i % 2 == 0:
-            a = real_mod[idx_real]
-            signo = 1 if a >= 0 else -1
-            q = int(np.round(abs(a) / delta))
-            if q % 2 != bit:
-                q += 1 if q % 2 == 0 else -1
-            real_mod[idx_real] = signo * q * delta
-            idx_real += 1
-        else:
-            b = imag_mod[idx_imag]
-            signo = 1 if b >= 0 else -1
-            q = int(np.round(abs(b) / delta))
-            if q % 2 != bit:
-                q += 1 if q % 2 == 0 else -1
-            imag_mod[idx_imag] = signo * q * delta
-            idx_imag += 1
-
-    tf_mod = (real_mod + 1j * imag_mod).reshape(portadora.shape)
-    tf_mod = np.fft.ifftshift(tf_mod)
-    estego = np.fft.ifft2(tf_mod)
-    estego = np.real(estego)
-    estego = np.clip(estego, 0, 255)
+    bits_rep = np.repeat(bits, rep)[:capacidad(portadora.shape)]
 
-    # Guardamos en float32 para no perder precisión
-    np.save(ESTEGO_PATH.replace(".png", ".npy"), estego.astype(np.float32))
+    # Bits pares a la parte real, impares a la imaginaria, coeficiente por coeficiente
+    real = bloque.real.flatten()
+    imag = bloque.imag.flatten()
+    bits_real, bits_imag = bits_rep[0::2], bits_rep[1::2]
+    real[:len(bits_real)] = _paridad(real[:len(bits_real)], bits_real, delta)
+    imag[:len(bits_imag)] = _paridad(imag[:len(bits_imag)], bits_imag, delta)
+    tf[:, columnas] = (real + 1j * imag).reshape(bloque.shape)
+
+    estego = np.fft.irfft2(tf, s=(h, w))
+    estego = np.clip(estego, 0, 255)
+    # float32: al redondear a uint8 se pierde la paridad de los coeficientes
     return estego.astype(np.float32)
 
 def extraer(estego, delta, rep, shape_recuperada):
-    tf = np.fft.fftshift(np.fft.fft2(estego))
-    real = np.real(tf).flatten()
-    imag = np.imag(tf).flatten()
-
-    total_bits = shape_recuperada[0] * shape_recuperada[1] * 8
-    total_bits_rep = total_bits * rep
-
-    bits_extraidos = []
-    idx_real = idx_imag = 0
-    for i in range(total_bits_rep):
-        if i % 2 == 0:
-            a = real[idx_real]; idx_real += 1
-        else:
-            a = imag[idx_imag]; idx_imag += 1
-        q = int(np.round(abs(a) / delta))
-        bits_extraidos.append(q % 2)
-
-    bits_finales = []
-    for i in range(0, len(bits_extraidos), rep):
-        bloque = bits_extraidos[i:i+rep]
-        if len(bloque) < rep:
-            break
-        bit = int(np.sum(bloque) >= (rep // 2 + 1))
-        bits_finales.append(bit)
-
-    bits_finales = np.array(bits_finales[: (len(bits_finales) // 8) * 8])
-    pixeles = np.packbits(bits_finales)
-    return pixeles[:shape_recuperada[0]*shape_recuperada[1]].reshape(shape_recuperada)
+    estego = _flotante(estego)
+    total_bits_rep = shape_recuperada[0] * shape_recuperada[1] * 8 * rep
+    if total_bits_rep > capacidad(estego.shape):
+        raise ValueError("La imagen estego es demasiado chica para la imagen oculta indicada.")
+
+    bloque = np.fft.rfft2(estego)[:, _columnas_utiles(estego.shape[1])]
+    n_imag = total_bits_rep // 2
+    bits_extraidos = np.empty(total_bits_rep, dtype=np.uint8)
+    bits_extraidos[0::2] = np.round(np.abs(bloque.real.flatten()[:total_bits_rep - n_imag]) / delta) % 2
+    bits_extraidos[1::2] = np.round(np.abs(bloque.imag.flatten()[:n_imag]) / delta) % 2
+
+    # Votación: una fila por bit, una columna por repetición
+    votos = bits_extraidos.reshape(-1, rep).sum(axis=1)
+    bits_finales = (votos >= rep // 2 + 1).astype(np.uint8)
+    return np.packbits(bits_finales).reshape(shape_recuperada)
 
 def ocultar_imagen_post(delta: float):
-    global SHAPE_OCULTA
     portadora = cargar_grises(PORTADORA_PATH)
     oculta = cargar_grises(OCULTA_PATH)
-    SHAPE_OCULTA = oculta.shape
-    _ = ocultar(portadora, oculta, delta, REP_GLOBAL)
+    estego = ocultar(portadora, oculta, delta, REP_GLOBAL)
+
+    # Guardamos en float32 para no perder precisión
+    np.save(ESTEGO_PATH.replace(".png", ".npy"), estego)
     return f"✅ Imagen estego generada con δ={delta} y guardada en formato binario (.npy)"
 
 def extraer_imagen_post(delta: float):
@@ -0,0 +1,106 @@
+# services/tp2/lsb.py
+"""
+Codec LSB vectorizado.
+
+Los bits del mensaje se obtienen con `np.unpackbits` y se escriben en los k
+bits menos significativos de cada muestra con una máscara (un par de
+operaciones sobre todo el array, sin loops de Python). Una muestra es el valor
+de un canal de un píxel: en escala de grises hay una por píxel, y en color una
+por cada canal elegido (p. ej. R, G y B), en orden píxel por píxel.
+
+Con k = 1 y un solo canal el resultado es bit a bit el del método del TP:
+el bit i del mensaje (MSB primero en cada byte) va al LSB de la muestra i.
+Con k > 1 cada muestra lleva k bits consecutivos, el primero en la posición
+más significativa de las k.
+
+La extracción lee de a tramos crecientes y corta en el primer delimitador, así
+que un mensaje corto en una imagen grande no recorre toda la imagen.
+"""
+import numpy as np
+
+DELIMITADOR = b"&"
+# Muestras del primer tramo que se lee al extraer (después se duplica)
+MUESTRAS_TRAMO_INICIAL = 1 << 12
+
+
+def _validar_k(k):
+    if not 1 <= k <= 8:
+        raise ValueError("La cantidad de bits por muestra (k) debe estar entre 1 y 8.")
+
+
+def _muestras(imagen, canales):
+    """Muestras uint8 en orden de lectura (copia si hay que elegir canales)."""
+    imagen = np.asarray(imagen)
+    if imagen.dtype != np.uint8:
+        raise ValueError("La imagen debe ser de 8 bits por canal (uint8).")
+    if canales is None or imagen.ndim == 2:
+        return imagen.reshape(-1)
+    return imagen[..., list(canales)].reshape(-1)
+
+
+def capacidad(forma, k=1, canales=None):
+    """Bytes que entran en una imagen de la forma dada (delimitador incluido)."""
+    _validar_k(k)
+    pixeles = int(np.prod(forma[:2]))
+    if len(forma) == 2:
+        n_canales = 1
+    else:
+        n_canales = len(canales) if canales is not None else forma[2]
+    return pixeles * n_canales * k // 8
+
+
+def ocultar(portadora, datos: bytes, k=1, canales=None, delimitador=DELIMITADOR):
+    """
+    Devuelve una copia de `portadora` (uint8, HxW o HxWxC) con `datos` más el
+    delimitador en los k LSB de las muestras de `canales` (None = todos).
+    """
+    _validar_k(k)
+    imagen = np.array(portadora, dtype=np.uint8, copy=True)
+    muestras = _muestras(imagen, canales).copy()
+    carga = np.frombuffer(bytes(datos) + delimitador, dtype=np.uint8)
+    if len(carga) > capacidad(imagen.shape, k, canales):
+        raise ValueError(
+            f"Mensaje demasiado largo. Máximo permitido: {capacidad(imagen.shape, k, canales) - len(delimitador)} bytes."
+        )
+
+    bits = np.unpackbits(carga)
+    bits = np.pad(bits, (0, -len(bits) % k))
+    # Cada grupo de k bits pasa a ser un valor de 0 a 2^k - 1 (packbits completa con ceros a la derecha)
+    valores = np.packbits(bits.reshape(-1, k), axis=1)[:, 0] >> np.uint8(8 - k)
+    mascara = np.uint8(0xFF ^ ((1 << k) - 1))
+    n = len(valores)
+    muestras[:n] = (muestras[:n] & mascara) | valores
+
+    if canales is None or imagen.ndim == 2:
+        return muestras.reshape(imagen.shape)
+    imagen[..., list(canales)] = muestras.reshape(imagen.shape[:2] + (len(canales),))
+    return imagen
+
+
+def _bytes_de(muestras, k):
+    """Bytes formados por los k LSB de cada muestra (se descartan los bits sobrantes)."""
+    valores = muestras & np.uint8((1 << k) - 1)
+    bits = np.unpackbits(valores[:, None], axis=1)[:, 8 - k:].reshape(-1)
+    return np.packbits(bits[:len(bits) // 8 * 8]).tobytes()
+
+
+def extraer(estego, k=1, canales=None, delimitador=DELIMITADOR):
+    """
+    Bytes ocultos hasta el primer delimitador (sin incluirlo). Si no hay
+    delimitador devuelve todo lo que se pudo leer.
+    """
+    _validar_k(k)
+    muestras = _muestras(estego, canales)
+    # Tramos de múltiplos de 8 muestras: 8*k bits = k bytes completos
+    fin = MUESTRAS_TRAMO_INICIAL
+    leidos = b""
+    inicio = 0
+    while inicio < len(muestras):
+        # El delimitador puede haber quedado partido entre el tramo anterior y este
+        desde = max(0, len(leidos) - len(delimitador) + 1)
+        leidos += _bytes_de(muestras[inicio:fin], k)
+        posicion = leidos.find(delimitador, desde)
+        if posicion >= 0:
+            return leidos[:posicion]
+        inicio, fin = fin, 2 * fin
+    return leidos
@@ -0,0 +1,63 @@
+# services/tp2/posiciones.py
+"""
+Índice de posiciones de la FFT para la esteganografía por signo (inciso 2).
+
+El conjunto de coeficientes válidos depende solo de la forma de la imagen y del
+radio de exclusión: son los (i, j) fuera del círculo central que son "menores"
+(en orden lexicográfico) que su conjugado (-i mod h, -j mod w), así que cada
+par conjugado aparece una sola vez y quedan afuera los coeficientes que son su
+propio conjugado. Se calcula con operaciones de arrays sobre toda la grilla y
+se guarda en un cache LRU por (forma, radio).
+
+El orden de uso sale de una permutación con semilla: cualquier worker regenera
+las mismas posiciones con la misma semilla, sin estado compartido. La
+permutación es la misma que daba mezclar la lista del método original con
+`default_rng(semilla).shuffle`, así que las claves ya emitidas siguen sirviendo.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+TP2_POSICIONES_CACHE_MAX = int(os.environ.get("TP2_POSICIONES_CACHE_MAX", "8"))
+
+_indices = OrderedDict()
+_lock = threading.Lock()
+
+
+def _calcular(shape, radio_exclusion):
+    h, w = shape
+    i = np.arange(h)[:, None]
+    j = np.arange(w)[None, :]
+    fuera = np.sqrt((i - h // 2) ** 2 + (j - w // 2) ** 2) > radio_exclusion
+    ci, cj = (-i) % h, (-j) % w
+    menor = (i < ci) | ((i == ci) & (j < cj))
+    # nonzero recorre fila por fila: mismo orden que el loop original
+    i_val, j_val = np.nonzero(fuera & menor)
+    indice = np.stack([i_val, j_val, (-i_val) % h, (-j_val) % w], axis=1).astype(np.intp)
+    indice.flags.writeable = False
+    return indice
+
+
+def indice(shape, radio_exclusion):
+    """Array (m, 4) de solo lectura con i, j, ci, cj de todas las posiciones válidas."""
+    clave = (int(shape[0]), int(shape[1]), float(radio_exclusion))
+    with _lock:
+        if clave in _indices:
+            _indices.move_to_end(clave)
+            return _indices[clave]
+    calculado = _calcular(clave[:2], radio_exclusion)
+    with _lock:
+        _indices[clave] = calculado
+        _indices.move_to_end(clave)
+        while len(_indices) > TP2_POSICIONES_CACHE_MAX:
+            _indices.popitem(last=False)
+    return calculado
+
+
+def posiciones(shape, radio_exclusion, n, semilla):
+    """Las primeras `n` posiciones (array (n, 4)) de la permutación dada por la semilla."""
+    validas = indice(shape, radio_exclusion)
+    orden = np.random.default_rng(semilla).permutation(len(validas))
+    return validas[orden[:n]]
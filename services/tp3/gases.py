@@ -1,5 +1,4 @@
 from fastapi.responses import  StreamingResponse
-import matplotlib.pyplot as plt
 import numpy as np
 import io
 import time
@@ -7,6 +6,8 @@ import sympy as sp
 import matplotlib.patches as patches
 
 from models.tp3.gases import ParametrosIniciales
+from services.common.render_cache import cache_png
+from services.common.graficos import nueva_figura, figura_a_png
 
 # ---------------------
 # Constantes y funciones
@@ -397,8 +398,9 @@ def calcular_volumenes():
 
     return resultados
 
+@cache_png()
 def generar_grafico_gases(resultados):
-    fig, axs = plt.subplots(1, len(resultados), figsize=(14, 5))
+    fig, axs = nueva_figura(1, len(resultados), figsize=(14, 5))
 
     for i, (P, v_ideal, v_real, mensaje) in enumerate(resultados):
         ax = axs[i] if len(resultados) > 1 else axs
@@ -446,12 +448,8 @@ def generar_grafico_gases(resultados):
         y_margin = (np.nanmax(f_plot) - np.nanmin(f_plot)) * 0.1
         ax.set_ylim(np.nanmin(f_plot) - y_margin, np.nanmax(f_plot) + y_margin)
 
-    plt.tight_layout()
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    plt.close()
-    buf.seek(0)
-    return buf
+    fig.tight_layout()
+    return figura_a_png(fig)
 
 
 # --- Buscar intervalo válido ---
@@ -487,23 +485,20 @@ def generar_grafico_general(v_ideal, v_real, P, T):
     v_plot = v_vals[mask]
     f_plot = f_vals[mask]
 
-    plt.figure(figsize=(8, 5))
-    plt.plot(v_plot, f_plot, label='f(v)', color='blue')
-    plt.axhline(0, color='black', linestyle='--', linewidth=1)
-    plt.axvline(v_ideal, color='red', linestyle=':', linewidth=1.5, label=f'v_ideal ≈ {v_ideal:.6f}')
-    plt.axvline(v_real, color='green', linestyle='--', linewidth=1.5, label=f'v_real ≈ {v_real:.6f}')
-
-    plt.title(f'Función de Van der Waals a {P/1e6:.1f} MPa', fontsize=14)
-    plt.xlabel('Volumen molar [m³/mol]')
-    plt.ylabel('f(v)', fontsize=12)
-    plt.grid(True, linestyle='--', alpha=0.5)
-    plt.legend()
-    plt.tight_layout()
-
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    plt.close()
-    buf.seek(0)
+    fig, ax = nueva_figura(figsize=(8, 5))
+    ax.plot(v_plot, f_plot, label='f(v)', color='blue')
+    ax.axhline(0, color='black', linestyle='--', linewidth=1)
+    ax.axvline(v_ideal, color='red', linestyle=':', linewidth=1.5, label=f'v_ideal ≈ {v_ideal:.6f}')
+    ax.axvline(v_real, color='green', linestyle='--', linewidth=1.5, label=f'v_real ≈ {v_real:.6f}')
+
+    ax.set_title(f'Función de Van der Waals a {P/1e6:.1f} MPa', fontsize=14)
+    ax.set_xlabel('Volumen molar [m³/mol]')
+    ax.set_ylabel('f(v)', fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.5)
+    ax.legend()
+    fig.tight_layout()
+
+    buf = figura_a_png(fig)
     return StreamingResponse(buf, media_type='image/png')
 
 
@@ -513,7 +508,7 @@ def generar_grafico_zoom(v_real, P, T):
     v_zoom_vals = np.linspace(v_real - delta, v_real + delta, 1000)
     f_zoom_vals = [van_der_waals_eq(v, P, T) for v in v_zoom_vals]
 
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = nueva_figura(figsize=(8, 5))
 
     ax.plot(v_zoom_vals, f_zoom_vals, label='f(v) (zoom)', color='royalblue', linewidth=2)
     ax.axhline(0, color='black', linestyle='--', linewidth=1)
@@ -532,12 +527,9 @@ def generar_grafico_zoom(v_real, P, T):
     ax.legend()
     ax.ticklabel_format(style='plain', axis='x')
     ax.ticklabel_format(style='plain', axis='y')
-    plt.tight_layout()
+    fig.tight_layout()
 
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    plt.close()
-    buf.seek(0)
+    buf = figura_a_png(fig)
     return StreamingResponse(buf, media_type='image/png')
  
 # --- Método de Taylor de segundo orden para Van der Waals ---
@@ -693,6 +685,7 @@ En esta etapa, se calculó nuevamente el volumen molar real del CO₂, esta vez
 - La implementación demostró que el método de Taylor, reforzado con una lógica de validación tipo bisección, puede ser una alternativa precisa, rápida y físicamente confiable.
 """
 
+@cache_png()
 def generar_grafico_volumenes_comparados(P=0.5e6, T=200.0):
     """
     Genera un gráfico comparativo entre el volumen molar ideal y el volumen molar real (CO₂)
@@ -718,7 +711,7 @@ def generar_grafico_volumenes_comparados(P=0.5e6, T=200.0):
     v_combinado = historial_combinado[-1]["x"]
 
     # Crear gráfico
-    fig, ax = plt.subplots(figsize=(7, 5))
+    fig, ax = nueva_figura(figsize=(7, 5))
 
     etiquetas = ["Gas ideal", "CO₂ - Taylor", "CO₂ - Taylor + Bisección"]
     valores = [v_ideal, v_taylor, v_combinado]
@@ -742,17 +735,13 @@ def generar_grafico_volumenes_comparados(P=0.5e6, T=200.0):
         ax.text(i, valor + max(valores) * 0.01, f"{valor:.8f}", ha="center", fontsize=10)
 
     ax.grid(axis="y", linestyle="--", alpha=0.5)
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Guardar en buffer
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format="png")
-    plt.close()
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
 
 def generar_imagen_error_volumen():
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = nueva_figura(figsize=(8, 5))
     ax.axis("off")
 
     # Fondo suave
@@ -784,9 +773,5 @@ def generar_imagen_error_volumen():
         va="center", fontsize=11, weight="bold", color="#000"
     )
 
-    plt.tight_layout()
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    plt.close()
-    buf.seek(0)
-    return buf
\ No newline at end of file
+    fig.tight_layout()
+    return figura_a_png(fig)
\ No newline at end of file
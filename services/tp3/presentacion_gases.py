@@ -1,8 +1,7 @@
-import io
 import numpy as np
-import matplotlib.pyplot as plt
 from scipy.optimize import fsolve
-from io import BytesIO
+from services.common.render_cache import cache_png
+from services.common.graficos import nueva_figura, figura_a_png
 
 # Constantes físicas
 R = 8.314  # J/(mol·K)
@@ -14,9 +13,10 @@ T = 200.0  # K
 temperaturas = [150, 200, 250, 300]
 colores = ['blue', 'green', 'orange', 'red']
 
+@cache_png()
 def generar_grafico_comparativo_gral():
     Vm = np.linspace(0.05, 5, 500)  # Volumen molar en L/mol
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = nueva_figura(figsize=(10, 6))
 
     for T, color in zip(temperaturas, colores):
         P_vdw = (n * R * T) / (Vm - b) - a / Vm**2  # presión en Pa
@@ -30,19 +30,16 @@ def generar_grafico_comparativo_gral():
     ax.set_title("Comportamiento del CO₂: Gas Ideal vs Van der Waals")
     ax.legend(loc='upper right')
     ax.grid(True)
-    plt.tight_layout()
+    fig.tight_layout()
 
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
 
+@cache_png()
 def generar_grafico_comparativo_z():
     P_MPa = np.linspace(0.1, 10, 300)
     P_Pa = P_MPa * 1e6
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = nueva_figura(figsize=(10, 6))
 
     def resolver_vm(P, T):
         def f(Vm):
@@ -69,14 +66,11 @@ def generar_grafico_comparativo_z():
     ax.set_title("Factor de Compresibilidad del CO₂ según Van der Waals")
     ax.legend(loc='upper left')
     ax.grid(True)
-    plt.tight_layout()
+    fig.tight_layout()
 
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
 
+@cache_png()
 def generar_grafico_f_vdw():
     # Presiones a comparar
     R = 8.314
@@ -97,7 +91,7 @@ def generar_grafico_f_vdw():
         return (P + a / v**2) * (v - b) - R * T
 
     # Crear gráfico
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = nueva_figura(figsize=(10, 6))
 
     for etiqueta, P in presiones.items():
         f_vals = []
@@ -123,8 +117,4 @@ def generar_grafico_f_vdw():
     fig.tight_layout()
 
     # Guardar imagen en buffer
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png")
-    plt.close(fig)
-    buf.seek(0)
-    return buf
\ No newline at end of file
+    return figura_a_png(fig)
\ No newline at end of file
@@ -1,13 +1,10 @@
 import sympy as sp
 import numpy as np
 import io
-import matplotlib
-matplotlib.use('Agg')  # Evita problemas con backends gráficos
-import matplotlib.pyplot as plt
 import time
 from scipy.optimize import brentq
-from io import BytesIO
-from fastapi.responses import StreamingResponse
+from services.common.render_cache import cache_png
+from services.common.graficos import nueva_figura, figura_a_png
 
 
 def obtener_funciones_expr():
@@ -120,6 +117,15 @@ def metodo_taylor_segundo_orden(f, f1, f2, x0=3.0, tol=1e-12, max_iter=50):
 
     return historial, "\n".join(salida)
 
+@cache_png()
+def generar_grafico_iteraciones():
+    """Función, iteraciones de Taylor (3 pasos) y su gráfico, sin argumentos para poder cachearlo."""
+    f, f1, f2 = obtener_funciones_numericas()
+    historial, _ = metodo_taylor_segundo_orden(f, f1, f2, max_iter=3)
+    if not historial:
+        return None
+    return graficar_iteraciones(historial, f, r"e^{-x} \cos(5x) - \frac{1}{100}x")
+
 def graficar_iteraciones(historial, f, funcion_str="f(x)"):
     xs = [step['x'] for step in historial]
     ys = [step['f'] for step in historial]
@@ -138,9 +144,9 @@ def graficar_iteraciones(historial, f, funcion_str="f(x)"):
     y_range = max(ys_all) - min(ys_all)
     offset = 0.05 * y_range
 
-    plt.figure(figsize=(10, 6))
-    plt.plot(x_vals, y_vals, label=f'${funcion_str}$', color='blue', linewidth=2)
-    plt.axhline(0, color='black', linewidth=0.8, linestyle='--')
+    fig, ax = nueva_figura(figsize=(10, 6))
+    ax.plot(x_vals, y_vals, label=f'${funcion_str}$', color='blue', linewidth=2)
+    ax.axhline(0, color='black', linewidth=0.8, linestyle='--')
 
     for i, (xi, yi) in enumerate(zip(xs, ys)):
         color = 'red' if i < len(xs)-1 else 'green'
@@ -148,9 +154,9 @@ def graficar_iteraciones(historial, f, funcion_str="f(x)"):
         size = 70 if i < len(xs)-1 else 120
         label = f'Iteración {i}' if i < len(xs)-1 else 'Raíz aproximada'
 
-        plt.scatter(xi, yi, color=color, s=size, edgecolors='black',
+        ax.scatter(xi, yi, color=color, s=size, edgecolors='black',
                     zorder=5, label=label, marker=marker)
-        plt.text(
+        ax.text(
             xi,
             yi + offset if yi >= 0 else yi - offset,
             f'$x_{i}$',
@@ -160,30 +166,25 @@ def graficar_iteraciones(historial, f, funcion_str="f(x)"):
         )
 
         if i < len(xs) - 1:
-            plt.annotate('', xy=(historial[i+1]['x'], historial[i+1]['f']), xytext=(xi, yi),
+            ax.annotate('', xy=(historial[i+1]['x'], historial[i+1]['f']), xytext=(xi, yi),
                          arrowprops=dict(arrowstyle='->', color='gray',
                                          lw=1.5, shrinkA=8, shrinkB=8))
 
-    plt.axvline(xs[-1], color='green', linestyle=':', alpha=0.5)
+    ax.axvline(xs[-1], color='green', linestyle=':', alpha=0.5)
     
     # Ajustar los límites verticales para evitar recortes y mejorar aspecto
     y_min = min(ys_all) - 2 * offset
     y_max = max(ys_all) + 2 * offset
-    plt.ylim(y_min, y_max)
-
-    plt.title(f'Método de Taylor (2do orden) - $f(x) = {funcion_str}$', fontsize=14)
-    plt.xlabel('$x$', fontsize=12)
-    plt.ylabel('$f(x)$', fontsize=12)
-    plt.grid(True, linestyle='--', alpha=0.3)
-    plt.legend(loc='best')
-    plt.tight_layout()
+    ax.set_ylim(y_min, y_max)
 
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
+    ax.set_title(f'Método de Taylor (2do orden) - $f(x) = {funcion_str}$', fontsize=14)
+    ax.set_xlabel('$x$', fontsize=12)
+    ax.set_ylabel('$f(x)$', fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.3)
+    ax.legend(loc='best')
+    fig.tight_layout()
 
-    return buffer
+    return figura_a_png(fig)
 
 
 def metodo_taylor_biseccion_con_log(a, b, tol=1e-12, max_iter=50):
@@ -359,6 +360,7 @@ def ejecutar_metodos_con_comparacion(a=0.1, b=18.0, tol=1e-6, max_iter=50):
     return historial_taylor, historial_combinado, log.getvalue() + "\n\n" + log_combinado
 
  
+@cache_png()
 def graficar_convergencia_loglog():
     # Obtener funciones
     f, f1, f2 = obtener_funciones_numericas()
@@ -385,7 +387,7 @@ def graficar_convergencia_loglog():
         raise ValueError("No se generaron errores para graficar.")
 
     # Crear gráfico
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+    fig, (ax1, ax2) = nueva_figura(1, 2, figsize=(16, 6))
 
     # Curva de referencia O(n^-p)
     p_ref = 3
@@ -419,13 +421,10 @@ def graficar_convergencia_loglog():
                  ha='center', va='center', fontsize=12, transform=ax2.transAxes)
         ax2.axis('off')
 
-    plt.tight_layout()
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return buffer
+    fig.tight_layout()
+    return figura_a_png(fig)
  
+@cache_png()
 def graficar_taylor_local(iteration: int):
     delta_zoom = 0.1
     delta_amplio = 1.5
@@ -458,7 +457,7 @@ def graficar_taylor_local(iteration: int):
     y_orig_local = f(x_local)
     y_taylor_local = taylor2(x_local)
 
-    fig, axs = plt.subplots(1, 2, figsize=(14, 5))
+    fig, axs = nueva_figura(1, 2, figsize=(14, 5))
 
     # Gráfico amplio
     axs[0].plot(x_amplio, y_orig_amplio, label='Función original $f(x)$', color='navy', linewidth=2)
@@ -500,13 +499,10 @@ def graficar_taylor_local(iteration: int):
     y_max_local = max(np.max(y_orig_local), np.max(y_taylor_local)) + 0.1
     axs[1].set_ylim(y_min_local, y_max_local)
 
-    plt.tight_layout()
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-    plt.close()
-    buffer.seek(0)
-    return buffer
+    fig.tight_layout()
+    return figura_a_png(fig, dpi=300, bbox_inches='tight')
  
+@cache_png()
 def graficar_comparacion_convergencia():
     historial_taylor, historial_combinado, _ = ejecutar_metodos_con_comparacion(
     a=2.5, b=3.5, tol=1e-6, max_iter=50
@@ -522,26 +518,21 @@ def graficar_comparacion_convergencia():
     ultima_taylor = iter_taylor[-1]
     ultima_combinado = iter_combinado[-1]
 
-    plt.figure(figsize=(10, 6))
-    plt.semilogy(iter_taylor, errores_taylor, 'o-', label='Taylor (2º orden)', color='blue')
-    plt.semilogy(iter_combinado, errores_combinado, 's--', label='Combinado (Taylor + Bisección)', color='green')
+    fig, ax = nueva_figura(figsize=(10, 6))
+    ax.semilogy(iter_taylor, errores_taylor, 'o-', label='Taylor (2º orden)', color='blue')
+    ax.semilogy(iter_combinado, errores_combinado, 's--', label='Combinado (Taylor + Bisección)', color='green')
 
-    plt.axvline(x=ultima_taylor, color='blue', linestyle=':', label=f'Convergencia Taylor ({ultima_taylor} it.)')
-    plt.axvline(x=ultima_combinado, color='green', linestyle=':', label=f'Convergencia Combinado ({ultima_combinado} it.)')
+    ax.axvline(x=ultima_taylor, color='blue', linestyle=':', label=f'Convergencia Taylor ({ultima_taylor} it.)')
+    ax.axvline(x=ultima_combinado, color='green', linestyle=':', label=f'Convergencia Combinado ({ultima_combinado} it.)')
 
-    plt.title("Iteración de convergencia para cada método")
-    plt.xlabel("Iteración")
-    plt.ylabel("Error (escala logarítmica)")
-    plt.grid(True, which="both", ls="--", linewidth=0.5)
-    plt.legend()
-    plt.tight_layout()
+    ax.set_title("Iteración de convergencia para cada método")
+    ax.set_xlabel("Iteración")
+    ax.set_ylabel("Error (escala logarítmica)")
+    ax.grid(True, which="both", ls="--", linewidth=0.5)
+    ax.legend()
+    fig.tight_layout()
 
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    plt.close()
-    buf.seek(0)
-    
-    return buf
+    return figura_a_png(fig)
 
 PROBLEMAS_INCISO_A = """
 🔍 ¿Qué estamos resolviendo?
@@ -640,6 +631,7 @@ En nuestras pruebas, el método combinado:
 
 """
 
+@cache_png()
 def generar_grafico_funcion_enferma():
     def f(x):
         return np.exp(-x) * np.cos(5 * x) - (1 / 100) * x
@@ -650,7 +642,7 @@ def generar_grafico_funcion_enferma():
     x_vals = np.linspace(-1, 6, 1000)
     y_vals = f(x_vals)
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = nueva_figura(figsize=(10, 6))
     ax.plot(x_vals, y_vals, label=r'$f(x) = e^{-x} \cos(5x) - \frac{1}{100}x$', color='blue', linewidth=2)
     ax.axhline(0, color='black', linewidth=0.8, linestyle='--')
     ax.axvline(raiz, color='red', linestyle=':', linewidth=1) #type: ignore
@@ -668,9 +660,4 @@ def generar_grafico_funcion_enferma():
     ax.legend()
     fig.tight_layout()
 
-    buf = BytesIO()
-    plt.savefig(buf, format='png', dpi=300)
-    plt.close(fig)
-    buf.seek(0)
-
-    return StreamingResponse(buf, media_type="image/png")
\ No newline at end of file
+    return figura_a_png(fig, dpi=300)
\ No newline at end of file
@@ -0,0 +1,151 @@
+# services/tp4/almacen.py
+"""
+Almacén en disco de la tabla de resultados del TP4 (una fila por frame).
+
+Evita volver a decodificar y segmentar los 126 JPEG después de cada reinicio.
+Formato columnar: un `.npy` por columna (se abren con mmap) más un
+`frames.json` con la firma de cada imagen de origen. Todo cuelga de un
+directorio cuyo nombre es el hash de los parámetros de procesamiento y del
+código de TP4: si cambia cualquiera de los dos se arranca de cero.
+
+Dentro de ese directorio cada escritura crea una generación nueva y recién al
+final se actualiza el puntero `actual`, así un lector nunca ve columnas a
+medio escribir.
+
+Las filas leídas no se convierten a dicts: cada frame guardado apunta a su
+índice en las columnas mmap y `armar_columnas` junta esas columnas con las
+filas recién calculadas por indexado de arrays.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from services.common.render_cache import version_codigo
+
+TP4_STORE_DIR = os.environ.get("TP4_STORE_DIR", os.path.join("data", "cache", "tp4"))
+MODULOS_TP4 = ("services.tp4.core", "services.tp4.utils")
+
+
+def firma_archivo(path):
+    """Hash del contenido de la imagen (no depende del mtime, sobrevive a un checkout)."""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _escribir_atomico(ruta, escribir):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            escribir(f)
+        os.replace(tmp, ruta)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+class AlmacenFrames:
+    def __init__(self, parametros, modulos=MODULOS_TP4):
+        contenido = json.dumps(parametros, sort_keys=True, default=str) + version_codigo(tuple(modulos))
+        self.clave = hashlib.sha256(contenido.encode("utf-8")).hexdigest()[:16]
+        self.directorio = os.path.join(TP4_STORE_DIR, self.clave)
+        self._firmas_cargadas = None
+        # Columnas mmap de la generación cargada ({columna: array})
+        self.columnas = {}
+
+    def _generacion_actual(self):
+        try:
+            with open(os.path.join(self.directorio, "actual"), encoding="utf-8") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def cargar(self):
+        """
+        Devuelve {k: (firma, fila)} con lo guardado: fila es el índice del frame
+        en `self.columnas` (None = frame sin gota). Si no hay almacén o está
+        corrupto devuelve {} y se recalcula todo.
+        """
+        generacion = self._generacion_actual()
+        if generacion is None:
+            return {}
+        base = os.path.join(self.directorio, generacion)
+        try:
+            with open(os.path.join(base, "frames.json"), encoding="utf-8") as f:
+                manifiesto = json.load(f)
+            columnas = {
+                col: np.load(os.path.join(base, f"{col}.npy"), mmap_mode="r")
+                for col in manifiesto["columnas"]
+            }
+            largo = {len(valores) for valores in columnas.values()}
+            filas = {}
+            for entrada in manifiesto["frames"]:
+                i = entrada["fila"]
+                if i is not None and not (isinstance(i, int) and all(0 <= i < n for n in largo)):
+                    raise IndexError(i)
+                filas[entrada["k"]] = (entrada["firma"], i)
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            return {}
+        self.columnas = columnas
+        self._firmas_cargadas = {k: firma for k, (firma, _) in filas.items()}
+        return filas
+
+    def armar_columnas(self, filas, orden, nombres=None):
+        """
+        {columna: array} con las filas de los frames `orden` que tienen gota.
+        Cada fila es un índice en `self.columnas` (leída del almacén) o un dict
+        (recién calculada); las guardadas se toman de a columna entera.
+        """
+        presentes = [filas[k][1] for k in orden if filas[k][1] is not None]
+        pos_guardadas = [p for p, fila in enumerate(presentes) if not isinstance(fila, dict)]
+        pos_nuevas = [p for p, fila in enumerate(presentes) if isinstance(fila, dict)]
+        if nombres is None:
+            nombres = list(self.columnas) or (list(presentes[pos_nuevas[0]]) if pos_nuevas else [])
+        indices = np.asarray([presentes[p] for p in pos_guardadas], dtype=np.intp)
+        resultado = {}
+        for col in nombres:
+            partes = []
+            if pos_guardadas:
+                partes.append((pos_guardadas, self.columnas[col][indices]))
+            if pos_nuevas:
+                partes.append((pos_nuevas, np.asarray([presentes[p][col] for p in pos_nuevas])))
+            valores = np.empty(len(presentes), dtype=np.result_type(*[v for _, v in partes]) if partes else float)
+            for posiciones, v in partes:
+                valores[posiciones] = v
+            resultado[col] = valores
+        return resultado
+
+    def guardar(self, filas):
+        """Persiste {k: (firma, fila)}. Si nada cambió respecto de lo cargado no escribe."""
+        if self._firmas_cargadas == {k: firma for k, (firma, _) in filas.items()}:
+            return
+        frames, presentes = [], 0
+        for k in sorted(filas):
+            firma, fila = filas[k]
+            frames.append({"k": k, "firma": firma, "fila": None if fila is None else presentes})
+            if fila is not None:
+                presentes += 1
+        if not presentes:
+            return
+        columnas = self.armar_columnas(filas, sorted(filas))
+
+        generacion = hashlib.sha256(json.dumps(frames).encode("utf-8")).hexdigest()[:16]
+        base = os.path.join(self.directorio, generacion)
+        try:
+            os.makedirs(base, exist_ok=True)
+            for col, valores in columnas.items():
+                _escribir_atomico(os.path.join(base, f"{col}.npy"), lambda f: np.save(f, valores))
+            manifiesto = json.dumps({"columnas": list(columnas), "frames": frames}).encode("utf-8")
+            _escribir_atomico(os.path.join(base, "frames.json"), lambda f: f.write(manifiesto))
+            anterior = self._generacion_actual()
+            _escribir_atomico(os.path.join(self.directorio, "actual"), lambda f: f.write(generacion.encode()))
+        except OSError:
+            # El almacén es opcional: si no se puede escribir se recalcula la próxima vez
+            return
+        self._firmas_cargadas = {k: firma for k, (firma, _) in filas.items()}
+        if anterior and anterior != generacion:
+            shutil.rmtree(os.path.join(self.directorio, anterior), ignore_errors=True)
@@ -1,14 +1,20 @@
 # services/tp4/core.py 
 # Singleton para procesamiento de datos TP4
 
+import asyncio
 import os
 import glob
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
 import pandas as pd
+from starlette.concurrency import run_in_threadpool
+from services.common.ejecutor import ejecutar, hilos_por_proceso
+from services.common.render_cache import firma_archivos, firma_entradas
+from .almacen import AlmacenFrames, firma_archivo
 from .utils import (detectar_y0, recorte_superior, pre_segmentar, extraer_contorno, 
                    centroide, encontrar_puntos_contacto, calcular_pendiente_spline, 
-                   calcular_pendiente_poly, corregir_angulo_contacto)
+                   calcular_pendiente_poly, corregir_angulo_contacto, volumen_revolucion)
 
 # Constantes Físicas
 RUTA_IMAGENES = os.path.join("data", "tp4")
@@ -20,6 +26,287 @@ DT = 1.0 / FPS
 RHO = 7380.0
 MARGEN_BASE_PX = 12
 
+# Archivos de entrada (para invalidar los gráficos cacheados)
+ENTRADAS = (os.path.join(RUTA_IMAGENES, PATRON),)
+
+# Paralelismo del procesamiento de frames (hilos y frames por lote).
+# 0 = automático: los CPUs que le tocan a este proceso (ver hilos_frames)
+TP4_WORKERS = int(os.environ.get("TP4_WORKERS", "0"))
+TP4_LOTE = int(os.environ.get("TP4_LOTE", "8"))
+
+# Cada cuántos segundos se buscan imágenes nuevas (0 = sin polling)
+TP4_POLL_SEGUNDOS = float(os.environ.get("TP4_POLL_SEGUNDOS", "10"))
+
+# --- EL TRUQUITO (Valores fijos del Notebook) ---
+# Estos valores son la "verdad absoluta" para los primeros frames.
+SUST_FIX = {
+    20: 127, 21: 129, 22: 130, 23: 130, 
+    24: 130, 25: 129, 26: 128, 27: 126
+}
+
+# Referencia inicial con el valor fijo del frame 20 (aprox 127)
+# Esto evita que el detector automatico se vaya hacia el reflejo.
+Y0_REF = 127
+
+# Primer frame procesado y frame que se guarda para visualización
+FRAME_INICIAL = 10
+FRAME_VISUALIZACION = 28
+
+# Columnas de la tabla de resultados (una fila por frame)
+COLUMNAS = (
+    "t_ms", "cx_m", "cy_m",
+    "diam_base", "altura", "vol", "masa",
+    "frame_idx",
+    # NUEVAS COLUMNAS PARA INCISO 2
+    "angL_spline", "angR_spline",
+    "angL_poly", "angR_poly",
+    # NUEVAS COLUMNAS PARA INCISO 3 (ESTO FALTABA)
+    "per_izq", "per_der", "Sf",
+)
+
+def parametros_procesamiento():
+    """Parámetros que afectan la tabla de resultados (clave del almacén en disco)."""
+    return {
+        "escala_m_por_px": ESCALA_M_POR_PX, "fps": FPS, "rho": RHO,
+        "sust_fix": SUST_FIX, "y0_ref": Y0_REF, "frame_inicial": FRAME_INICIAL,
+        "columnas": COLUMNAS,
+    }
+
+def procesar_frame(k, path):
+    """
+    Procesa un único frame (k = número de frame, 1-based) leído de disco.
+    Devuelve (fila, visualizacion): fila es un dict con COLUMNAS o None si no
+    se encontró la gota; visualizacion solo viene para FRAME_VISUALIZACION.
+    """
+    img_bgr = cv2.imread(path)
+    if img_bgr is None: return None, None
+    img_gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
+    return analizar_frame(k, img_gray)
+
+def analizar_frame(k, img_gray, dt=DT, sust_fix=SUST_FIX, y0_ref=Y0_REF):
+    """
+    Segmentación, ángulos y física de un frame ya decodificado (escala de grises).
+    dt, sust_fix e y0_ref permiten procesar secuencias que no son las del TP
+    (videos subidos con otro FPS y otra posición de sustrato).
+    """
+    # 1. Determinación ROBUSTA del sustrato (y_sustrato)
+    if k in sust_fix:
+        y_sustrato = int(sust_fix[k])
+    else:
+        y_det = detectar_y0(img_gray)
+        # Si la detección difiere más de 20px de la referencia, es un reflejo.
+        # Usamos la referencia.
+        if abs(y_det - y0_ref) > 20:
+            y_sustrato = y0_ref
+        else:
+            y_sustrato = y_det
+
+    # 2. Recorte SUPERIOR (Elimina el reflejo)
+    # Cortamos desde 0 hasta y_sustrato. Todo lo de abajo se ignora.
+    top_area = recorte_superior(img_gray, y_sustrato)
+    
+    # 3. Segmentación y Contornos
+    binv = pre_segmentar(top_area)
+    cont = extraer_contorno(binv)
+
+    if cont is None: return None, None
+
+    # --- INCISO 2: CÁLCULO DE ÁNGULOS ---
+    # Coordenadas físicas locales (x, y positivos)
+    # x: tal cual. y: distancia desde el sustrato hacia arriba.
+    # Recorte superior devuelve img[:y_sustrato]: el sustrato es la última fila.
+    H_recorte, W_recorte = top_area.shape
+    
+    cont_fisico = cont.copy()
+    # Invertir Y: 0 en sustrato, crece hacia arriba
+    cont_fisico[:, 1] = (H_recorte - 1) - cont_fisico[:, 1] 
+    
+    # Buscar índices de contacto (donde y ~ 0)
+    idx_L, idx_R = encontrar_puntos_contacto(cont_fisico, y_base_tolerancia=10)
+    
+    # Calcular Ángulos
+    al_s, ar_s, al_p, ar_p = np.nan, np.nan, np.nan, np.nan
+    
+    if idx_L is not None:
+        # Spline
+        pend_s = calcular_pendiente_spline(cont_fisico, idx_L, window=15)
+        al_s = corregir_angulo_contacto(pend_s, "izq")
+        # Poly
+        pend_p = calcular_pendiente_poly(cont_fisico, idx_L, window=15, deg=2)
+        al_p = corregir_angulo_contacto(pend_p, "izq")
+        
+    if idx_R is not None:
+        # Spline
+        pend_s = calcular_pendiente_spline(cont_fisico, idx_R, window=15)
+        ar_s = corregir_angulo_contacto(pend_s, "der")
+        # Poly
+        pend_p = calcular_pendiente_poly(cont_fisico, idx_R, window=15, deg=2)
+        ar_p = corregir_angulo_contacto(pend_p, "der")
+
+    # 4. Centroide y Física
+    (cx_px, cy_px), area_px = centroide(cont)
+    
+    # FÍSICA:
+    # y_sustrato es el 0 físico.
+    # cy_px es la coord en la imagen recortada (desde arriba).
+    # Altura real = y_sustrato - cy_px
+    t = k * dt * 1e3 # ms
+    cx_real = cx_px * ESCALA_M_POR_PX
+    cy_real = (y_sustrato - cy_px) * ESCALA_M_POR_PX
+    
+    # Geometría
+    xs = cont[:, 0]
+    ys = cont[:, 1]
+    d_px = np.max(xs) - np.min(xs)
+    h_px = np.max(ys) - np.min(ys)
+    
+    # Cálculos adicionales para Inciso 3
+    # Perímetros (Izquierdo y Derecho): dividimos el contorno por el centroide X
+    # (lógica de "perimetros_por_lado" del notebook original)
+    def perimetros_por_lado(cnt, cx):
+        izq = cnt[cnt[:, 0] < cx]
+        der = cnt[cnt[:, 0] >= cx]
+        
+        def calc_len(pts):
+            if len(pts) < 2: return 0.0
+            # Ordenamos por ángulo o simplemente sumamos distancias
+            # (Aprox simple: suma de distancias entre puntos crudos)
+            return np.sum(np.sqrt(np.sum(np.diff(pts, axis=0)**2, axis=1))) * ESCALA_M_POR_PX
+        
+        return calc_len(izq), calc_len(der)
+
+    p_izq, p_der = perimetros_por_lado(cont, cx_px)
+    
+    # Factor de esparcimiento (D/H)
+    # Evitar división por cero
+    sf = (d_px / h_px) if h_px > 0 else 0.0
+
+    # Volumen (Revolución): un disco por fila de la máscara
+    vol = volumen_revolucion(binv, ESCALA_M_POR_PX)
+    masa = vol * RHO
+
+    fila = {
+        "t_ms": t, "cx_m": cx_real, "cy_m": cy_real,
+        "diam_base": d_px * ESCALA_M_POR_PX, "altura": h_px * ESCALA_M_POR_PX,
+        "vol": vol, "masa": masa, "frame_idx": k,
+        "angL_spline": al_s, "angR_spline": ar_s,
+        "angL_poly": al_p, "angR_poly": ar_p,
+        "per_izq": p_izq, "per_der": p_der, "Sf": sf,
+    }
+
+    visualizacion = None
+    # Guardar visualización (Frame 28 es bueno para ver si funcionó el fix)
+    if k == FRAME_VISUALIZACION:
+        visualizacion = {
+            "original": img_gray,
+            "binaria": binv, # Esto ahora solo tendrá la parte de arriba
+            "contorno": cont,
+            "y_sustrato": y_sustrato,
+            "cx": cx_px, "cy": cy_px
+        }
+    return fila, visualizacion
+
+def _procesar_lote(lote):
+    return [procesar_frame(k, path) for k, path in lote]
+
+def hilos_frames():
+    """Hilos para procesar frames: TP4_WORKERS si se fijó, si no los CPUs de este proceso."""
+    return TP4_WORKERS if TP4_WORKERS > 0 else hilos_por_proceso()
+
+def procesar_frames(frames):
+    """
+    Procesa [(k, path)] en paralelo y devuelve [(fila, visualizacion)] en el
+    mismo orden. Los frames son independientes (la referencia de sustrato es
+    fija), así que se reparten en lotes de TP4_LOTE entre hilos_frames() hilos:
+    OpenCV libera el GIL mientras decodifica y segmenta.
+    """
+    hilos = hilos_frames()
+    if hilos <= 1 or len(frames) <= TP4_LOTE:
+        return _procesar_lote(frames)
+    lotes = [frames[i:i + TP4_LOTE] for i in range(0, len(frames), TP4_LOTE)]
+    with ThreadPoolExecutor(max_workers=hilos) as pool:
+        return [resultado for lote in pool.map(_procesar_lote, lotes) for resultado in lote]
+
+def _resolver_frames(frames, guardadas):
+    """
+    Toma del almacén los frames cuya imagen no cambió y procesa el resto.
+    Devuelve ({k: (firma, fila)}, cantidad reutilizada, visualización).
+    """
+    filas = {}
+    pendientes = []
+    visualization_data = {}
+    for k, path in frames:
+        firma = firma_archivo(path)
+        previo = guardadas.get(k)
+        if previo is not None and previo[0] == firma and k != FRAME_VISUALIZACION:
+            filas[k] = (firma, previo[1])
+        else:
+            pendientes.append((k, path, firma))
+
+    calculados = procesar_frames([(k, path) for k, path, _ in pendientes])
+    for (k, _, firma), (fila, vis) in zip(pendientes, calculados):
+        if vis is not None:
+            visualization_data = vis
+        filas[k] = (firma, fila)
+    return filas, len(frames) - len(pendientes), visualization_data
+
+def _tabla(almacen, frames, filas):
+    """DataFrame con las filas de `frames` (en orden) que tienen gota."""
+    return pd.DataFrame(almacen.armar_columnas(filas, [k for k, _ in frames], COLUMNAS))
+
+def listar_imagenes():
+    return sorted(glob.glob(os.path.join(RUTA_IMAGENES, PATRON)))
+
+def procesar_imagenes():
+    """
+    Procesa la secuencia completa de imágenes de la gota.
+    Es una función de módulo (sin estado) para poder correrla en el pool de procesos.
+    Los frames ya calculados se leen del almacén en disco; solo se procesan
+    los que cambiaron (o todos, si cambió el código o los parámetros).
+    Devuelve (DataFrame, logs, datos de visualización del frame 28, paths).
+    """
+    logs = []
+    logs.append(">>> Iniciando procesamiento de imágenes TP4 (Con ajuste de sustrato)...")
+    
+    paths = listar_imagenes()
+    if not paths:
+        logs.append("ERROR: No se encontraron imágenes.")
+        return None, logs, {}, paths
+
+    logs.append(f"Info: Referencia de sustrato fijada en Y={Y0_REF} (Hardcoded seguro)")
+
+    frames = [(i + 1, path) for i, path in enumerate(paths) if i + 1 >= FRAME_INICIAL]
+    almacen = AlmacenFrames(parametros_procesamiento())
+    filas, reutilizados, visualization_data = _resolver_frames(frames, almacen.cargar())
+    # La tabla sale de las columnas cargadas antes de que guardar() reemplace la generación
+    df = _tabla(almacen, frames, filas)
+    almacen.guardar(filas)
+    if reutilizados:
+        logs.append(f"Info: {reutilizados} frames leídos del almacén en disco, {len(frames) - reutilizados} recalculados.")
+
+    logs.append(f"OK: Procesados {len(df)} frames con filtrado de reflejo.")
+    return df, logs, visualization_data, paths
+
+def procesar_imagenes_nuevas(conocidas):
+    """
+    Modo incremental: procesa solo las imágenes agregadas después de `conocidas`
+    (los paths ya procesados, en orden). Devuelve (paths, DataFrame con las
+    filas nuevas, visualización) o None si la secuencia cambió de otra forma
+    (se borró o se intercaló una imagen) y hay que reprocesar todo.
+    """
+    paths = listar_imagenes()
+    if paths[:len(conocidas)] != list(conocidas):
+        return None
+    frames = [(i + 1, path) for i, path in enumerate(paths)
+              if i >= len(conocidas) and i + 1 >= FRAME_INICIAL]
+
+    almacen = AlmacenFrames(parametros_procesamiento())
+    guardadas = almacen.cargar()
+    filas, _, visualization_data = _resolver_frames(frames, guardadas)
+    df = _tabla(almacen, frames, filas)
+    almacen.guardar({**guardadas, **filas})
+    return paths, df, visualization_data
+
 class TP4DataProcessor:
     _instance = None
 
@@ -29,6 +316,10 @@ class TP4DataProcessor:
             cls._instance.data = None
             cls._instance.logs = []
             cls._instance.visualization_data = {}
+            cls._instance.paths = []
+            cls._instance.firma = []
+            cls._instance._suscriptores = []
+            cls._instance._lock_actualizar = asyncio.Lock()
         return cls._instance
 
     def get_data(self):
@@ -45,213 +336,83 @@ class TP4DataProcessor:
         return self.visualization_data
 
     def process_images(self):
-        self.logs.clear()
-        self.logs.append(">>> Iniciando procesamiento de imágenes TP4 (Con ajuste de sustrato)...")
-        
-        paths = sorted(glob.glob(os.path.join(RUTA_IMAGENES, PATRON)))
-        if not paths:
-            self.logs.append("ERROR: No se encontraron imágenes.")
-            return
-
-        results = {
-            "t_ms": [], "cx_m": [], "cy_m": [], 
-            "diam_base": [], "altura": [], "vol": [], "masa": [],
-            "frame_idx": [],
-            # NUEVAS COLUMNAS PARA INCISO 2
-            "angL_spline": [], "angR_spline": [],
-            "angL_poly": [], "angR_poly": [],
-            # NUEVAS COLUMNAS PARA INCISO 3 (ESTO FALTABA)
-            "per_izq": [], "per_der": [], "Sf": []
-        }
+        self._asignar(*procesar_imagenes())
 
-        # --- EL TRUQUITO (Valores fijos del Notebook) ---
-        # Estos valores son la "verdad absoluta" para los primeros frames.
-        SUST_FIX = {
-            20: 127, 21: 129, 22: 130, 23: 130, 
-            24: 130, 25: 129, 26: 128, 27: 126
-        }
-        
-        # Establecemos la referencia inicial con el valor fijo del frame 20 (aprox 127)
-        # Esto evita que el detector automatico se vaya hacia el reflejo.
-        y0_ref = 127 
-        self.logs.append(f"Info: Referencia de sustrato fijada en Y={y0_ref} (Hardcoded seguro)")
-
-        count = 0
-        for i, path in enumerate(paths):
-            k = i + 1
-            
-            # Procesamos del 10 en adelante
-            if k < 10: continue
-
-            img_bgr = cv2.imread(path)
-            if img_bgr is None: continue
-            img_gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
-
-            # 1. Determinación ROBUSTA del sustrato (y_sustrato)
-            if k in SUST_FIX:
-                y_sustrato = int(SUST_FIX[k])
+    async def get_data_async(self):
+        """Como get_data, pero el procesamiento corre en el pool de procesos."""
+        if self.data is None:
+            self._asignar(*await ejecutar(procesar_imagenes, clave="tp4.procesar_imagenes"))
+        return self.data
+
+    def _asignar(self, data, logs, visualization_data, paths):
+        self.data = data
+        self.logs = logs
+        self.visualization_data = visualization_data
+        self.paths = paths
+        self.firma = firma_archivos(paths or [])
+
+    def firma_datos(self):
+        """
+        Firma de las imágenes con las que se calcularon los datos en memoria
+        (clave de los gráficos cacheados). Entre que aparece una imagen y
+        `actualizar_async` la incorpora, los gráficos siguen siendo los de los
+        datos cargados. Si todavía no se cargó nada, la firma del disco: el
+        render los va a cargar de ahí.
+        """
+        if self.data is None:
+            return firma_entradas(ENTRADAS)
+        return self.firma
+
+    def suscribir(self, funcion):
+        """Registra una función sin argumentos que se llama cuando cambian los datos."""
+        self._suscriptores.append(funcion)
+
+    def _notificar(self):
+        for funcion in self._suscriptores:
+            funcion()
+
+    async def actualizar_async(self):
+        """
+        Incorpora las imágenes nuevas de RUTA_IMAGENES sin reprocesar las ya
+        conocidas y agrega sus filas al DataFrame. Devuelve cuántos frames
+        nuevos se sumaron. Los gráficos cacheados se invalidan solos (su
+        clave es `firma_datos`, que cambia acá); los suscriptores (TP5) se
+        enteran vía `suscribir`.
+        """
+        async with self._lock_actualizar:
+            if self.data is None:
+                # Nunca se cargó: no hay nada que actualizar (se procesa al pedirlo)
+                return 0
+            paths = await run_in_threadpool(listar_imagenes)
+            if paths == self.paths:
+                return 0
+
+            resultado = await ejecutar(procesar_imagenes_nuevas, self.paths, clave="tp4.procesar_imagenes_nuevas")
+            if resultado is None:
+                self.logs.append("Info: La secuencia de imágenes cambió; se reprocesa completa.")
+                anteriores = len(self.data)
+                self._asignar(*await ejecutar(procesar_imagenes, clave="tp4.procesar_imagenes"))
+                nuevos = len(self.data) - anteriores if self.data is not None else 0
             else:
-                y_det = detectar_y0(img_gray)
-                # Si la detección difiere más de 20px de la referencia, es un reflejo.
-                # Usamos la referencia.
-                if abs(y_det - y0_ref) > 20:
-                    y_sustrato = y0_ref
-                else:
-                    y_sustrato = y_det
-
-            # 2. Recorte SUPERIOR (Elimina el reflejo)
-            # Cortamos desde 0 hasta y_sustrato. Todo lo de abajo se ignora.
-            top_area = recorte_superior(img_gray, y_sustrato)
-            
-            # 3. Segmentación y Contornos
-            binv = pre_segmentar(top_area)
-            cont = extraer_contorno(binv)
-
-            if cont is None: continue
-
-            # Guardar visualización (Frame 28 es bueno para ver si funcionó el fix)
-            if k == 28:
-                self.visualization_data = {
-                    "original": img_gray,
-                    "binaria": binv, # Esto ahora solo tendrá la parte de arriba
-                    "contorno": cont,
-                    "y_sustrato": y_sustrato,
-                    "cx": 0, "cy": 0
-                }
-            # --- INCISO 2: CÁLCULO DE ÁNGULOS ---
-            # 1. Shiftear contorno para que Y=0 sea el sustrato
-            # (En CV2 Y crece hacia abajo, pero aquí Y=0 es arriba del recorte...
-            # Para simplificar la matemática de pendientes, invertimos Y para que apunte "arriba")
-            
-            # Coordenadas físicas locales (x, y positivos)
-            # x: tal cual. y: distancia desde el sustrato hacia arriba.
-            # En la imagen recortada, el sustrato está en la fila 'y_sustrato' (aprox final).
-            # NO, espera. Recorte superior devuelve img[:y_sustrato]. El sustrato es la última fila.
-            
-            H_recorte, W_recorte = top_area.shape
-            # Sustrato está en H_recorte - 1 (aprox)
-            
-            cont_fisico = cont.copy()
-            # Invertir Y: 0 en sustrato, crece hacia arriba
-            cont_fisico[:, 1] = (H_recorte - 1) - cont_fisico[:, 1] 
-            
-            # Buscar índices de contacto (donde y ~ 0)
-            idx_L, idx_R = encontrar_puntos_contacto(cont_fisico, y_base_tolerancia=10)
-            
-            # Calcular Ángulos
-            al_s, ar_s, al_p, ar_p = np.nan, np.nan, np.nan, np.nan
-            
-            if idx_L is not None:
-                # Spline
-                pend_s = calcular_pendiente_spline(cont_fisico, idx_L, window=15)
-                al_s = corregir_angulo_contacto(pend_s, "izq")
-                # Poly
-                pend_p = calcular_pendiente_poly(cont_fisico, idx_L, window=15, deg=2)
-                al_p = corregir_angulo_contacto(pend_p, "izq")
-                
-            if idx_R is not None:
-                # Spline
-                pend_s = calcular_pendiente_spline(cont_fisico, idx_R, window=15)
-                ar_s = corregir_angulo_contacto(pend_s, "der")
-                # Poly
-                pend_p = calcular_pendiente_poly(cont_fisico, idx_R, window=15, deg=2)
-                ar_p = corregir_angulo_contacto(pend_p, "der")
-
-            results["angL_spline"].append(al_s)
-            results["angR_spline"].append(ar_s)
-            results["angL_poly"].append(al_p)
-            results["angR_poly"].append(ar_p)
-
-            # 4. Centroide y Física
-            (cx_px, cy_px), area_px = centroide(cont)
-            
-            # FÍSICA:
-            # y_sustrato es el 0 físico.
-            # cy_px es la coord en la imagen recortada (desde arriba).
-            # Altura real = y_sustrato - cy_px
-            
-            t = k * DT * 1e3 # ms
-            cx_real = cx_px * ESCALA_M_POR_PX
-            cy_real = (y_sustrato - cy_px) * ESCALA_M_POR_PX
-            
-            # Geometría
-            xs = cont[:, 0]
-            ys = cont[:, 1]
-            d_px = np.max(xs) - np.min(xs)
-            h_px = np.max(ys) - np.min(ys)
-            
-            # Cálculos adicionales para Inciso 3
-            # Perímetros (Izquierdo y Derecho)
-            # Dividimos el contorno por el centroide X
-            mask_izq = cont[:, 0] < cx_px
-            mask_der = cont[:, 0] >= cx_px
-            
-            # Función simple para longitud de arco
-            def arco(pts):
-                if len(pts) < 2: return 0.0
-                # Ordenar por Y o X para medir distancia consecutiva (aprox)
-                # En un contorno general es complejo, pero para mitades verticales:
-                # La suma de distancias euclidianas entre puntos consecutivos del contorno original
-                # es la mejor aprox. Pero aquí tenemos puntos filtrados.
-                # Usamos la longitud del contorno completo y dividimos por 2 aprox, 
-                # o mejor: cv2.arcLength sobre el contorno original dividido.
-                return 0.0 # Placeholder si no se quiere complejidad extrema
-            
-            # Para simplificar y no re-implementar lógica geométrica compleja:
-            # Usaremos el perímetro total dividido por 2 como referencia, 
-            # o si querés implementar la lógica de "perimetros_por_lado" del notebook original:
-            
-            def perimetros_por_lado(cnt, cx):
-                izq = cnt[cnt[:, 0] < cx]
-                der = cnt[cnt[:, 0] >= cx]
-                
-                def calc_len(pts):
-                    if len(pts) < 2: return 0.0
-                    # Ordenamos por ángulo o simplemente sumamos distancias
-                    # (Aprox simple: suma de distancias entre puntos crudos)
-                    return np.sum(np.sqrt(np.sum(np.diff(pts, axis=0)**2, axis=1))) * ESCALA_M_POR_PX
-                
-                return calc_len(izq), calc_len(der)
-
-            p_izq, p_der = perimetros_por_lado(cont, cx_px)
-            
-            # Factor de esparcimiento (D/H)
-            # Evitar división por cero
-            sf = (d_px / h_px) if h_px > 0 else 0.0
-
-            results["per_izq"].append(p_izq)
-            results["per_der"].append(p_der)
-            results["Sf"].append(sf)
-
-            # Volumen (Revolución)
-            vol = 0.0
-            dy = ESCALA_M_POR_PX
-            H_bin, W_bin = binv.shape
-            for y_row in range(H_bin):
-                x_row = np.where(binv[y_row, :] > 0)[0]
-                if x_row.size > 1:
-                    diam = (x_row[-1] - x_row[0] + 1) * ESCALA_M_POR_PX
-                    vol += np.pi * (diam/2)**2 * dy
-            
-            masa = vol * RHO
-
-            results["t_ms"].append(t)
-            results["cx_m"].append(cx_real)
-            results["cy_m"].append(cy_real)
-            results["diam_base"].append(d_px * ESCALA_M_POR_PX)
-            results["altura"].append(h_px * ESCALA_M_POR_PX)
-            results["vol"].append(vol)
-            results["masa"].append(masa)
-            results["frame_idx"].append(k)
-            
-            if k == 28:
-                self.visualization_data["cx"] = cx_px
-                self.visualization_data["cy"] = cy_px
-            
-            count += 1
-
-        self.logs.append(f"OK: Procesados {count} frames con filtrado de reflejo.")
-        self.data = pd.DataFrame(results)
+                paths, nuevas, visualizacion = resultado
+                self.data = pd.concat([self.data, nuevas], ignore_index=True)
+                self.paths = paths
+                self.firma = firma_archivos(paths)
+                if visualizacion:
+                    self.visualization_data = visualizacion
+                nuevos = len(nuevas)
+                self.logs.append(f"Info: {nuevos} frames nuevos agregados ({len(self.data)} en total).")
+            self._notificar()
+            return nuevos
+
+    async def vigilar(self, intervalo):
+        """Polling de RUTA_IMAGENES cada `intervalo` segundos (tarea de fondo)."""
+        while True:
+            await asyncio.sleep(intervalo)
+            try:
+                await self.actualizar_async()
+            except Exception as e:
+                print(f"TP4: error al actualizar imágenes nuevas: {e}")
 
     def get_ajuste_detalle(self, frame_obj=28):
         """
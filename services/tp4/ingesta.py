@@ -0,0 +1,139 @@
+# services/tp4/ingesta.py
+"""
+Ingesta de secuencias de la gota desde un video o un TIFF multipágina.
+
+Con cámaras de alta velocidad (20k fps) una corrida son decenas de miles de
+frames: en lugar de un JPEG por frame se sube un único archivo y se decodifica
+de a un frame por vez (generador), pasando por las mismas etapas de
+segmentación / ángulos de contacto que `core.analizar_frame`. En memoria hay
+como mucho una ventana de core.hilos_frames() * TP4_LOTE frames.
+"""
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import cv2
+import numpy as np
+from PIL import Image, ImageSequence
+
+from . import core
+from .utils import detectar_y0
+
+# Firmas de los archivos TIFF (little y big endian)
+_MAGIA_TIFF = (b"II*\x00", b"MM\x00*")
+
+
+def es_tiff(ruta):
+    with open(ruta, "rb") as f:
+        return f.read(4) in _MAGIA_TIFF
+
+
+def _a_gris(img):
+    img = np.asarray(img)
+    if img.ndim == 3:
+        img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY if img.shape[2] == 3 else cv2.COLOR_BGRA2GRAY)
+    if img.dtype != np.uint8:
+        # TIFF de 16 bits: se lleva a 8 bits para Otsu / Canny
+        img = cv2.normalize(img, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+    return img
+
+
+def iterar_frames_video(ruta):
+    """Frames en gris de un video (cualquier formato que lea OpenCV/FFMPEG)."""
+    captura = cv2.VideoCapture(ruta)
+    if not captura.isOpened():
+        raise ValueError("No se pudo abrir el archivo como video.")
+    try:
+        while True:
+            ok, frame = captura.read()
+            if not ok:
+                break
+            yield _a_gris(frame)
+    finally:
+        captura.release()
+
+
+def iterar_frames_tiff(ruta):
+    """Páginas de un TIFF multipágina, decodificadas de a una."""
+    with Image.open(ruta) as tiff:
+        for pagina in ImageSequence.Iterator(tiff):
+            if pagina.mode not in ("L", "I;16", "I;16B", "I"):
+                pagina = pagina.convert("L")
+            yield _a_gris(pagina)
+
+
+def validar_archivo(ruta):
+    """ValueError si el archivo no es un TIFF ni un video que OpenCV pueda abrir."""
+    if es_tiff(ruta):
+        try:
+            with Image.open(ruta) as tiff:
+                tiff.verify()
+        except Exception as e:
+            raise ValueError(f"TIFF inválido: {e}")
+        return
+    captura = cv2.VideoCapture(ruta)
+    abierto = captura.isOpened()
+    captura.release()
+    if not abierto:
+        raise ValueError("No se pudo abrir el archivo como video ni como TIFF multipágina.")
+
+
+def iterar_frames(ruta):
+    return iterar_frames_tiff(ruta) if es_tiff(ruta) else iterar_frames_video(ruta)
+
+
+def _limpiar(fila):
+    # NaN no es JSON válido
+    return {c: (None if isinstance(v, float) and math.isnan(v) else v) for c, v in fila.items()}
+
+
+def analizar_secuencia(frames, fps=core.FPS, frame_inicial=1):
+    """
+    Generador: para cada frame (array en gris) devuelve (k, fila), en orden
+    (fila None si no se encontró la gota). Los frames se procesan en ventanas acotadas en paralelo.
+    El sustrato de referencia se detecta en el primer frame de la secuencia
+    (los valores fijos del TP solo valen para las imágenes del TP).
+    """
+    dt = 1.0 / fps
+    hilos = core.hilos_frames()
+    ventana = hilos * core.TP4_LOTE
+    frames = iter(frames)
+    k = frame_inicial
+    y0_ref = None
+
+    with ThreadPoolExecutor(max_workers=hilos) as pool:
+        while True:
+            lote = list(islice(frames, ventana))
+            if not lote:
+                break
+            if y0_ref is None:
+                y0_ref = detectar_y0(lote[0])
+            indices = range(k, k + len(lote))
+            resultados = pool.map(
+                lambda args: core.analizar_frame(*args, dt=dt, sust_fix={}, y0_ref=y0_ref)[0],
+                zip(indices, lote),
+            )
+            for idx, fila in zip(indices, resultados):
+                yield idx, fila
+            k += len(lote)
+
+
+def ndjson_secuencia(ruta, fps=core.FPS):
+    """
+    Líneas NDJSON con el resultado de cada frame y un resumen final.
+    Los frames sin gota detectada salen con {"frame_idx": k, "gota": false}.
+    """
+    total = detectados = 0
+    try:
+        for k, fila in analizar_secuencia(iterar_frames(ruta), fps=fps):
+            total += 1
+            if fila is None:
+                yield json.dumps({"frame_idx": k, "gota": False}) + "\n"
+                continue
+            detectados += 1
+            yield json.dumps(_limpiar(fila)) + "\n"
+    except ValueError as e:
+        yield json.dumps({"error": str(e)}) + "\n"
+        return
+    yield json.dumps({"fin": True, "frames": total, "con_gota": detectados, "fps": fps}) + "\n"
@@ -1,8 +1,8 @@
-import matplotlib.pyplot as plt
-import io
 import cv2
 import numpy as np
 from .core import processor
+from services.common.render_cache import cache_png
+from services.common.graficos import nueva_figura, figura_a_png
 
 # Textos
 CONSIGNA = """
@@ -40,6 +40,7 @@ def obtener_logs():
     processor.get_data()
     return processor.get_logs()
 
+@cache_png(entradas=processor.firma_datos, modulos=("services.tp4.core", "services.tp4.utils"))
 def generar_grafico_procesamiento():
     """Genera imagen comparativa: Original con corte vs Segmentada."""
     vis_data = processor.get_visualization_frame()
@@ -50,7 +51,7 @@ def generar_grafico_procesamiento():
     cx, cy = vis_data["cx"], vis_data["cy"]
     y_sust = vis_data["y_sustrato"]
     
-    fig, axs = plt.subplots(1, 2, figsize=(10, 5))
+    fig, axs = nueva_figura(1, 2, figsize=(10, 5))
     
     # 1. Imagen Original marcando el corte
     axs[0].imshow(img, cmap="gray")
@@ -67,19 +68,16 @@ def generar_grafico_procesamiento():
     axs[1].set_title("Gota Aislada (Sin Reflejo)")
     axs[1].legend()
 
-    plt.tight_layout()
+    fig.tight_layout()
     
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
 
+@cache_png(entradas=processor.firma_datos, modulos=("services.tp4.core", "services.tp4.utils"))
 def generar_grafico_trayectoria_vertical():
     """Grafica Y_centro vs Tiempo."""
     df = processor.get_data()
     
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = nueva_figura(figsize=(8, 5))
     y_um = df["cy_m"] * 1e6
     t_ms = df["t_ms"]
     
@@ -90,18 +88,15 @@ def generar_grafico_trayectoria_vertical():
     ax.grid(True, linestyle='--', alpha=0.6)
     ax.legend()
     
-    plt.tight_layout()
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
+    fig.tight_layout()
+    return figura_a_png(fig)
 
+@cache_png(entradas=processor.firma_datos, modulos=("services.tp4.core", "services.tp4.utils"))
 def generar_grafico_posicion_horizontal():
     """Grafica X_centro vs Tiempo."""
     df = processor.get_data()
     
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = nueva_figura(figsize=(8, 5))
     
     # X en micrones
     x_um = df["cx_m"] * 1e6
@@ -116,12 +111,14 @@ def generar_grafico_posicion_horizontal():
     ax.grid(True, linestyle='--', alpha=0.6)
     ax.legend()
     
-    plt.tight_layout()
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
+    fig.tight_layout()
+    return figura_a_png(fig)
+
+def datos_trayectoria():
+    """Series de los gráficos 1b: posición del centro de masa vs tiempo."""
+    df = processor.get_data()
+    series = {"t_ms": df["t_ms"].to_numpy(), "y_um": df["cy_m"].to_numpy() * 1e6, "x_um": df["cx_m"].to_numpy() * 1e6}
+    return series, {"unidades": {"t_ms": "ms", "y_um": "µm", "x_um": "µm"}}
 
 def obtener_salida_consola():
     """Genera el texto formateado para la consola del Inciso 1."""
@@ -1,8 +1,8 @@
-import matplotlib.pyplot as plt
-import io
 import pandas as pd
 import numpy as np
-from .core import processor
+from .core import processor, ENTRADAS
+from services.common.render_cache import cache_png
+from services.common.graficos import nueva_figura, figura_a_png
 
 CONSIGNA = """
 2) Medición del ángulo de contacto
@@ -35,6 +35,13 @@ def obtener_datos_angulos():
     df_ang = df[["t_ms", "angL_spline", "angR_spline", "angL_poly", "angR_poly"]].dropna()
     return df_ang.to_dict(orient="records")
 
+def datos_grafico_angulos():
+    """Series del gráfico 2b (solo los frames con contacto)."""
+    df = processor.get_data().dropna(subset=["angL_spline"])
+    columnas = ["t_ms", "angL_spline", "angR_spline", "angL_poly", "angR_poly"]
+    return {c: df[c].to_numpy() for c in columnas}, {"unidades": {"t_ms": "ms", "angulos": "°"}}
+
+@cache_png(entradas=processor.firma_datos, modulos=("services.tp4.core", "services.tp4.utils"))
 def generar_grafico_angulos():
     """Grafica Ángulos vs Tiempo comparando métodos."""
     df = processor.get_data()
@@ -44,7 +51,7 @@ def generar_grafico_angulos():
     
     if df_plot.empty: return None
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = nueva_figura(figsize=(10, 6))
     
     # Graficar Splines (Suelen ser más precisos)
     ax.plot(df_plot["t_ms"], df_plot["angL_spline"], 'o-', ms=3, alpha=0.7, label="Izq (Spline)")
@@ -60,13 +67,9 @@ def generar_grafico_angulos():
     ax.legend()
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
 
 def obtener_salida_consola():
     """Genera la tabla comparativa de ángulos promedios."""
@@ -100,6 +103,7 @@ MÉTODO POLYFIT PARAMÉTRICO (Grado 2/3) (θ):
 *Nota: Se observa una discrepancia sistemática entre métodos debido a la
 sensibilidad del Spline a la curvatura local vs el suavizado del Polinomio.
 """
+@cache_png(entradas=ENTRADAS, modulos=("services.tp4.core", "services.tp4.utils"))
 def generar_grafico_ajuste_frame28():
     """Genera los gráficos de ajuste (Izq/Der) para el Frame 28."""
     data = processor.get_ajuste_detalle(frame_obj=28)
@@ -107,7 +111,7 @@ def generar_grafico_ajuste_frame28():
     if not data or (not data["L"] and not data["R"]):
         return None
 
-    fig, axs = plt.subplots(1, 2, figsize=(12, 5))
+    fig, axs = nueva_figura(1, 2, figsize=(12, 5))
     
     for i, (lado, titulo) in enumerate([("L", "Izquierdo"), ("R", "Derecho")]):
         d = data[lado]
@@ -136,9 +140,5 @@ def generar_grafico_ajuste_frame28():
         else:
             ax.text(0.5, 0.5, "Sin contacto en este lado", ha='center')
 
-    plt.tight_layout()
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
\ No newline at end of file
+    fig.tight_layout()
+    return figura_a_png(fig)
\ No newline at end of file
@@ -1,7 +1,7 @@
-import matplotlib.pyplot as plt
-import io
 import numpy as np
 from .core import processor
+from services.common.render_cache import cache_png
+from services.common.graficos import nueva_figura, figura_a_png
 
 CONSIGNA = """
 3) Análisis de variables auxiliares
@@ -30,9 +30,10 @@ EXPLICACION = """
    • CONCLUSIÓN: No hay conservación. La energía se disipa por viscosidad y se almacena como tensión superficial.
 """
 
+@cache_png(entradas=processor.firma_datos, modulos=("services.tp4.core", "services.tp4.utils"))
 def generar_grafico_sf():
     df = processor.get_data()
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = nueva_figura(figsize=(8, 5))
     
     ax.plot(df["t_ms"], df["Sf"], 'm-', label="Factor de Esparcimiento ($S_f$)")
     
@@ -42,15 +43,12 @@ def generar_grafico_sf():
     ax.grid(True, alpha=0.3)
     ax.legend()
     
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
 
+@cache_png(entradas=processor.firma_datos, modulos=("services.tp4.core", "services.tp4.utils"))
 def generar_grafico_simetria():
     df = processor.get_data()
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = nueva_figura(figsize=(8, 5))
     
     # Convertir a mm para mejor escala
     ax.plot(df["t_ms"], df["per_izq"]*1000, 'b-', label="Perímetro Izq")
@@ -62,12 +60,9 @@ def generar_grafico_simetria():
     ax.grid(True, alpha=0.3)
     ax.legend()
     
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
 
+@cache_png(entradas=processor.firma_datos, modulos=("services.tp4.core", "services.tp4.utils"))
 def generar_grafico_energia():
     df = processor.get_data()
     
@@ -79,7 +74,7 @@ def generar_grafico_energia():
     # Ec = 0.5 * m * v^2
     Ec = 0.5 * df["masa"] * vy**2
     
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = nueva_figura(figsize=(8, 5))
     
     # En MicroJoules
     ax.plot(df["t_ms"], Ec * 1e6, 'g-', label="Energía Cinética")
@@ -90,11 +85,21 @@ def generar_grafico_energia():
     ax.grid(True, alpha=0.3)
     ax.legend()
     
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close(fig)
-    buffer.seek(0)
-    return buffer
+    return figura_a_png(fig)
+
+def datos_variables_auxiliares():
+    """Series de los tres gráficos del inciso 3 (Sf, perímetros y energía cinética)."""
+    df = processor.get_data()
+    t_s = df["t_ms"] / 1000
+    vy = np.gradient(df["cy_m"], t_s)
+    series = {
+        "t_ms": df["t_ms"].to_numpy(),
+        "Sf": df["Sf"].to_numpy(),
+        "per_izq_mm": df["per_izq"].to_numpy() * 1000,
+        "per_der_mm": df["per_der"].to_numpy() * 1000,
+        "Ec_uJ": (0.5 * df["masa"] * vy**2).to_numpy() * 1e6,
+    }
+    return series, {"unidades": {"t_ms": "ms", "Sf": "D/H", "per_izq_mm": "mm", "per_der_mm": "mm", "Ec_uJ": "µJ"}}
 
 def obtener_salida_consola():
     """Genera resumen de Sf, Simetría y Energía."""
@@ -45,6 +45,27 @@ def extraer_contorno(binv, area_min=100):
         return None
     return normalize_contour(cont)
 
+def radios_por_fila(binv):
+    """
+    Radio (px) de la gota en cada fila de la máscara binaria: media distancia
+    entre la primera y la última columna con píxeles. Todas las filas a la
+    vez (argmax sobre la máscara y sobre la máscara espejada). Las filas con
+    menos de 2 píxeles encendidos dan radio 0.
+    """
+    mask = np.asarray(binv) > 0
+    if mask.ndim != 2 or mask.size == 0:
+        return np.zeros(0)
+    W = mask.shape[1]
+    primera = np.argmax(mask, axis=1)
+    ultima = W - 1 - np.argmax(mask[:, ::-1], axis=1)
+    validas = np.count_nonzero(mask, axis=1) > 1
+    return np.where(validas, (ultima - primera + 1) / 2.0, 0.0)
+
+def volumen_revolucion(binv, escala_m_por_px):
+    """Volumen (m³) del sólido de revolución: suma de discos pi*r²*dy, un disco por fila."""
+    r = radios_por_fila(binv) * escala_m_por_px
+    return float(np.pi * np.sum(r**2) * escala_m_por_px)
+
 def centroide(cont):
     """Calcula el centro de masa del contorno."""
     M = cv2.moments(cont.astype(np.int32))
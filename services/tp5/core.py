@@ -7,8 +7,16 @@ import glob
 from .numerical import taylor3_solver, abm4_solver, sistema_gota
 from scipy.integrate import solve_ivp
 from ..tp4.core import processor as tp4_processor # Reutilizamos TP4!
+from ..tp4.core import ENTRADAS as ENTRADAS_TP4
+from services.common.render_cache import firma_entradas
 
 CSV_PATH = os.path.join("data/tp5", "centro_vs_tiempo.csv")
+ENTRADAS = ENTRADAS_TP4 + (CSV_PATH,)
+
+
+def firma_datos():
+    """Clave de los gráficos: imágenes con las que TP4 calculó sus datos + el CSV."""
+    return tp4_processor.firma_datos() + firma_entradas((CSV_PATH,))
 
 # Constantes físicas para texto y simulación
 MASA = 1.6e-8
@@ -98,6 +106,13 @@ class TP5Processor:
             "r_fit_um": r_plot * L_UM
         }
 
+    def invalidar(self):
+        """Descarta los resultados (se llama cuando TP4 incorpora frames nuevos)."""
+        self.data_integration = None
+        self.data_ode = None
+        self.console_output_1 = "No data yet."
+        self.console_output_2 = "No data yet."
+
     def get_integration_data(self):
         """Retorna datos de integración. Si no existen, procesa."""
         if self.data_integration is None:
@@ -267,4 +282,7 @@ Menos evaluaciones: Taylor Orden 3
             "yeq": Y_EQ / 1000.0 # m
         }
 
-tp5_processor = TP5Processor()
\ No newline at end of file
+tp5_processor = TP5Processor()
+
+# Si TP4 suma frames nuevos, la integración y la EDO se recalculan
+tp4_processor.suscribir(tp5_processor.invalidar)
@@ -1,7 +1,7 @@
-import io
-import matplotlib.pyplot as plt
 import numpy as np
-from .core import tp5_processor
+from .core import tp5_processor, ENTRADAS, firma_datos
+from services.common.render_cache import cache_png
+from services.common.graficos import nueva_figura, figura_a_png
 
 CONSIGNA = """
 1. Cálculo de Volumen y Área (Integración Numérica)
@@ -22,13 +22,20 @@ def get_console_output():
     tp5_processor.get_integration_data() # Trigger
     return tp5_processor.console_output_1
 
+def datos_integracion():
+    """Series de los gráficos de volumen y radio vs tiempo."""
+    data = tp5_processor.get_integration_data()
+    series = {"t_ms": data["t"], "v_mm3": data["v"], "r_mm": data["r_mm"]}
+    return series, {"v_ideal_mm3": data["v_ideal"], "unidades": {"t_ms": "ms", "v_mm3": "mm³", "r_mm": "mm"}}
+
+@cache_png(entradas=firma_datos, modulos=("services.tp5.core", "services.tp5.numerical", "services.tp4.core", "services.tp4.utils"))
 def generar_grafico_volumen():
     data = tp5_processor.get_integration_data()
     t = data["t"]
     v = data["v"]
     v_ideal = data["v_ideal"]
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = nueva_figura(figsize=(10, 6))
     ax.plot(t, v, 'b-', label="Volumen Experimental (Integrado)")
     ax.axhline(v_ideal, color='r', linestyle='--', label=f"Volumen Ideal Esfera ({v_ideal} mm³)")
     
@@ -38,18 +45,15 @@ def generar_grafico_volumen():
     ax.grid(True, alpha=0.3)
     ax.legend()
     
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+    return figura_a_png(fig)
  
+@cache_png(entradas=firma_datos, modulos=("services.tp5.core", "services.tp5.numerical", "services.tp4.core", "services.tp4.utils"))
 def generar_grafico_radio():
     data = tp5_processor.get_integration_data()
     t = data["t"]
     r = data["r_mm"]
     
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = nueva_figura(figsize=(8, 5))
     ax.plot(t, r, 'm-', label="Radio de Contacto")
     
     ax.set_xlabel("Tiempo [ms]")
@@ -58,12 +62,9 @@ def generar_grafico_radio():
     ax.grid(True, alpha=0.3)
     ax.legend()
     
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+    return figura_a_png(fig)
 
+@cache_png(entradas=ENTRADAS, modulos=("services.tp5.core", "services.tp5.numerical", "services.tp4.core", "services.tp4.utils"))
 def generar_grafico_perfil_80():
     """
     Genera un gráfico visualmente rico del perfil de la gota en el Frame 80.
@@ -77,7 +78,7 @@ def generar_grafico_perfil_80():
     y_fit = data["y_fit_um"]
     r_fit = data["r_fit_um"]
     
-    fig, ax = plt.subplots(figsize=(7, 7))
+    fig, ax = nueva_figura(figsize=(7, 7))
     
     # 1. Puntos Experimentales (Scatter con transparencia)
     # Graficamos ambos lados (R y -R) para dar efecto de "gota completa"
@@ -103,10 +104,6 @@ def generar_grafico_perfil_80():
     ax.axis('equal') # Importante para que no se vea deformada
     
     # Ajustes finales
-    plt.tight_layout()
+    fig.tight_layout()
     
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=100) # DPI 100 para buena calidad
-    plt.close(fig)
-    buf.seek(0)
-    return buf
\ No newline at end of file
+    return figura_a_png(fig, dpi=100) # DPI 100 para buena calidad
\ No newline at end of file
@@ -1,12 +1,8 @@
 # services/tp5/service_inciso_2.py
-import io
-import matplotlib.pyplot as plt
 import numpy as np
-import matplotlib
-from .core import tp5_processor
-
-# Configurar backend no interactivo para evitar errores de GUI en servidor
-matplotlib.use('Agg')
+from .core import tp5_processor, firma_datos
+from services.common.render_cache import cache_png
+from services.common.graficos import nueva_figura, figura_a_png
 
 CONSIGNA = r"""
 **2. Modelo de la Dinámica de la Gota (EDO)**
@@ -116,10 +112,32 @@ def get_console_output():
     
     return output
 
+def datos_dinamica():
+    """
+    Series de los gráficos comparativo, de fase y de error: t [ms], y [mm] y
+    v [mm/s] de cada método, los datos experimentales y el error contra RK45 [m].
+    """
+    from scipy.interpolate import interp1d
+    data = tp5_processor.get_ode_data()
+
+    series = {}
+    for metodo in ("rk", "tay", "abm"):
+        series[f"{metodo}_t_ms"] = data[metodo]["t"] * 1000
+        series[f"{metodo}_y_mm"] = data[metodo]["y"] * 1000
+        series[f"{metodo}_v_mm_s"] = data[metodo]["v"] * 1000
+    series["exp_t_ms"] = data["exp"]["t"] * 1000
+    series["exp_y_mm"] = data["exp"]["y"] * 1000
+    t_rk, y_rk = data["rk"]["t"], data["rk"]["y"]
+    for metodo in ("tay", "abm"):
+        f = interp1d(data[metodo]["t"], data[metodo]["y"], fill_value="extrapolate")
+        series[f"error_{metodo}_m"] = np.abs(f(t_rk) - y_rk)
+    return series, {"yeq_mm": data["yeq"] * 1000}
+
+@cache_png(entradas=firma_datos, modulos=("services.tp5.core", "services.tp5.numerical", "services.tp4.core", "services.tp4.utils"))
 def generar_grafico_final():
     data = tp5_processor.get_ode_data()
     
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = nueva_figura(figsize=(12, 7))
     
     # 1. Modelo Referencia
     rk = data["rk"]
@@ -154,17 +172,14 @@ def generar_grafico_final():
     margin = (ymax - ymin) * 0.1
     ax.set_ylim(ymin - margin, ymax + margin)
     
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+    return figura_a_png(fig)
 
+@cache_png(entradas=firma_datos, modulos=("services.tp5.core", "services.tp5.numerical", "services.tp4.core", "services.tp4.utils"))
 def generar_grafico_fase():
     """Grafica el Espacio de Fase (Velocidad vs Posición)."""
     data = tp5_processor.get_ode_data()
     
-    fig, ax = plt.subplots(figsize=(8, 6))
+    fig, ax = nueva_figura(figsize=(8, 6))
     
     # RK45 (Referencia)
     # Asumimos que la velocidad está en m/s, la pasamos a mm/s o la dejamos en m/s pero aclaramos
@@ -184,12 +199,9 @@ def generar_grafico_fase():
     ax.grid(True, alpha=0.3)
     ax.legend()
     
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+    return figura_a_png(fig)
 
+@cache_png(entradas=firma_datos, modulos=("services.tp5.core", "services.tp5.numerical", "services.tp4.core", "services.tp4.utils"))
 def generar_grafico_error():
     """Grafica el Error absoluto de los métodos vs RK45 a lo largo del tiempo."""
     data = tp5_processor.get_ode_data()
@@ -205,7 +217,7 @@ def generar_grafico_error():
     error_tay = np.abs(f_tay(t_rk) - y_rk)
     error_abm = np.abs(f_abm(t_rk) - y_rk)
     
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = nueva_figura(figsize=(8, 5))
     ax.semilogy(t_rk*1000, error_tay, 'r-', label="|Taylor - RK45|")
     ax.semilogy(t_rk*1000, error_abm, 'b--', label="|ABM4 - RK45|")
     
@@ -215,8 +227,4 @@ def generar_grafico_error():
     ax.grid(True, which="both", alpha=0.3)
     ax.legend()
     
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
\ No newline at end of file
+    return figura_a_png(fig)
\ No newline at end of file
@@ -1,7 +1,6 @@
 # services/tp6/numerical.py
 import numpy as np
-import matplotlib.pyplot as plt
-import io
+from services.common.graficos import figura_a_png
 
 # --- Constantes Físicas Generales ---
 D0 = 0.1
@@ -85,8 +84,4 @@ def simular_2D_lineal(L, N, T_final, D_coef, CI_func, alpha_factor=0.20):
 # --- Utilidades de Gráficos ---
 def save_plot_to_buffer(fig):
     """Convierte una figura de Matplotlib a un buffer de bytes para FastAPI."""
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-    buf.seek(0)
-    plt.close(fig) # Liberar memoria
-    return buf
\ No newline at end of file
+    return figura_a_png(fig, dpi=100, bbox_inches='tight')
\ No newline at end of file
@@ -1,9 +1,11 @@
 # services/tp6/service_inciso_a.py
 import numpy as np
 import time
-import matplotlib.pyplot as plt
 from services.tp6.numerical import D0, save_plot_to_buffer
 from services.tp6.core import processor
+from services.common.graficos import nueva_figura
+from services.common.ejecutor import ejecutar
+from services.common.render_cache import cache_png
 
 _cache_a = None
 
@@ -54,17 +56,27 @@ def _run_a():
     error = np.max(np.abs(theta - theta_ana))
     
     elapsed = time.time() - start_time
-    processor.record_time("A", elapsed)
     
     return {
-        "L": L, "T": T_final_real, "Nx": Nx, "dx": dx, "Nt": Nt, "dt": dt,
+        "L": L, "T": T_final_real, "Nx": Nx, "dx": dx, "Nt": Nt, "dt": dt, "elapsed": elapsed,
         "alpha": alpha, "error": error, "x": x, "th_ini": theta_ini, 
         "th_num": theta, "th_ana": theta_ana
     }
 
-def _get_data():
+def _guardar(res):
     global _cache_a
-    if _cache_a is None: _cache_a = _run_a()
+    # El tiempo se mide en el proceso que simula y se registra acá (proceso principal)
+    processor.record_time("A", res['elapsed'])
+    _cache_a = res
+    return _cache_a
+
+def _get_data():
+    if _cache_a is None: _guardar(_run_a())
+    return _cache_a
+
+async def obtener_datos():
+    """Igual que _get_data pero corriendo la simulación en el pool de procesos."""
+    if _cache_a is None: _guardar(await ejecutar(_run_a, clave="tp6.a"))
     return _cache_a
 
 def get_console():
@@ -77,9 +89,10 @@ def get_console():
         f"   Error máximo (L-inf) en T_final: {res['error']:.2e}"
     )
 
+@cache_png(modulos=("services.tp6.numerical",))
 def get_grafico():
     res = _get_data()
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = nueva_figura(figsize=(10, 6))
     ax.set_title(f"Inciso (a): Difusión 1D (FTCS) en T = {res['T']:.2f} s")
     ax.plot(res['x'], res['th_ini'], 'k--', label="Condición Inicial (t=0)")
     ax.plot(res['x'], res['th_num'], 'bo', markersize=5, label=f"Numérica (FTCS, Nx={res['Nx']})")
@@ -88,6 +101,11 @@ def get_grafico():
     ax.legend(); ax.grid(True)
     return save_plot_to_buffer(fig)
  
+def get_datos():
+    res = _get_data()
+    series = {"x": res['x'], "th_ini": res['th_ini'], "th_num": res['th_num'], "th_ana": res['th_ana']}
+    return series, {"T": float(res['T']), "Nx": int(res['Nx'])}
+
 def get_explicacion():
     return r"""
 **Fundamentación y Conclusiones - Inciso A (Validación 1D)**
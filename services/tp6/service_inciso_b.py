@@ -1,11 +1,14 @@
 # services/tp6/service_inciso_b.py
 import numpy as np
 import time
-import matplotlib.pyplot as plt
+import matplotlib
 from scipy.integrate import solve_ivp
 from scipy.optimize import fsolve
 from services.tp6.numerical import D_VanGenuchten, dD_dtheta, VG_PARAMS, save_plot_to_buffer
 from services.tp6.core import processor
+from services.common.graficos import nueva_figura
+from services.common.ejecutor import ejecutar
+from services.common.render_cache import cache_png
 
 _cache_b = None
 
@@ -95,27 +98,39 @@ def run_fdm():
         theta[:] = theta_new[:]
         
     elapsed = time.time() - start_time
-    processor.record_time("B", elapsed)
     
     return {
         "L": L, "T": T_final, "Nx": Nx, "dx": dx, "dt": dt, "elapsed": elapsed,
         "x": x, "snaps": snapshots, "ft": np.array(front_t), "fx": front_x
     }
 
-def _get_data():
+def _run_b():
+    C_shot, b_phi, b_theta, phi_front = solve_boltzmann()
+    fdm_res = run_fdm()
+    return {
+        "boltzmann": {
+            "C_shot": C_shot, 
+            "phi_front_ref": phi_front,
+            "phi_arr": b_phi,      
+            "theta_arr": b_theta   
+        }, 
+        "fdm": fdm_res
+    }
+
+def _guardar(res):
     global _cache_b
-    if _cache_b is None:
-        C_shot, b_phi, b_theta, phi_front = solve_boltzmann()
-        fdm_res = run_fdm()
-        _cache_b = {
-            "boltzmann": {
-                "C_shot": C_shot, 
-                "phi_front_ref": phi_front,
-                "phi_arr": b_phi,      
-                "theta_arr": b_theta   
-            }, 
-            "fdm": fdm_res
-        }
+    # Se registra solo el tiempo del FDM (el shooting de Boltzmann es la referencia)
+    processor.record_time("B", res["fdm"]["elapsed"])
+    _cache_b = res
+    return _cache_b
+
+def _get_data():
+    if _cache_b is None: _guardar(_run_b())
+    return _cache_b
+
+async def obtener_datos():
+    """Igual que _get_data pero corriendo la simulación en el pool de procesos."""
+    if _cache_b is None: _guardar(await ejecutar(_run_b, clave="tp6.b"))
     return _cache_b
 
 def get_console():
@@ -169,14 +184,14 @@ def get_console():
 
     return out
 
+@cache_png(modulos=("services.tp6.numerical",))
 def get_grafico_perfiles():
     data = _get_data(); f = data["fdm"]
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = nueva_figura(figsize=(10, 5))
     ax.set_title("Evolución Temporal de Perfiles de Humedad (FDM Van Genuchten)")
     
-    # --- CORRECCIÓN AQUÍ PARA PYLANCE ---
-    # Usamos plt.get_cmap() en lugar de plt.cm.viridis directo
-    cmap = plt.get_cmap("viridis")
+    # Registro de colormaps de matplotlib (sin pasar por pyplot)
+    cmap = matplotlib.colormaps["viridis"]
     colors = cmap(np.linspace(0, 1, len(f['snaps'])))
     
     for i, (t, th) in enumerate(f['snaps']):
@@ -187,9 +202,10 @@ def get_grafico_perfiles():
     ax.legend(); ax.grid(True, alpha=0.3)
     return save_plot_to_buffer(fig)
 
+@cache_png(modulos=("services.tp6.numerical",))
 def get_grafico_frente():
     data = _get_data(); f = data["fdm"]; phi = data["boltzmann"]["phi_front_ref"]
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = nueva_figura(figsize=(10, 5))
     ax.set_title(r"Validación de Posición del Frente ($\theta=0.5$)")
     st = np.sqrt(f['ft'])
     ax.plot(st, f['fx'], 'bo', ms=3, label="Frente Numérico")
@@ -198,11 +214,12 @@ def get_grafico_frente():
     ax.legend(); ax.grid(True, alpha=0.3)
     return save_plot_to_buffer(fig)
 
+@cache_png(modulos=("services.tp6.numerical",))
 def get_grafico_zoom():
     data = _get_data()
     b = data["boltzmann"]
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = nueva_figura(figsize=(10, 6))
     ax.set_title("Inciso (b): Referencia Boltzmann (Van Genuchten) - Zoom en Frente")
     
     ax.plot(b['phi_arr'], b['theta_arr'], 'r-', lw=2.5, label='Solución ODE')
@@ -216,6 +233,21 @@ def get_grafico_zoom():
     
     return save_plot_to_buffer(fig)
 
+def get_datos():
+    """Series de los tres gráficos: perfiles (una fila por instante), frente y referencia de Boltzmann."""
+    data = _get_data(); f = data["fdm"]; b = data["boltzmann"]
+    series = {
+        "x": f['x'],
+        "perfiles": np.vstack([th for _, th in f['snaps']]),
+        "sqrt_t": np.sqrt(f['ft']),
+        "frente_x": f['fx'],
+        "phi": b['phi_arr'],
+        "theta": b['theta_arr'],
+    }
+    meta = {"tiempos_perfiles": [float(t) for t, _ in f['snaps']], "phi_frente": float(b["phi_front_ref"]),
+            "theta_r": VG_PARAMS['theta_r']}
+    return series, meta
+
 def get_explicacion():
     return r"""
 
@@ -1,9 +1,11 @@
 # services/tp6/service_inciso_c.py
 import numpy as np
 import time
-import matplotlib.pyplot as plt
 from services.tp6.numerical import D0, simular_2D_lineal, save_plot_to_buffer
 from services.tp6.core import processor
+from services.common.graficos import nueva_figura
+from services.common.ejecutor import ejecutar
+from services.common.render_cache import cache_png
 
 _cache_c = None
 
@@ -51,13 +53,23 @@ def _run_c():
         logs.append({"N":N, "dx":dx, "dt":dt, "Nt":Nt, "a":alpha, "err":l2})
         
     elapsed = time.time() - start_time
-    processor.record_time("C", elapsed)
     
     return {"dx": dx_list, "err": errors_list, "logs": logs, "elapsed": elapsed}
 
-def _get_data():
+def _guardar(res):
     global _cache_c
-    if _cache_c is None: _cache_c = _run_c()
+    # El tiempo se mide en el proceso que simula y se registra acá (proceso principal)
+    processor.record_time("C", res['elapsed'])
+    _cache_c = res
+    return _cache_c
+
+def _get_data():
+    if _cache_c is None: _guardar(_run_c())
+    return _cache_c
+
+async def obtener_datos():
+    """Igual que _get_data pero corriendo la simulación en el pool de procesos."""
+    if _cache_c is None: _guardar(await ejecutar(_run_c, clave="tp6.c"))
     return _cache_c
 
 def get_console():
@@ -135,9 +147,10 @@ def get_console():
     
     return out
 
+@cache_png(modulos=("services.tp6.numerical",))
 def get_grafico_error():
     d = _get_data()
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = nueva_figura(figsize=(10, 6))
     ax.set_title(r"Inciso (c): Prueba de Convergencia FDM 2D (Error $L^2$)")
     ax.plot(d['dx'], d['err'], 'bo-', label='Error L2 Numérico')
     
@@ -151,6 +164,12 @@ def get_grafico_error():
     ax.invert_xaxis()
     return save_plot_to_buffer(fig)
  
+def get_datos():
+    d = _get_data()
+    dx = np.array(d['dx'])
+    C = d['err'][0] / (dx[0]**2)
+    return {"dx": dx, "err": d['err'], "referencia_h2": C * dx**2}, {}
+
 def get_explicacion():
     return r"""
 ### Fundamentación y Conclusiones - Inciso C
@@ -1,9 +1,11 @@
 # services/tp6/service_inciso_d.py
 import numpy as np
 import time
-import matplotlib.pyplot as plt
 from services.tp6.numerical import D0, simular_2D_lineal, save_plot_to_buffer
 from services.tp6.core import processor
+from services.common.graficos import nueva_figura
+from services.common.ejecutor import ejecutar
+from services.common.render_cache import cache_png
 
 _cache_d = None
 
@@ -57,14 +59,23 @@ def _run_d():
     _, _, _, _, th2, _, _, _, _ = simular_2D_lineal(L, Nx, T, D0, lambda X,Y,L: ic_gota(X,Y,L,Rg))
     t2 = time.time() - start2
     
-    # Registro tiempo
-    processor.record_time("D", t1 + t2)
-    
-    return {"r": r_1d, "th1": th_1d, "th2_cut": th2[Nx//2, Nx//2:], "th2_full": th2, "t1": t1, "t2": t2, "N": Nx}
+    return {"r": r_1d, "th1": th_1d, "th2_cut": th2[Nx//2, Nx//2:], "th2_full": th2, "t1": t1, "t2": t2, "N": Nx,
+            "elapsed": t1 + t2}
 
-def _get_data():
+def _guardar(res):
     global _cache_d
-    if _cache_d is None: _cache_d = _run_d()
+    # El tiempo se mide en el proceso que simula y se registra acá (proceso principal)
+    processor.record_time("D", res['elapsed'])
+    _cache_d = res
+    return _cache_d
+
+def _get_data():
+    if _cache_d is None: _guardar(_run_d())
+    return _cache_d
+
+async def obtener_datos():
+    """Igual que _get_data pero corriendo la simulación en el pool de procesos."""
+    if _cache_d is None: _guardar(await ejecutar(_run_d, clave="tp6.d"))
     return _cache_d
 
 def get_console():
@@ -76,23 +87,30 @@ def get_console():
         f"   (Tiempo total registrado: {d['t1']+d['t2']:.2f}s)"
     )
 
+@cache_png(modulos=("services.tp6.numerical",))
 def get_grafico_1d():
     d = _get_data()
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = nueva_figura(figsize=(10, 6))
     ax.set_title("Inciso (d): Comparación de Perfiles Radiales")
     ax.plot(d['r'], d['th1'], 'r-', lw=3, label="Referencia 1D")
     ax.plot(d['r'], d['th2_cut'], 'b.', ms=8, label="Corte 2D")
     ax.legend(); ax.grid(True)
     return save_plot_to_buffer(fig)
 
+@cache_png(modulos=("services.tp6.numerical",))
 def get_grafico_2d():
     d = _get_data()
-    fig, ax = plt.subplots(figsize=(7, 6))
+    fig, ax = nueva_figura(figsize=(7, 6))
     ax.set_title("Inciso (d): Gota Circular 2D")
     im = ax.imshow(d['th2_full'], origin='lower', cmap='viridis')
     fig.colorbar(im, ax=ax)
     return save_plot_to_buffer(fig)
 
+def get_datos():
+    """Perfiles radiales 1D/2D y el campo 2D completo (filas = y, como en imshow con origin='lower')."""
+    d = _get_data()
+    return {"r": d['r'], "th1": d['th1'], "th2_cut": d['th2_cut'], "th2_full": d['th2_full']}, {"N": int(d['N'])}
+
 def get_explicacion():
     return r"""
 ### Fundamentación y Conclusiones - Inciso D
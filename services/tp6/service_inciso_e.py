@@ -1,9 +1,11 @@
 # services/tp6/service_inciso_e.py
 import numpy as np
 import time
-import matplotlib.pyplot as plt
 from services.tp6.numerical import D0, simular_2D_lineal, save_plot_to_buffer
 from services.tp6.core import processor
+from services.common.graficos import nueva_figura
+from services.common.ejecutor import ejecutar
+from services.common.render_cache import cache_png
 
 _cache_e = None
 
@@ -36,26 +38,41 @@ def _run_e():
     # Unpack 9 valores
     _, _, _, _, th, _, _, _, _ = simular_2D_lineal(L, Nx, T, D0, lambda X,Y,L: ic_elipse(X,Y,L))
     elapsed = time.time() - start
-    processor.record_time("E", elapsed)
     return {"th": th, "elap": elapsed, "N": Nx}
 
-def _get_data():
+def _guardar(res):
     global _cache_e
-    if _cache_e is None: _cache_e = _run_e()
+    # El tiempo se mide en el proceso que simula y se registra acá (proceso principal)
+    processor.record_time("E", res['elap'])
+    _cache_e = res
+    return _cache_e
+
+def _get_data():
+    if _cache_e is None: _guardar(_run_e())
+    return _cache_e
+
+async def obtener_datos():
+    """Igual que _get_data pero corriendo la simulación en el pool de procesos."""
+    if _cache_e is None: _guardar(await ejecutar(_run_e, clave="tp6.e"))
     return _cache_e
 
 def get_console():
     d = _get_data()
     return f"Ejecutando Inciso E...\n   Simulación 2D Elíptica completada en {d['elap']:.2f}s"
 
+@cache_png(modulos=("services.tp6.numerical",))
 def get_grafico():
     d = _get_data()
-    fig, ax = plt.subplots(figsize=(7, 6))
+    fig, ax = nueva_figura(figsize=(7, 6))
     ax.set_title("Inciso (e): Gota Elíptica 2D")
     im = ax.imshow(d['th'], origin='lower', cmap='viridis')
     fig.colorbar(im, ax=ax)
     return save_plot_to_buffer(fig)
 
+def get_datos():
+    d = _get_data()
+    return {"th": d['th']}, {"N": int(d['N'])}
+
 def get_explicacion():
     return r"""
 ### Fundamentación y Conclusiones - Inciso E
@@ -1,8 +1,8 @@
 # services/tp6/service_inciso_f.py
-import matplotlib.pyplot as plt
 import numpy as np
 from services.tp6.numerical import save_plot_to_buffer
 from services.tp6.core import processor
+from services.common.graficos import nueva_figura
 
 def get_consigna():
     return r"""
@@ -66,7 +66,7 @@ def get_grafico_costos():
     labels = list(times.keys())
     values = list(times.values())
     
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = nueva_figura(figsize=(8, 5))
     colors = ['#3498db', '#e74c3c', '#2ecc71', '#f1c40f', '#9b59b6']
     bars = ax.bar(labels, values, color=colors, edgecolor='black', alpha=0.7)
     
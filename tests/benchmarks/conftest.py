@@ -0,0 +1,85 @@
+# Suite de benchmarks de los caminos calientes de cada TP.
+#
+# Desactivada por defecto (es lenta y depende de la máquina). Para correrla:
+#   BENCH=1 pytest tests/benchmarks
+# Falla si un kernel tarda más que su baseline * (1 + BENCH_UMBRAL).
+# Para regenerar tests/benchmarks/baseline.json en la máquina de referencia:
+#   BENCH=1 BENCH_GUARDAR=1 pytest tests/benchmarks
+
+import json
+import math
+import os
+import time
+import warnings
+import pytest
+
+BENCH_ACTIVO = os.environ.get("BENCH", "0") == "1"
+BENCH_GUARDAR = os.environ.get("BENCH_GUARDAR", "0") == "1"
+BENCH_UMBRAL = float(os.environ.get("BENCH_UMBRAL", "0.50"))
+BENCH_RONDA_SEGUNDOS = float(os.environ.get("BENCH_RONDA_SEGUNDOS", "0.05"))
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+_medidos = {}
+
+
+def _cargar_baseline():
+    try:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class Medidor:
+    def __init__(self, nombre, baseline):
+        self.nombre = nombre
+        self.baseline = baseline
+
+    def __call__(self, funcion, *args, repeticiones=5, **kwargs):
+        """
+        Corre `funcion` una vez de calentamiento y luego `repeticiones` rondas.
+        Los kernels rápidos se repiten dentro de cada ronda hasta sumar
+        BENCH_RONDA_SEGUNDOS, para que el timer no mida ruido. Se toma la
+        mejor ronda (la menos afectada por el resto del sistema) y se compara
+        con el baseline. Devuelve el resultado de la última llamada.
+        """
+        inicio = time.perf_counter()
+        resultado = funcion(*args, **kwargs)
+        primera = time.perf_counter() - inicio
+        llamadas = max(1, math.ceil(BENCH_RONDA_SEGUNDOS / max(primera, 1e-9)))
+
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            for _ in range(llamadas):
+                resultado = funcion(*args, **kwargs)
+            tiempos.append((time.perf_counter() - inicio) / llamadas)
+        mejor = min(tiempos)
+        _medidos[self.nombre] = mejor
+
+        referencia = self.baseline.get(self.nombre)
+        if referencia is None:
+            warnings.warn(f"Benchmark '{self.nombre}' sin baseline ({mejor:.4f} s)")
+        elif not BENCH_GUARDAR:
+            limite = referencia * (1 + BENCH_UMBRAL)
+            assert mejor <= limite, (
+                f"Regresión en '{self.nombre}': {mejor:.6f} s > {limite:.6f} s "
+                f"(baseline {referencia:.6f} s + {BENCH_UMBRAL:.0%})"
+            )
+        return resultado
+
+
+@pytest.fixture
+def bench(request):
+    if not BENCH_ACTIVO:
+        pytest.skip("Benchmarks desactivados (correr con BENCH=1)")
+    return Medidor(request.node.name, _cargar_baseline())
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if BENCH_ACTIVO and BENCH_GUARDAR and _medidos:
+        baseline = _cargar_baseline()
+        baseline.update({nombre: round(t, 6) for nombre, t in _medidos.items()})
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(baseline.items())), f, indent=2)
+            f.write("\n")
@@ -0,0 +1,87 @@
+# para ejecutar los benchmarks, donde está el archivo main.py, hacemos:
+# BENCH=1 pytest tests/benchmarks
+
+import glob
+import os
+import numpy as np
+import pytest
+
+
+# --- TP1: filtrado EEG ---
+def test_tp1_filtro_pasa_bajos(bench):
+    from services.tp1.inciso_1 import cargar_senal, cutoff, fs
+    from services.tp1.pipeline import filtro_pasa_bajos
+    senal = cargar_senal("Signal_1.txt")
+    bench(filtro_pasa_bajos, senal, cutoff, fs)
+
+
+def test_tp1_carga_senales_filtradas(bench):
+    from services.tp1.inciso_1 import cargar_senales_filtradas
+    bench(cargar_senales_filtradas)
+
+
+# --- TP2: esteganografía ---
+def test_tp2_lsb_ocultar_extraer(bench, tmp_path, monkeypatch):
+    from services.tp2 import inciso_1
+    monkeypatch.setattr(inciso_1, "IMAGEN_ESTEGANOGRAFICA_PATH", str(tmp_path / "estego.png"))
+    mensaje = "Análisis Numérico " * 200
+
+    def ida_y_vuelta():
+        inciso_1.ocultar_mensaje_en_imagen(mensaje)
+        return inciso_1.extraer_mensaje_de_imagen()
+
+    assert mensaje in bench(ida_y_vuelta)
+
+
+def test_tp2_tf2d_ocultar_extraer(bench, tmp_path, monkeypatch):
+    from services.tp2 import inciso_3
+    monkeypatch.setattr(inciso_3, "ESTEGO_PATH", str(tmp_path / "estego.png"))
+    rng = np.random.default_rng(0)
+    portadora = rng.integers(0, 256, (256, 256)).astype(np.float64)
+    oculta = rng.integers(0, 256, (32, 32)).astype(np.float64)
+
+    def ida_y_vuelta():
+        estego = inciso_3.ocultar(portadora, oculta, 50.0, 3)
+        return inciso_3.extraer(estego.astype(np.float64), 50.0, 3, oculta.shape)
+
+    recuperada = bench(ida_y_vuelta, repeticiones=3)
+    assert recuperada.shape == oculta.shape
+
+
+# --- TP3: raíces ---
+def test_tp3_metodos_raices(bench):
+    from services.tp3.raices import ejecutar_metodos_con_comparacion
+    bench(ejecutar_metodos_con_comparacion)
+
+
+def test_tp3_gases_vdw(bench):
+    from services.tp3.gases import ejecutar_metodos_con_comparacion
+    bench(ejecutar_metodos_con_comparacion, 0.001, 0.05, 1e-6, 50, 0.5e6, 200.0)
+
+
+# --- TP4: procesamiento de un frame ---
+def test_tp4_procesar_frame(bench):
+    from services.tp4 import core
+    path = sorted(glob.glob(os.path.join(core.RUTA_IMAGENES, core.PATRON)))[59]
+    fila, _ = bench(core.procesar_frame, 60, path, repeticiones=10)
+    assert fila is not None
+
+
+# --- TP5: solvers de EDO ---
+@pytest.mark.parametrize("solver", ["taylor3_solver", "abm4_solver"])
+def test_tp5_solver_edo(bench, solver):
+    from services.tp5 import numerical
+    bench(getattr(numerical, solver), 0.0, 0.006, [1.5e-4, 0.0], 1e-4)
+
+
+# --- TP6: kernels de diferencias finitas ---
+@pytest.mark.parametrize("inciso", ["a", "c", "d", "e"])
+def test_tp6_fdm(bench, inciso):
+    from importlib import import_module
+    modulo = import_module(f"services.tp6.service_inciso_{inciso}")
+    bench(getattr(modulo, f"_run_{inciso}"))
+
+
+def test_tp6_fdm_richards_no_lineal(bench):
+    from services.tp6.service_inciso_b import run_fdm
+    bench(run_fdm, repeticiones=1)
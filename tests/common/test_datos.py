@@ -0,0 +1,59 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/common/test_datos.py
+
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from services.common.datos import TIPO_BINARIO, desempaquetar, empaquetar, respuesta_datos
+
+app = FastAPI()
+
+
+@app.get("/grafico/datos")
+def datos(request: Request):
+    t = np.linspace(0, 1, 5)
+    campo = np.arange(6.0).reshape(2, 3)
+    campo[1, 2] = np.nan
+    return respuesta_datos(request, {"t": t, "campo": campo}, {"titulo": "Prueba", "unidades": {"t": "s"}})
+
+
+client = TestClient(app)
+
+
+def test_empaquetar_ida_y_vuelta_alineado():
+    series = {"a": np.arange(3), "b": np.ones((2, 5)) * 0.5}
+    datos = empaquetar(series, {"fs": 173.61})
+
+    meta, leidas = desempaquetar(datos)
+
+    assert meta == {"fs": 173.61}
+    assert leidas["a"].dtype == np.float32 and leidas["b"].shape == (2, 5)
+    np.testing.assert_array_equal(leidas["a"], [0, 1, 2])
+    np.testing.assert_array_equal(leidas["b"], 0.5)
+    # Todos los arrays empiezan en un múltiplo de 4 (Float32Array del lado del cliente)
+    assert (len(datos) - sum(a.nbytes for a in leidas.values())) % 4 == 0
+
+
+def test_json_por_defecto_con_nan_como_null():
+    r = client.get("/grafico/datos")
+
+    assert r.headers["content-type"] == "application/json"
+    assert r.headers["vary"] == "Accept"
+    cuerpo = r.json()
+    assert cuerpo["titulo"] == "Prueba"
+    assert cuerpo["series"]["t"] == [0.0, 0.25, 0.5, 0.75, 1.0]
+    assert cuerpo["series"]["campo"] == [[0.0, 1.0, 2.0], [3.0, 4.0, None]]
+
+
+def test_binario_si_el_cliente_lo_prefiere():
+    r = client.get("/grafico/datos", headers={"Accept": f"{TIPO_BINARIO}, application/json;q=0.5"})
+
+    assert r.headers["content-type"] == TIPO_BINARIO
+    meta, series = desempaquetar(r.content)
+    assert meta["unidades"] == {"t": "s"}
+    assert series["campo"].shape == (2, 3) and np.isnan(series["campo"][1, 2])
+
+    # Si JSON tiene más prioridad, gana JSON
+    r = client.get("/grafico/datos", headers={"Accept": f"{TIPO_BINARIO};q=0.2, application/json"})
+    assert r.headers["content-type"] == "application/json"
@@ -0,0 +1,54 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/common/test_decimacion.py
+
+import io
+
+import numpy as np
+from PIL import Image
+
+from services.common.decimacion import graficar, indices_minmax, reducir
+from services.common.graficos import nueva_figura, figura_a_png
+
+
+def test_conserva_extremos_de_cada_tramo():
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=10_001)
+    y[1234] = 50.0
+    y[8765] = -50.0
+
+    indices = indices_minmax(y, 100)
+
+    assert len(indices) <= 2 * 100 + 2
+    assert np.all(np.diff(indices) > 0)
+    assert {0, 1234, 8765, 10_000} <= set(indices.tolist())
+    k = -(-len(y) // 100)
+    for inicio in range(0, len(y), k):
+        tramo = y[inicio:inicio + k]
+        assert tramo.max() in y[indices] and tramo.min() in y[indices]
+
+
+def test_serie_corta_no_se_toca():
+    x = np.arange(50.0)
+    y = np.sin(x)
+    xr, yr = reducir(x, y, 100)
+    assert xr is x and yr is y
+
+
+def _png(y, reducida):
+    fig, ax = nueva_figura(figsize=(6, 2), dpi=100)
+    t = np.arange(len(y))
+    if reducida:
+        graficar(ax, t, y, color="black", linewidth=1.0)
+    else:
+        ax.plot(t, y, color="black", linewidth=1.0)
+    return np.asarray(Image.open(io.BytesIO(figura_a_png(fig).getvalue())).convert("L"), dtype=float)
+
+
+def test_imagen_practicamente_igual():
+    rng = np.random.default_rng(1)
+    y = np.cumsum(rng.normal(size=200_000))
+
+    original, reducida = _png(y, False), _png(y, True)
+
+    # Solo cambia el antialiasing de algún borde
+    assert np.mean(np.abs(original - reducida) > 64) < 0.01
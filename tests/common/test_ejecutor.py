@@ -0,0 +1,91 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/common/test_ejecutor.py
+
+import asyncio
+import os
+import time
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.common import errores
+from services.common import ejecutor
+
+
+def _lento(segundos):
+    time.sleep(segundos)
+    return segundos
+
+
+def test_ejecutar_coalesce_requests_con_la_misma_clave():
+    async def escenario():
+        tareas = [asyncio.create_task(ejecutor.ejecutar(_lento, 0.3, clave="test.lento")) for _ in range(4)]
+        # Mientras corre hay un solo trabajo registrado para esa clave
+        await asyncio.sleep(0.05)
+        assert list(ejecutor._en_curso) == ["test.lento"]
+        return await asyncio.gather(*tareas)
+
+    assert asyncio.run(escenario()) == [0.3] * 4
+    assert "test.lento" not in ejecutor._en_curso
+
+
+def test_ejecutar_avisa_si_vence_el_timeout():
+    async def escenario():
+        with pytest.raises(ejecutor.TrabajoDemorado):
+            await ejecutor.ejecutar(_lento, 1.0, clave="test.timeout", timeout=0.1)
+
+    asyncio.run(escenario())
+
+
+def test_errores_del_ejecutor_se_responden_como_504_y_500():
+    app = FastAPI()
+    errores.registrar(app)
+
+    @app.get("/demorado")
+    def demorado():
+        raise ejecutor.TrabajoDemorado("sigue en curso")
+
+    @app.get("/interrumpido")
+    def interrumpido():
+        raise ejecutor.PoolInterrumpido("se interrumpió")
+
+    client = TestClient(app)
+    r = client.get("/demorado")
+    assert (r.status_code, r.json()) == (504, {"detail": "sigue en curso"})
+    assert client.get("/interrumpido").status_code == 500
+
+
+class _PoolFalso:
+    def __init__(self):
+        self.apagados = 0
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.apagados += 1
+
+
+def test_pool_roto_se_reinicia_una_sola_vez(monkeypatch):
+    roto, nuevo = _PoolFalso(), _PoolFalso()
+    monkeypatch.setattr(ejecutor, "_pool", roto)
+    monkeypatch.setattr(ejecutor, "_en_curso", {"viejo": ejecutor._Trabajo(None, roto)})
+
+    # Todas las requests que esperaban en el pool roto intentan reiniciarlo
+    ejecutor._reiniciar_pool(roto)
+    assert ejecutor._pool is None and ejecutor._en_curso == {}
+    ejecutor._pool = nuevo
+    ejecutor._en_curso["actual"] = ejecutor._Trabajo(None, nuevo)
+    ejecutor._reiniciar_pool(roto)
+    ejecutor._reiniciar_pool(roto)
+
+    assert roto.apagados == 1
+    assert nuevo.apagados == 0
+    assert ejecutor._pool is nuevo and list(ejecutor._en_curso) == ["actual"]
+
+
+def test_hilos_por_proceso_se_reparten_dentro_del_pool():
+    cpus = os.cpu_count() or 1
+    assert ejecutor.hilos_por_proceso() == cpus
+
+    async def escenario():
+        return await ejecutor.ejecutar(ejecutor.hilos_por_proceso, clave="test.hilos")
+
+    # En cada proceso del pool le tocan los CPUs divididos por la cantidad de procesos
+    assert asyncio.run(escenario()) == max(1, cpus // ejecutor.JOBS_MAX_WORKERS)
@@ -0,0 +1,24 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/common/test_graficos.py
+
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from services.common.graficos import nueva_figura, figura_a_png
+
+
+def _render(i):
+    fig, axs = nueva_figura(2, 1, figsize=(4, 3))
+    x = np.linspace(0, 1, 200)
+    axs[0].plot(x, np.sin(2 * np.pi * (i % 3 + 1) * x))
+    axs[1].set_title(f"Panel {i % 3}")
+    fig.tight_layout()
+    return figura_a_png(fig).getvalue()
+
+
+def test_render_concurrente_igual_al_secuencial():
+    secuencial = [_render(i) for i in range(12)]
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        concurrente = list(pool.map(_render, range(12)))
+
+    assert concurrente == secuencial
+    assert all(png.startswith(b"\x89PNG") for png in concurrente)
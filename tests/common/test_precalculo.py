@@ -0,0 +1,40 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/common/test_precalculo.py
+
+import threading
+import time
+from fastapi.testclient import TestClient
+from starlette.concurrency import run_in_threadpool
+from main import app
+from services.common import precalculo
+
+
+def test_responde_503_con_retry_after_hasta_terminar_el_precalculo(monkeypatch):
+    liberar = threading.Event()
+
+    async def lento():
+        await run_in_threadpool(liberar.wait, 10)
+
+    monkeypatch.setattr(precalculo, "SUBSISTEMAS", {"tp1.inciso_3": lento})
+    monkeypatch.setattr(precalculo, "_estado", {n: {"estado": precalculo.PENDIENTE} for n in precalculo._estado})
+
+    with TestClient(app) as client:
+        response = client.get("/api/tp1/inciso-3/grafico1")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == str(precalculo.PRECALCULO_RETRY_AFTER)
+
+        response = client.get("/api/estado/listo")
+        assert response.status_code == 503
+        assert response.json()["subsistemas"]["tp1.inciso_3"]["estado"] == precalculo.CALENTANDO
+
+        # Los endpoints de texto no dependen del precálculo
+        assert client.get("/api/tp1/inciso-3/consigna").status_code == 200
+
+        liberar.set()
+        for _ in range(100):
+            if client.get("/api/estado/listo").status_code == 200:
+                break
+            time.sleep(0.05)
+
+        assert precalculo.estado()["tp1.inciso_3"]["estado"] == precalculo.LISTO
+        assert client.get("/api/tp1/inciso-3/grafico1").status_code == 200
@@ -0,0 +1,99 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/common/test_render_cache.py
+
+import io
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+from services.common import render_cache
+from services.common.render_cache import cache_png
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def cache_temporal(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_cache, "RENDER_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(render_cache, "_bytes_disco", None)
+    render_cache.invalidar()
+    yield
+    render_cache.invalidar()
+
+
+def test_cache_png_reutiliza_render_y_detecta_cambios_en_entradas(tmp_path):
+    entrada = tmp_path / "datos.txt"
+    entrada.write_text("1\n2\n")
+    llamadas = []
+
+    @cache_png(entradas=(str(entrada),))
+    def grafico(n):
+        llamadas.append(n)
+        return io.BytesIO(b"png-%d" % len(llamadas))
+
+    primero = grafico(1)
+    segundo = grafico(1)
+    assert len(llamadas) == 1
+    assert primero.getvalue() == segundo.getvalue()
+    assert primero.etag == segundo.etag
+
+    # Otros parámetros -> otra clave
+    grafico(2)
+    assert len(llamadas) == 2
+
+    # El nivel en disco sobrevive a vaciar la memoria
+    render_cache.invalidar()
+    assert grafico(1).getvalue() == primero.getvalue()
+    assert len(llamadas) == 2
+
+    # Si el archivo de entrada cambia, se vuelve a renderizar
+    entrada.write_text("1\n2\n3\n")
+    tercero = grafico(1)
+    assert len(llamadas) == 3
+    assert tercero.etag != primero.etag
+
+
+def test_disco_con_tope_borra_los_menos_usados(tmp_path, monkeypatch):
+    # Tope de 3 KB con PNG de 1 KB: al pasarlo quedan los 2 usados más recientemente
+    monkeypatch.setattr(render_cache, "RENDER_CACHE_DISCO_MAX_MB", 3 / 1024)
+
+    @cache_png()
+    def grafico(n):
+        return io.BytesIO(bytes([n]) * 1024)
+
+    for n in range(3):
+        grafico(n)
+    render_cache.invalidar()
+    grafico(0)  # leído del disco: pasa a ser el más reciente
+    grafico(3)
+
+    en_disco = sorted(p.read_bytes()[0] for p in tmp_path.glob("*/*.png"))
+    assert en_disco == [0, 3]
+
+
+def test_version_de_codigo_incluye_los_imports_del_paquete(tmp_path, monkeypatch):
+    paquete = tmp_path / "paquete_prueba"
+    (paquete / "sub").mkdir(parents=True)
+    (paquete / "grafico.py").write_text("from .sub import calculo\n")
+    (paquete / "sub" / "calculo.py").write_text("def f():\n    from paquete_prueba import constantes\n")
+    (paquete / "constantes.py").write_text("A = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(render_cache, "_versiones_codigo", {})
+    monkeypatch.setattr(render_cache, "_modulos_analizados", {})
+    antes = render_cache.version_codigo(("paquete_prueba.grafico",))
+
+    # Un cambio en un módulo importado indirectamente (y de forma diferida) cambia la versión
+    (paquete / "constantes.py").write_text("A = 2\n")
+    render_cache._versiones_codigo.clear()
+    render_cache._modulos_analizados.clear()
+
+    assert render_cache.version_codigo(("paquete_prueba.grafico",)) != antes
+
+def test_grafico_responde_304_con_if_none_match():
+    response = client.get("/api/tp3/gases/grafico-f-vdw")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    etag = response.headers["etag"]
+
+    response = client.get("/api/tp3/gases/grafico-f-vdw", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
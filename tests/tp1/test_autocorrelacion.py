@@ -0,0 +1,33 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp1/test_autocorrelacion.py
+
+import numpy as np
+from fastapi.testclient import TestClient
+from main import app
+from services.tp1.autocorrelacion import autocorrelacion
+
+client = TestClient(app)
+
+
+def test_equivale_a_np_correlate_truncada_y_por_lotes():
+    x = np.random.default_rng(0).standard_normal((3, 1000))
+    r = autocorrelacion(x, max_lag=250)
+    assert r.shape == (3, 251)
+    for fila, senal in zip(r, x):
+        completa = np.correlate(senal, senal, mode="full")
+        esperado = completa[len(completa) // 2:] / np.max(completa)
+        np.testing.assert_allclose(fila, esperado[:251], atol=1e-12)
+
+    # Sin max_lag devuelve todos los retardos; sin normalizar, r[0] es la energía
+    sin_normalizar = autocorrelacion(x[0], normalizar=False)
+    assert sin_normalizar.shape == (1000,)
+    assert np.isclose(sin_normalizar[0], np.sum(x[0] ** 2))
+
+
+def test_endpoint_json():
+    r = client.get("/api/tp1/inciso-4/autocorrelacion", params={"max_lag": 1})
+    assert r.status_code == 200
+    cuerpo = r.json()
+    assert len(cuerpo["senales"]) == 3
+    assert cuerpo["retardos"][-1] >= 1 and len(cuerpo["retardos"]) == len(cuerpo["senales"][0]["coeficientes"])
+    assert cuerpo["senales"][1]["coeficientes"][0] == 1.0
@@ -0,0 +1,76 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp1/test_espectrograma.py
+
+import json
+import tracemalloc
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from scipy.signal import welch
+from main import app
+from services.tp1 import espectrograma, monitoreo
+from services.tp1.filtros import aplicar_kernel
+from services.tp1.pipeline import SENALES, kernel_pasa_bajos, pipeline
+
+client = TestClient(app)
+FS = 173.61
+
+
+def test_ventanas_por_bloques_equivalen_al_array_y_a_welch():
+    x = np.random.default_rng(0).standard_normal(5000)
+    filas = list(espectrograma.potencias_por_ventana(x, FS, ventana=2.0, solapamiento=0.5))
+    por_bloques = list(espectrograma.potencias_por_ventana(np.array_split(x, 37), FS, ventana=2.0, solapamiento=0.5))
+    assert filas == por_bloques
+
+    n, paso = espectrograma.validar_ventana(FS, 2.0, 0.5)
+    assert len(filas) == (len(x) - n) // paso + 1
+    f, p = welch(x[paso:paso + n], FS, nperseg=n)
+    esperado = np.sum(p[(f >= 8) & (f <= 13)]) * (f[1] - f[0])
+    assert np.isclose(filas[1]["Alfa"], esperado)
+    assert set(espectrograma.BANDAS_EEG) <= set(filas[0])
+
+
+def test_memoria_constante_con_grabaciones_largas():
+    def grabacion(segundos):
+        rng = np.random.default_rng(1)
+        for _ in range(int(segundos * FS) // 4096):
+            yield rng.standard_normal(4096)
+
+    def pico(segundos):
+        tracemalloc.start()
+        for _ in espectrograma.potencias_por_ventana(grabacion(segundos), FS, ventana=4.0):
+            pass
+        _, maximo = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return maximo
+
+    # 10 minutos vs 2 horas: el pico de memoria no crece con la duración
+    assert pico(7200) < 1.5 * pico(600)
+
+
+
+def test_filtrada_por_bloques_igual_a_filtrar_entera():
+    x = np.random.default_rng(2).standard_normal(10_000)
+    h = kernel_pasa_bajos(40, FS, 301)
+
+    por_bloques = list(monitoreo.filtrar_por_bloques(espectrograma.bloques(x, 777), h))
+
+    assert max(len(b) for b in por_bloques) <= 777
+    np.testing.assert_allclose(np.concatenate(por_bloques), aplicar_kernel(x, h), atol=1e-10)
+
+    # El endpoint con filtrada=true da lo mismo que sobre la señal filtrada entera
+    r = client.get("/api/tp1/espectrograma/bandas", params={"senal": 2, "ventana": 4, "filtrada": True})
+    lineas = [json.loads(l) for l in r.text.splitlines()][:-1]
+    esperadas = list(espectrograma.potencias_por_ventana(pipeline.filtrada(SENALES[1]), FS, ventana=4.0))
+    assert len(lineas) == len(esperadas)
+    for linea, esperada in zip(lineas, esperadas):
+        assert linea["Alfa"] == pytest.approx(esperada["Alfa"], rel=1e-9)
+
+def test_endpoint_ndjson():
+    r = client.get("/api/tp1/espectrograma/bandas", params={"senal": 3, "ventana": 4, "solapamiento": 0.75})
+    assert r.status_code == 200 and r.headers["content-type"] == "application/x-ndjson"
+    lineas = [json.loads(l) for l in r.text.splitlines()]
+    assert lineas[-1]["fin"] and lineas[-1]["ventanas"] == len(lineas) - 1
+    assert lineas[0]["t_inicio"] == 0 and "Gamma" in lineas[0]
+
+    assert client.get("/api/tp1/espectrograma/bandas", params={"ventana": 0.01}).status_code == 400
@@ -0,0 +1,55 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp1/test_filtros.py
+
+import numpy as np
+from fastapi.testclient import TestClient
+from scipy.signal import freqz
+from main import app
+from services.tp1 import filtros
+from services.tp1.pipeline import pipeline
+
+client = TestClient(app)
+
+
+def test_banco_reusa_kernels_y_fft_equivale_a_directa(monkeypatch):
+    h = filtros.banco.kernel("pasa_banda", (8, 13), 1001, "hann", 173.61)
+    assert filtros.banco.kernel("pasa_banda", [8.0, 13.0], 1001, "hann", 173.61) is h
+    f, respuesta = freqz(h, worN=[10.5, 40.0], fs=173.61)
+    assert abs(abs(respuesta[0]) - 1) < 1e-2 and abs(respuesta[1]) < 1e-3
+
+    x = np.random.default_rng(0).standard_normal(5000)
+    por_fft = filtros.aplicar_kernel(x, h)
+    monkeypatch.setattr(filtros, "TP1_FFT_TAPS", 10**6)
+    np.testing.assert_allclose(por_fft, filtros.aplicar_kernel(x, h), atol=1e-10)
+
+
+
+def test_senal_mas_corta_que_el_kernel_conserva_el_largo(monkeypatch):
+    h = filtros.banco.kernel("pasa_bajos", 30, 301, "hamming", 173.61)
+    x = np.random.default_rng(1).standard_normal(100)
+    esperado = np.convolve(x, h, mode="full")[150:250]
+    monkeypatch.setattr(filtros, "TP1_FFT_TAPS", 10**6)
+
+    np.testing.assert_allclose(filtros.aplicar_kernel(x, h), esperado, atol=1e-10)
+
+def test_datos_json_y_grafico_png():
+    r = client.get("/api/tp1/filtros/datos", params={"senal": 2, "tipo": "pasa_altos", "corte": 1, "taps": 101})
+    assert r.status_code == 200
+    cuerpo = r.json()
+    assert cuerpo["etapa"] == "Registro interictal" and cuerpo["metodo"] == "directo"
+    assert len(cuerpo["filtrada"]) == len(pipeline.senal("Signal_2.txt"))
+
+    r = client.get("/api/tp1/filtros/grafico", params={"tipo": "pasa_banda", "bajo": 8, "alto": 13, "taps": 1001})
+    assert r.status_code == 200 and r.headers["content-type"] == "image/png"
+
+
+def test_parametros_invalidos_400():
+    casos = [
+        {"tipo": "pasa_banda", "bajo": 8},
+        {"tipo": "pasa_bajos", "corte": 100},
+        {"tipo": "pasa_altos", "taps": 100},
+        {"tipo": "pasa_banda", "bajo": 13, "alto": 8},
+    ]
+    for params in casos:
+        assert client.get("/api/tp1/filtros/datos", params=params).status_code == 400
+    assert client.get("/api/tp1/filtros/datos", params={"ventana": "kaiser"}).status_code == 422
@@ -0,0 +1,63 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp1/test_monitoreo.py
+
+import json
+import numpy as np
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+from main import app
+from services.tp1 import espectrograma
+from services.tp1.monitoreo import FiltroFIRStreaming, MonitorEEG
+from services.tp1.pipeline import kernel_pasa_bajos, pipeline
+
+client = TestClient(app)
+FS = 173.61
+
+
+def test_streaming_por_bloques_equivale_al_calculo_completo():
+    x = np.asarray(pipeline.senal("Signal_1.txt"), dtype=float)
+    h = kernel_pasa_bajos(40.0, FS)
+    rng = np.random.default_rng(0)
+    cortes = np.cumsum(rng.integers(1, 500, 40))
+    bloques = np.split(x, cortes[cortes < len(x)])
+
+    filtro = FiltroFIRStreaming(h)
+    causal = np.concatenate([filtro.procesar(b) for b in bloques])
+    np.testing.assert_allclose(causal, np.convolve(x, h)[:len(x)], atol=1e-9)
+
+    monitor = MonitorEEG(FS, ventana=2.0, solapamiento=0.5)
+    resultados = [r for b in bloques for r in monitor.procesar(b)]
+    esperado = list(espectrograma.potencias_por_ventana(causal, FS, ventana=2.0, solapamiento=0.5))
+    assert len(resultados) == len(esperado)
+    for r, e in zip(resultados, esperado):
+        assert np.isclose(r["potencias"]["Alfa"], e["Alfa"]) and np.isclose(r["t_fin"], e["t_fin"])
+
+
+def test_websocket_binario_y_json():
+    x = np.asarray(pipeline.senal("Signal_3.txt"), dtype=np.float32)
+    with client.websocket_connect("/api/tp1/monitoreo/ws?ventana=2&solapamiento=0.5") as ws:
+        configuracion = ws.receive_json()["configuracion"]
+        assert configuracion["paso"] == 174
+
+        ws.send_bytes(x[:400].tobytes())
+        primera = ws.receive_json()
+        assert primera["ventana"] == 0 and primera["etapa"] == "convulsivo"
+        assert 0 <= primera["latencia_ms"] < 1000
+
+        ws.send_text(json.dumps({"muestras": x[400:600].tolist()}))
+        assert ws.receive_json()["ventana"] == 1
+
+        ws.send_bytes(b"123")
+        assert "error" in ws.receive_json()
+
+
+def test_websocket_parametros_invalidos():
+    with client.websocket_connect("/api/tp1/monitoreo/ws?cutoff=100") as ws:
+        assert "error" in ws.receive_json()
+
+    # fs nula, negativa o no finita: se rechaza antes de aceptar la conexión
+    for fs in ("0", "-10", "inf", "nan"):
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect(f"/api/tp1/monitoreo/ws?fs={fs}"):
+                pass
@@ -0,0 +1,24 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp1/test_multicanal.py
+
+import numpy as np
+from scipy.integrate import trapezoid
+from services.tp1.inciso_3 import BANDAS
+from services.tp1.multicanal import integrar_bandas
+
+FS = 173.61
+
+
+def test_integrar_bandas_por_lotes_equivale_a_canal_por_canal():
+    senales = np.random.default_rng(0).integers(-300, 300, (3, 2000))
+    f = np.fft.rfftfreq(senales.shape[1], 1 / FS)
+    P = np.abs(np.fft.rfft(senales, axis=-1)) ** 2
+
+    potencias, total = integrar_bandas(f, P, BANDAS)
+
+    assert potencias.shape == (3, len(BANDAS)) and total.shape == (3,)
+    for canal, p in enumerate(P):
+        assert np.isclose(total[canal], trapezoid(p, f))
+        for banda, (low, high) in enumerate(BANDAS.values()):
+            mascara = (f >= low) & (f <= high)
+            assert np.isclose(potencias[canal, banda], trapezoid(p[mascara], f[mascara]))
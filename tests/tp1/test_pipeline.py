@@ -0,0 +1,97 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp1/test_pipeline.py
+
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+import pytest
+from scipy.fft import fft, fftfreq
+from services.tp1 import pipeline as modulo, senales
+from services.tp1.pipeline import PipelineEEG, filtro_pasa_bajos
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    rng = np.random.default_rng(0)
+    for nombre in modulo.SENALES:
+        np.savetxt(tmp_path / nombre, rng.integers(-200, 200, 1001), fmt="%d")
+    monkeypatch.setattr(modulo, "DATA_PATH", str(tmp_path))
+    monkeypatch.setattr(senales, "TP1_SENALES_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(senales.repositorio, "_abiertas", {})
+    p = PipelineEEG()
+    monkeypatch.setattr(p, "_etapas", OrderedDict())
+    monkeypatch.setattr(p, "_calculando", {})
+    return p
+
+
+def test_etapas_equivalen_al_calculo_directo_y_se_reusan(pipeline):
+    x = filtro_pasa_bajos(np.asarray(pipeline.senal("Signal_1.txt"), dtype=float), 40.0, senales.FS)
+    filtrada = pipeline.filtrada("Signal_1.txt")
+    np.testing.assert_array_equal(filtrada, x)
+    assert pipeline.filtrada("Signal_1.txt") is filtrada
+    assert not filtrada.flags.writeable
+
+    f, p = pipeline.potencia("Signal_1.txt")
+    np.testing.assert_array_equal(f, fftfreq(len(x), 1 / senales.FS))
+    np.testing.assert_allclose(p, np.abs(fft(x)) ** 2, rtol=1e-9)
+
+    xf, mag = pipeline.magnitud("Signal_1.txt")
+    np.testing.assert_allclose(mag, 2.0 / len(x) * np.abs(fft(x)[:len(x) // 2]), rtol=1e-9)
+
+    bandas = pipeline.potencias_banda("Signal_1.txt", {"Alfa": (8, 13)})
+    assert bandas["Alfa"] == pytest.approx(np.sum(p[(f >= 8) & (f <= 13)]))
+
+    # Otro cutoff es otra entrada de la caché
+    assert pipeline.filtrada("Signal_1.txt", cutoff=20.0) is not filtrada
+
+
+def test_recalcula_si_cambia_la_senal(pipeline):
+    antes = pipeline.filtrada("Signal_2.txt")
+    ruta = os.path.join(modulo.DATA_PATH, "Signal_2.txt")
+    np.savetxt(ruta, np.arange(500), fmt="%d")
+    os.utime(ruta, ns=(0, 10**18))
+    despues = pipeline.filtrada("Signal_2.txt")
+    assert len(despues) == 500 and despues is not antes
+
+
+def test_etapas_acotadas_y_olvidar_una_senal(pipeline, monkeypatch):
+    monkeypatch.setattr(modulo, "TP1_ETAPAS_MAX", 3)
+    primera = pipeline.filtrada("Signal_1.txt", cutoff=10.0)
+    for cutoff in (20.0, 30.0, 40.0):
+        pipeline.filtrada("Signal_1.txt", cutoff=cutoff)
+    assert len(pipeline._etapas) == 3
+    # La menos usada salió del LRU: se vuelve a calcular
+    assert pipeline.filtrada("Signal_1.txt", cutoff=10.0) is not primera
+
+    pipeline.filtrada("Signal_2.txt")
+    pipeline.olvidar("Signal_1.txt")
+    assert [clave[1] for clave in pipeline._etapas] == ["Signal_2.txt"]
+
+
+def test_calculo_fuera_del_lock_y_coalescido(pipeline):
+    liberar = threading.Event()
+    llamadas = []
+
+    def lento():
+        llamadas.append(1)
+        liberar.wait(5)
+        return "lenta"
+
+    hilos = [threading.Thread(target=pipeline._etapa, args=("lenta", "Signal_1.txt", 1.0, 3, lento)) for _ in range(3)]
+    for hilo in hilos:
+        hilo.start()
+    while not llamadas:
+        liberar.wait(0.01)
+    # Mientras la etapa lenta se calcula, el lock está libre y otra etapa no espera
+    assert pipeline._lock.acquire(timeout=1)
+    pipeline._lock.release()
+    filtrada = pipeline.filtrada("Signal_2.txt")
+    assert not liberar.is_set() and len(filtrada) == 1001
+
+    liberar.set()
+    for hilo in hilos:
+        hilo.join(5)
+    assert len(llamadas) == 1
+    assert pipeline._etapa("lenta", "Signal_1.txt", 1.0, 3, lento) == "lenta"
+    assert pipeline._calculando == {}
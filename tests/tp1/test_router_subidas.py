@@ -0,0 +1,87 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp1/test_router_subidas.py
+
+import json
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+from services.tp1 import senales, subidas
+
+client = TestClient(app)
+FS = 256.0
+
+
+@pytest.fixture(autouse=True)
+def directorios(tmp_path, monkeypatch):
+    monkeypatch.setattr(subidas, "TP1_SUBIDAS_DIR", str(tmp_path / "subidas"))
+    monkeypatch.setattr(senales, "TP1_SENALES_DIR", str(tmp_path / "senales"))
+
+
+@pytest.fixture
+def registro():
+    t = np.arange(int(60 * FS)) / FS
+    return (100 * np.sin(2 * np.pi * 10 * t) + 20 * np.sin(2 * np.pi * 2 * t)).astype(np.float32)
+
+
+def test_subida_en_los_tres_formatos_da_la_misma_senal(registro):
+    texto = "\n".join(f"{v:.9g}" for v in registro).encode()
+    csv = ("tiempo,canal\n" + "\n".join(f"{i},{v:.9g}" for i, v in enumerate(registro))).encode()
+    ids = []
+    for formato, cuerpo, columna in (("texto", texto, 0), ("csv", csv, 1), ("float32", registro.tobytes(), 0)):
+        r = client.post("/api/tp1/subidas", params={"formato": formato, "fs": FS, "columna": columna}, files={"archivo": ("registro", cuerpo)})
+        assert r.status_code == 200, r.text
+        meta = r.json()
+        assert meta["muestras"] == len(registro) and meta["duracion_s"] == pytest.approx(60)
+        ids.append(meta["id"])
+
+    espectros = [client.get(f"/api/tp1/subidas/{i}/espectro").json() for i in ids]
+    for e in espectros[1:]:
+        np.testing.assert_allclose(e["magnitud"], espectros[0]["magnitud"], rtol=1e-6, atol=1e-6)
+    f = np.array(espectros[0]["frecuencias"])
+    assert f[np.argmax(espectros[0]["magnitud"])] == pytest.approx(10, abs=0.05)
+
+    # El mismo contenido con los mismos parámetros es la misma subida
+    r = client.post("/api/tp1/subidas", params={"formato": "float32", "fs": FS}, files={"archivo": ("registro", registro.tobytes())})
+    assert r.json()["id"] == ids[2]
+
+
+def test_endpoints_aceptan_el_id(registro):
+    id_subida = client.post("/api/tp1/subidas", params={"formato": "float32", "fs": FS}, files={"archivo": ("registro", registro.tobytes())}).json()["id"]
+
+    bandas = client.get(f"/api/tp1/subidas/{id_subida}/bandas").json()["potencias"]
+    assert max(bandas, key=bandas.get) == "Alfa"
+
+    r = client.get("/api/tp1/filtros/datos", params={"id": id_subida, "tipo": "pasa_banda", "bajo": 8, "alto": 12, "taps": 257})
+    assert r.status_code == 200 and r.json()["fs"] == FS and len(r.json()["filtrada"]) == len(registro)
+
+    r = client.get("/api/tp1/espectrograma/bandas", params={"id": id_subida, "ventana": 4, "solapamiento": 0})
+    lineas = [json.loads(l) for l in r.text.splitlines()]
+    assert lineas[-1]["ventanas"] == 15
+
+    r = client.get("/api/tp1/inciso-4/autocorrelacion", params={"id": id_subida, "max_lag": 0.5})
+    assert [s["senal"] for s in r.json()["senales"]] == [id_subida]
+
+
+
+def test_subida_mas_corta_que_el_filtro(registro):
+    # 100 muestras con un FIR de 301 coeficientes: la salida tiene que tener el largo de la entrada
+    corta = registro[:100]
+    id_subida = client.post("/api/tp1/subidas", params={"formato": "float32", "fs": FS}, files={"archivo": ("registro", corta.tobytes())}).json()["id"]
+
+    r = client.get("/api/tp1/filtros/datos", params={"id": id_subida, "taps": 301})
+    assert r.status_code == 200 and len(r.json()["filtrada"]) == len(corta)
+
+    r = client.get("/api/tp1/filtros/grafico", params={"id": id_subida, "taps": 301})
+    assert r.status_code == 200 and r.headers["content-type"] == "image/png"
+
+    r = client.get(f"/api/tp1/subidas/{id_subida}/espectro", params={"taps": 301})
+    assert r.status_code == 200 and len(r.json()["frecuencias"]) == len(corta) // 2
+
+def test_errores():
+    assert client.post("/api/tp1/subidas", files={"archivo": ("registro", b"")}).status_code == 400
+    assert client.post("/api/tp1/subidas", files={"archivo": ("registro", b"1\nno es un numero\n")}).status_code == 400
+    assert client.post("/api/tp1/subidas", params={"formato": "float32"}, files={"archivo": ("registro", b"123")}).status_code == 400
+    assert client.post("/api/tp1/subidas", content=b"1\n2\n").status_code == 422
+    assert client.get("/api/tp1/subidas/0123456789abcdef0123").status_code == 404
+    assert client.get("/api/tp1/filtros/datos", params={"id": "../../etc"}).status_code == 404
@@ -0,0 +1,53 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp1/test_senales.py
+
+import os
+import numpy as np
+import pytest
+from services.tp1 import senales
+from services.tp1.senales import RepositorioSenales
+
+
+@pytest.fixture
+def repositorio(tmp_path, monkeypatch):
+    monkeypatch.setattr(senales, "TP1_SENALES_DIR", str(tmp_path / "cache"))
+    repo = RepositorioSenales()
+    monkeypatch.setattr(repo, "_abiertas", {})
+    return repo
+
+
+def test_convierte_una_vez_y_sirve_mmap_de_solo_lectura(tmp_path, repositorio):
+    ruta = tmp_path / "Signal_2.txt"
+    ruta.write_text("-12\n\n35\n  7 \n")
+
+    datos = repositorio.cargar(str(ruta))
+    assert isinstance(datos, np.memmap) and datos.dtype == np.float32
+    np.testing.assert_array_equal(datos, [-12, 35, 7])
+    assert not datos.flags.writeable
+    meta = repositorio.metadatos(str(ruta))
+    assert (meta["fs"], meta["etapa"], meta["muestras"]) == (senales.FS, "Registro interictal", 3)
+
+    # La segunda carga reutiliza la misma vista
+    assert repositorio.cargar(str(ruta)) is datos
+
+
+def test_reconvierte_si_cambia_el_texto(tmp_path, repositorio, monkeypatch):
+    ruta = tmp_path / "Signal_1.txt"
+    ruta.write_text("1\n2\n")
+    repositorio.cargar(str(ruta))
+
+    ruta.write_text("1\n2\n3\n4\n")
+    os.utime(ruta, ns=(0, 10**18))
+    np.testing.assert_array_equal(repositorio.cargar(str(ruta)), [1, 2, 3, 4])
+
+    # Otro proceso (caché en memoria vacía) abre el .npy ya convertido sin leer el texto
+    monkeypatch.setattr(repositorio, "_abiertas", {})
+    monkeypatch.setattr(senales, "_convertir", lambda *a: pytest.fail("no debía reconvertir"))
+    np.testing.assert_array_equal(repositorio.cargar(str(ruta)), [1, 2, 3, 4])
+
+
+def test_conversion_por_bloques(tmp_path, repositorio, monkeypatch):
+    monkeypatch.setattr(senales, "LINEAS_POR_BLOQUE", 7)
+    ruta = tmp_path / "Signal_3.txt"
+    ruta.write_text("\n".join(str(i) for i in range(100)) + "\n")
+    np.testing.assert_array_equal(repositorio.cargar(str(ruta)), np.arange(100))
@@ -0,0 +1,53 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp2/test_fft_estego.py
+
+import numpy as np
+import pytest
+
+from services.tp2 import inciso_2
+
+
+def _codificar_original(portadora, oculta, repeticiones, semilla, radio):
+    """El loop coeficiente por coeficiente del método original."""
+    bits_rep = np.repeat(np.unpackbits(oculta.flatten()), repeticiones)
+    posiciones = inciso_2.obtener_posiciones_validas(portadora.shape, radio, n=len(bits_rep), semilla=semilla)
+    portadora_f = np.fft.fft2(portadora)
+    for idx, bit in enumerate(bits_rep):
+        i, j, ci, cj = posiciones[idx]
+        val = portadora_f[i, j]
+        imag = abs(val.imag) if bit == 1 else -abs(val.imag)
+        portadora_f[i, j] = complex(val.real, imag)
+        portadora_f[ci, cj] = complex(val.real, -imag)
+    return np.clip(np.real(np.fft.ifft2(portadora_f)), 0, 255).astype(np.uint8)
+
+
+@pytest.fixture
+def imagenes():
+    rng = np.random.default_rng(0)
+    portadora = rng.integers(64, 192, (96, 80), dtype=np.uint8)
+    oculta = np.where(rng.random((8, 8)) > 0.5, 255, 0).astype(np.uint8)
+    return portadora, oculta
+
+
+def test_igual_al_metodo_original(imagenes):
+    portadora, oculta = imagenes
+
+    estego = inciso_2.codificar(portadora, oculta, 5, 3, 8)
+
+    np.testing.assert_array_equal(estego, _codificar_original(portadora, oculta, 5, 3, 8))
+
+
+def test_votacion_recupera_la_oculta(imagenes):
+    portadora, oculta = imagenes
+    estego = inciso_2.codificar(portadora, oculta, 5, 3, 8)
+
+    recuperada = inciso_2.decodificar(estego, oculta.shape, 5, 3, 8)
+
+    assert recuperada.shape == oculta.shape
+    assert np.mean(recuperada == oculta) > 0.95
+
+
+def test_oculta_que_no_entra(imagenes):
+    portadora, _ = imagenes
+    with pytest.raises(ValueError):
+        inciso_2.codificar(portadora, np.zeros((20, 20), dtype=np.uint8), 7, 0, 8)
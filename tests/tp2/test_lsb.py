@@ -0,0 +1,47 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp2/test_lsb.py
+
+import numpy as np
+import pytest
+
+from services.tp2 import lsb
+
+
+def _ocultar_original(imagen, mensaje: bytes):
+    """El loop bit a bit del método original (k = 1, escala de grises)."""
+    datos = imagen.flatten()
+    binario = "".join(format(c, "08b") for c in mensaje + b"&")
+    for i, bit in enumerate(binario):
+        datos[i] = (datos[i] & 0b11111110) | int(bit)
+    return datos.reshape(imagen.shape)
+
+
+def test_k1_igual_al_metodo_original():
+    imagen = np.random.default_rng(0).integers(0, 256, (64, 48), dtype=np.uint8)
+
+    estego = lsb.ocultar(imagen, b"Hola mundo")
+
+    np.testing.assert_array_equal(estego, _ocultar_original(imagen, b"Hola mundo"))
+    assert lsb.extraer(estego) == b"Hola mundo"
+
+
+@pytest.mark.parametrize("k", [1, 2, 3, 8])
+@pytest.mark.parametrize("canales", [None, (0, 1, 2), (2,)])
+def test_ida_y_vuelta_a_capacidad_maxima(k, canales):
+    rng = np.random.default_rng(k)
+    imagen = rng.integers(0, 256, (40, 30, 4), dtype=np.uint8)
+    mensaje = rng.integers(0, 256, lsb.capacidad(imagen.shape, k, canales) - 1, dtype=np.uint8).tobytes()
+    mensaje = mensaje.replace(lsb.DELIMITADOR, b"x")
+
+    estego = lsb.ocultar(imagen, mensaje, k, canales)
+
+    assert lsb.extraer(estego, k, canales) == mensaje
+    assert np.abs(estego.astype(int) - imagen).max() < 2 ** k
+    if canales == (2,):
+        np.testing.assert_array_equal(np.delete(estego, 2, axis=-1), np.delete(imagen, 2, axis=-1))
+
+
+def test_mensaje_demasiado_largo():
+    imagen = np.zeros((8, 8), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        lsb.ocultar(imagen, b"x" * 8)
@@ -0,0 +1,42 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp2/test_posiciones.py
+
+import numpy as np
+import pytest
+
+from services.tp2 import posiciones
+
+
+def _posiciones_original(shape, radio_exclusion, n, semilla):
+    """El loop con set del método original."""
+    h, w = shape
+    Y, X = np.meshgrid(np.arange(h), np.arange(w), indexing="ij")
+    dist = np.sqrt((Y - h // 2) ** 2 + (X - w // 2) ** 2)
+    lista = []
+    usados = set()
+    for i, j in np.argwhere(dist > radio_exclusion):
+        ci, cj = (-i) % h, (-j) % w
+        if (ci, cj) not in usados and (i, j) not in usados and (i, j) < (ci, cj):
+            lista.append((i, j, ci, cj))
+            usados.add((i, j))
+            usados.add((ci, cj))
+    np.random.default_rng(semilla).shuffle(lista)
+    return np.array(lista[:n]).reshape(-1, 4)
+
+
+@pytest.mark.parametrize("shape, radio", [((64, 64), 5), ((65, 33), 3.5), ((40, 50), 0)])
+def test_igual_al_metodo_original(shape, radio):
+    for semilla in (0, 7):
+        np.testing.assert_array_equal(
+            posiciones.posiciones(shape, radio, 500, semilla), _posiciones_original(shape, radio, 500, semilla)
+        )
+
+
+def test_pares_conjugados_sin_repetir():
+    indice = posiciones.indice((48, 48), 6)
+
+    usadas = set(map(tuple, indice[:, :2])) | set(map(tuple, indice[:, 2:]))
+    assert len(usadas) == 2 * len(indice)
+    assert not indice.flags.writeable
+    # Cacheado: misma instancia
+    assert posiciones.indice((48, 48), 6) is indice
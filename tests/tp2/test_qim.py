@@ -0,0 +1,44 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp2/test_qim.py
+
+import numpy as np
+import pytest
+
+from services.tp2 import inciso_3
+
+
+def _paridad_original(a, bit, delta):
+    """El ajuste coeficiente por coeficiente del método original."""
+    signo = 1 if a >= 0 else -1
+    q = int(np.round(abs(a) / delta))
+    if q % 2 != bit:
+        q += 1 if q % 2 == 0 else -1
+    return signo * q * delta
+
+
+def test_paridad_igual_a_la_regla_original():
+    rng = np.random.default_rng(0)
+    valores = rng.normal(0, 50, 2000)
+    bits = rng.integers(0, 2, 2000)
+
+    esperado = [_paridad_original(a, b, 7.5) for a, b in zip(valores, bits)]
+
+    np.testing.assert_allclose(inciso_3._paridad(valores, bits, 7.5), esperado)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("forma", [(64, 64), (48, 51)])
+def test_ida_y_vuelta(dtype, forma):
+    rng = np.random.default_rng(1)
+    portadora = rng.integers(40, 216, forma).astype(dtype)
+    oculta = rng.integers(0, 256, (8, 8), dtype=np.uint8)
+
+    estego = inciso_3.ocultar(portadora, oculta, 5, 3)
+
+    assert estego.dtype == np.float32 and estego.shape == forma
+    np.testing.assert_array_equal(inciso_3.extraer(estego.astype(dtype), 5, 3, oculta.shape), oculta)
+
+
+def test_oculta_que_no_entra():
+    with pytest.raises(ValueError):
+        inciso_3.extraer(np.zeros((16, 16)), 5, 3, (8, 8))
@@ -0,0 +1,109 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp2/test_router_estego.py
+
+import io
+import json
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from main import app
+from services.common import ejecutor
+from services.tp2 import inciso_2, inciso_3
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def sin_pool(monkeypatch):
+    monkeypatch.setattr(ejecutor, "JOBS_MAX_WORKERS", 0)
+
+
+def _png(pixeles):
+    buffer = io.BytesIO()
+    Image.fromarray(pixeles).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _pixeles(datos):
+    return np.array(Image.open(io.BytesIO(datos)))
+
+
+def test_lsb_ida_y_vuelta_sin_tocar_disco():
+    portadora = np.random.default_rng(0).integers(0, 256, (32, 32, 3), dtype=np.uint8)
+
+    r = client.post("/api/tp2/estego/lsb/ocultar", params={"k": 2, "rgb": True},
+                    files={"portadora": ("p.png", _png(portadora), "image/png")}, data={"mensaje": "Señal oculta"})
+    assert r.status_code == 200, r.text
+    assert json.loads(r.headers["x-estego-clave"]) == {"metodo": "lsb", "k": 2, "canales": [0, 1, 2]}
+
+    r = client.post("/api/tp2/estego/lsb/extraer", files={"estego": ("e.png", r.content, "image/png")})
+    assert r.status_code == 200, r.text
+    assert r.json()["mensaje"] == "Señal oculta"
+
+
+def test_fft_con_clave_explicita_si_se_pierden_los_metadatos():
+    rng = np.random.default_rng(1)
+    portadora = rng.integers(64, 192, (64, 64), dtype=np.uint8)
+    oculta = np.where(rng.random((8, 8)) > 0.5, 255, 0).astype(np.uint8)
+
+    r = client.post("/api/tp2/estego/fft/ocultar", params={"repeticiones": 3, "semilla": 5, "radio": 5},
+                    files={"portadora": ("p.png", _png(portadora)), "oculta": ("o.png", _png(oculta))})
+    assert r.status_code == 200, r.text
+    clave = r.headers["x-estego-clave"]
+    # Reguardado sin metadatos: la clave tiene que venir en el formulario
+    sin_metadatos = _png(_pixeles(r.content))
+
+    r = client.post("/api/tp2/estego/fft/extraer", files={"estego": ("e.png", sin_metadatos)})
+    assert r.status_code == 400
+
+    r = client.post("/api/tp2/estego/fft/extraer", files={"estego": ("e.png", sin_metadatos)}, data={"clave": clave})
+    assert r.status_code == 200, r.text
+    # Lo mismo que codificar y decodificar en memoria, sin estado entre las dos requests
+    esperada = inciso_2.decodificar(inciso_2.codificar(portadora, oculta, 3, 5, 5), (8, 8), 3, 5, 5)
+    np.testing.assert_array_equal(_pixeles(r.content), esperada)
+
+
+def test_qim_devuelve_tiff_float_sin_perder_precision():
+    rng = np.random.default_rng(2)
+    portadora = rng.integers(0, 256, (64, 64), dtype=np.uint8)
+    oculta = np.where(rng.random((8, 8)) > 0.5, 255, 0).astype(np.uint8)
+
+    r = client.post("/api/tp2/estego/qim/ocultar", params={"delta": 20, "repeticiones": 3},
+                    files={"portadora": ("p.png", _png(portadora)), "oculta": ("o.png", _png(oculta))})
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"] == "image/tiff"
+
+    # El TIFF float32 conserva el estego tal cual: se extrae lo mismo que desde el array en memoria
+    estego = inciso_3.ocultar(portadora.astype(np.float64), oculta, 20, 3)
+    np.testing.assert_array_equal(_pixeles(r.content), estego)
+
+    r = client.post("/api/tp2/estego/qim/extraer", files={"estego": ("e.tiff", r.content, "image/tiff")})
+    assert r.status_code == 200, r.text
+    np.testing.assert_array_equal(_pixeles(r.content), inciso_3.extraer(estego.astype(np.float64), 20, 3, (8, 8)))
+    np.testing.assert_array_equal(_pixeles(r.content), oculta)
+
+
+def test_errores_de_entrada():
+    assert client.post("/api/tp2/estego/lsb/ocultar", content=b"hola").status_code == 422
+    r = client.post("/api/tp2/estego/lsb/extraer", files={"estego": ("e.png", b"no es imagen")})
+    assert r.status_code == 400
+
+    # Claves con tipos o campos que no sirven: 400, no 500 ni basura
+    imagen = _png(np.zeros((16, 16), dtype=np.uint8))
+    for ruta, clave in (
+        ("lsb", "5"),
+        ("lsb", "[1]"),
+        ("lsb", '{"metodo": "lsb"}'),
+        ("lsb", '{"metodo": "lsb", "k": 1, "canales": [7]}'),
+        ("lsb", '{"metodo": "lsb", "k": true, "canales": null}'),
+        ("fft", '{"metodo": "fft", "forma_oculta": [8], "repeticiones": 3, "semilla": 0, "radio_exclusion": 5}'),
+        ("fft", '{"metodo": "fft", "forma_oculta": [8, 8], "repeticiones": 0, "semilla": 0, "radio_exclusion": 5}'),
+        ("qim", '{"metodo": "qim", "forma_oculta": [8, 8], "delta": 0, "repeticiones": 3}'),
+        ("qim", '{"metodo": "qim", "forma_oculta": [8, 8], "delta": "20", "repeticiones": 3}'),
+    ):
+        r = client.post(f"/api/tp2/estego/{ruta}/extraer", files={"estego": ("e.png", imagen)}, data={"clave": clave})
+        assert r.status_code == 400, (clave, r.text)
+
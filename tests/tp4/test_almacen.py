@@ -0,0 +1,57 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp4/test_almacen.py
+
+import glob
+import os
+import shutil
+import cv2
+import numpy as np
+import pandas as pd
+from services.tp4 import almacen, core
+
+
+def test_almacen_reutiliza_frames_y_recalcula_solo_los_modificados(tmp_path, monkeypatch):
+    imagenes = tmp_path / "imagenes"
+    imagenes.mkdir()
+    for path in sorted(glob.glob(os.path.join(core.RUTA_IMAGENES, core.PATRON)))[:30]:
+        shutil.copy(path, imagenes)
+    monkeypatch.setattr(core, "RUTA_IMAGENES", str(imagenes))
+    monkeypatch.setattr(almacen, "TP4_STORE_DIR", str(tmp_path / "almacen"))
+
+    original, logs, _, _ = core.procesar_imagenes()
+    assert not any("almacén" in linea for linea in logs)
+
+    # Segunda corrida: sale todo del disco (menos el frame de visualización)
+    df, logs, vis, _ = core.procesar_imagenes()
+    pd.testing.assert_frame_equal(df, original)
+    assert "20 frames leídos del almacén" in logs[-2]
+    assert vis["y_sustrato"] > 0
+
+    # Cambia una imagen: se recalcula solo ese frame
+    frame_15 = str(imagenes / "TP4_Gota_0015.jpg")
+    img = cv2.imread(frame_15)
+    cv2.imwrite(frame_15, cv2.flip(img, 1))
+    df, logs, _, _ = core.procesar_imagenes()
+    assert "19 frames leídos del almacén en disco, 2 recalculados" in logs[-2]
+    assert df.loc[df["frame_idx"] == 15, "cx_m"].item() != original.loc[original["frame_idx"] == 15, "cx_m"].item()
+
+
+def test_cargar_devuelve_indices_sobre_las_columnas_mmap(tmp_path, monkeypatch):
+    monkeypatch.setattr(almacen, "TP4_STORE_DIR", str(tmp_path))
+    filas = {
+        1: ("a", {"frame_idx": 1, "cx_m": 0.5}),
+        2: ("b", None),
+        3: ("c", {"frame_idx": 3, "cx_m": 1.5}),
+    }
+    almacen.AlmacenFrames({"p": 1}).guardar(filas)
+
+    leido = almacen.AlmacenFrames({"p": 1})
+    guardadas = leido.cargar()
+    assert guardadas == {1: ("a", 0), 2: ("b", None), 3: ("c", 1)}
+    assert all(isinstance(col, np.memmap) for col in leido.columnas.values())
+
+    # Filas guardadas (índices) y recién calculadas (dicts) en el orden pedido
+    mezcla = {**guardadas, 4: ("d", {"frame_idx": 4, "cx_m": 2.5})}
+    columnas = leido.armar_columnas(mezcla, [4, 1, 2, 3], ["frame_idx", "cx_m"])
+    np.testing.assert_array_equal(columnas["frame_idx"], [4, 1, 3])
+    np.testing.assert_array_equal(columnas["cx_m"], [2.5, 0.5, 1.5])
@@ -0,0 +1,21 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp4/test_core.py
+
+import glob
+import os
+from services.tp4 import core
+
+
+def test_procesar_frames_en_paralelo_conserva_orden_y_resultados(monkeypatch):
+    paths = sorted(glob.glob(os.path.join(core.RUTA_IMAGENES, core.PATRON)))[:40]
+    frames = [(i + 1, path) for i, path in enumerate(paths) if i + 1 >= core.FRAME_INICIAL]
+
+    monkeypatch.setattr(core, "TP4_WORKERS", 1)
+    secuencial = core.procesar_frames(frames)
+
+    monkeypatch.setattr(core, "TP4_WORKERS", 4)
+    monkeypatch.setattr(core, "TP4_LOTE", 3)
+    paralelo = core.procesar_frames(frames)
+
+    assert [fila["frame_idx"] for fila, _ in paralelo] == [k for k, _ in frames]
+    assert [fila for fila, _ in paralelo] == [fila for fila, _ in secuencial]
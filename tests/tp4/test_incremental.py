@@ -0,0 +1,91 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp4/test_incremental.py
+
+import asyncio
+import glob
+import os
+import shutil
+import pandas as pd
+from services.common import ejecutor, render_cache
+from services.tp4 import almacen, core
+from services.tp4 import service_inciso_1
+from services.tp4.core import processor
+from services.tp5.core import tp5_processor
+
+
+def test_actualizar_agrega_solo_frames_nuevos_e_invalida_tp5(tmp_path, monkeypatch):
+    originales = sorted(glob.glob(os.path.join(core.RUTA_IMAGENES, core.PATRON)))[:35]
+    imagenes = tmp_path / "imagenes"
+    imagenes.mkdir()
+    for path in originales[:30]:
+        shutil.copy(path, imagenes)
+
+    # Trabajos en hilos: los procesos "spawn" no verían los monkeypatch
+    monkeypatch.setattr(ejecutor, "JOBS_MAX_WORKERS", 0)
+    monkeypatch.setattr(core, "RUTA_IMAGENES", str(imagenes))
+    monkeypatch.setattr(almacen, "TP4_STORE_DIR", str(tmp_path / "almacen"))
+    for atributo in ("data", "logs", "visualization_data", "paths"):
+        monkeypatch.setattr(processor, atributo, getattr(processor, atributo))
+    processor.data = None
+    for atributo in ("data_integration", "data_ode", "console_output_1", "console_output_2"):
+        monkeypatch.setattr(tp5_processor, atributo, getattr(tp5_processor, atributo))
+    tp5_processor.data_integration = {"calculado": True}
+
+    llamadas = []
+    procesar_frames = core.procesar_frames
+    monkeypatch.setattr(core, "procesar_frames", lambda frames: llamadas.extend(k for k, _ in frames) or procesar_frames(frames))
+
+    async def escenario():
+        await processor.get_data_async()
+        assert len(processor.data) == 21
+        assert await processor.actualizar_async() == 0
+
+        for path in originales[30:]:
+            shutil.copy(path, imagenes)
+        llamadas.clear()
+        return await processor.actualizar_async()
+
+    assert asyncio.run(escenario()) == 5
+    assert llamadas == [31, 32, 33, 34, 35]
+    assert tp5_processor.data_integration is None
+
+    completo, _, _, _ = core.procesar_imagenes()
+    pd.testing.assert_frame_equal(processor.data, completo)
+
+
+def test_grafico_pedido_antes_de_actualizar_no_queda_cacheado_como_nuevo(tmp_path, monkeypatch):
+    originales = sorted(glob.glob(os.path.join(core.RUTA_IMAGENES, core.PATRON)))[:35]
+    imagenes = tmp_path / "imagenes"
+    imagenes.mkdir()
+    for path in originales[:30]:
+        shutil.copy(path, imagenes)
+
+    monkeypatch.setattr(ejecutor, "JOBS_MAX_WORKERS", 0)
+    monkeypatch.setattr(core, "RUTA_IMAGENES", str(imagenes))
+    monkeypatch.setattr(core, "ENTRADAS", (os.path.join(str(imagenes), core.PATRON),))
+    monkeypatch.setattr(almacen, "TP4_STORE_DIR", str(tmp_path / "almacen"))
+    monkeypatch.setattr(render_cache, "RENDER_CACHE_DIR", str(tmp_path / "render"))
+    monkeypatch.setattr(render_cache, "RENDER_CACHE_ACTIVA", True)
+    render_cache.invalidar()
+    for atributo in ("data", "logs", "visualization_data", "paths", "firma"):
+        monkeypatch.setattr(processor, atributo, getattr(processor, atributo))
+    processor.data = None
+    monkeypatch.setattr(processor, "_suscriptores", [])
+    grafico = service_inciso_1.generar_grafico_trayectoria_vertical
+
+    async def escenario():
+        await processor.get_data_async()
+        antes = grafico().getvalue()
+
+        # Imágenes nuevas en disco, pero el polling todavía no las incorporó:
+        # el gráfico es el de los datos cargados y no se guarda con la firma nueva
+        for path in originales[30:]:
+            shutil.copy(path, imagenes)
+        assert grafico().getvalue() == antes
+
+        assert await processor.actualizar_async() == 5
+        return antes, grafico().getvalue()
+
+    antes, despues = asyncio.run(escenario())
+    assert despues != antes
+    render_cache.invalidar()
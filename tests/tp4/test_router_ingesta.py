@@ -0,0 +1,56 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp4/test_router_ingesta.py
+
+import glob
+import io
+import json
+import os
+import cv2
+from PIL import Image
+from fastapi.testclient import TestClient
+from main import app
+from services.tp4 import core
+
+client = TestClient(app)
+
+
+def _frames(n=6, desde=40):
+    paths = sorted(glob.glob(os.path.join(core.RUTA_IMAGENES, core.PATRON)))[desde:desde + n]
+    return [cv2.imread(p, cv2.IMREAD_GRAYSCALE) for p in paths]
+
+
+def test_tiff_multipagina_devuelve_un_ndjson_por_frame():
+    paginas = [Image.fromarray(f) for f in _frames()]
+    buf = io.BytesIO()
+    paginas[0].save(buf, format="TIFF", save_all=True, append_images=paginas[1:])
+
+    response = client.post("/api/tp4/ingesta/secuencia?fps=1000", files={"archivo": ("gota.tiff", buf.getvalue())})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lineas = [json.loads(linea) for linea in response.text.splitlines()]
+    filas, resumen = lineas[:-1], lineas[-1]
+    assert [f["frame_idx"] for f in filas] == list(range(1, 7))
+    assert all(f["vol"] > 0 for f in filas)
+    assert filas[1]["t_ms"] == 2.0   # k * (1 / fps) en ms
+    assert resumen == {"fin": True, "frames": 6, "con_gota": 6, "fps": 1000.0}
+
+
+def test_video_y_archivo_invalido(tmp_path):
+    ruta = str(tmp_path / "gota.avi")
+    frames = _frames(4)
+    alto, ancho = frames[0].shape
+    writer = cv2.VideoWriter(ruta, cv2.VideoWriter_fourcc(*"MJPG"), 20, (ancho, alto), isColor=False)
+    for f in frames:
+        writer.write(f)
+    writer.release()
+
+    with open(ruta, "rb") as f:
+        response = client.post("/api/tp4/ingesta/secuencia", files={"archivo": ("gota.avi", f)})
+    assert response.status_code == 200
+    assert json.loads(response.text.splitlines()[-1])["frames"] == 4
+
+    response = client.post("/api/tp4/ingesta/secuencia", files={"archivo": ("gota.avi", b"esto no es un video")})
+    assert response.status_code == 400
+    assert client.post("/api/tp4/ingesta/secuencia", files={"archivo": ("vacio.avi", b"")}).status_code == 400
+    assert client.post("/api/tp4/ingesta/secuencia", content=b"sin multipart").status_code == 422
@@ -0,0 +1,23 @@
+# para ejecutar las pruebas, donde está el archivo main.py, hacemos:
+# pytest tests/tp4/test_utils.py
+
+import numpy as np
+from services.tp4.utils import radios_por_fila, volumen_revolucion
+
+
+def test_radios_y_volumen_coinciden_con_el_recorrido_por_filas():
+    rng = np.random.default_rng(0)
+    binv = (rng.random((60, 80)) > 0.7).astype(np.uint8) * 255
+    binv[5] = 0            # fila vacía
+    binv[6] = 0
+    binv[6, 40] = 255      # un solo píxel: no cuenta
+
+    esperado_r, esperado_vol = [], 0.0
+    for fila in binv:
+        x = np.where(fila > 0)[0]
+        r = (x[-1] - x[0] + 1) / 2.0 if x.size > 1 else 0.0
+        esperado_r.append(r)
+        esperado_vol += np.pi * (r * 1e-6) ** 2 * 1e-6
+
+    np.testing.assert_array_equal(radios_por_fila(binv), esperado_r)
+    assert np.isclose(volumen_revolucion(binv, 1e-6), esperado_vol, rtol=1e-12)